@@ -1,8 +1,10 @@
+import asyncio
+from typing import Dict, Union
 from fastapi import APIRouter, UploadFile, File, Form, Depends, HTTPException, BackgroundTasks
 from sqlalchemy.orm import Session
 from app.core.logger import setup_logger
-from app.core.db import get_db
-from app.services.meeting.schemas import AudioChunkUploadResponse, StartMeetingRequest, StartMeetingResponse, JoinMeetingRequest, JoinMeetingResponse, EndMeetingResponse
+from app.core.db import get_db, SessionLocal
+from app.services.meeting.schemas import AudioChunkUploadResponse, StartMeetingRequest, StartMeetingResponse, JoinMeetingRequest, JoinMeetingResponse, EndMeetingResponse, EndMeetingAcceptedResponse, EndMeetingStatusResponse
 from app.services.meeting.audio_processor import AudioProcessor
 from app.services.meeting.meeting_service import MeetingService
 from app.services.meeting.audio_service import AudioService
@@ -19,6 +21,10 @@ audio_processor = AudioProcessor()
 timeline_service = TimelineService()
 pipeline_service = RAGPipelineService()
 
+# 이 worker에서 실행 중인 wait=false 종료 처리 (meeting_id → task, 끝나면 제거)
+# 처리 상태는 worker 간 공유되는 audio_service.meeting_states에 기록
+finalize_tasks: Dict[str, asyncio.Task] = {}
+
 # 회의 시작
 @router.post("/start", response_model = StartMeetingResponse)
 async def start_meeting(
@@ -89,13 +95,21 @@ async def upload_audio_chunk(
 
 
 # 회의 종료
-@router.post("/{meeting_id}/end", response_model=EndMeetingResponse)
+@router.post(
+    "/{meeting_id}/end",
+    response_model=Union[EndMeetingResponse, EndMeetingAcceptedResponse]
+)
 async def end_meeting(
     meeting_id: str,
     background_tasks: BackgroundTasks,
+    wait: bool = True,
     db: Session = Depends(get_db)
 ):
     try:
+        # wait=false : 검증만 하고 즉시 반환 (처리 대기 → 종료 → RAG는 백그라운드)
+        if not wait:
+            return _start_finalize(meeting_id, db)
+
         # 1. 처리 완료 대기
         await audio_service.wait_for_processing(meeting_id)
 
@@ -123,4 +137,62 @@ async def end_meeting(
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         logger.error(f"End meeting failed: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# 회의 종료 백그라운드 처리 상태
+@router.get("/{meeting_id}/end/status", response_model=EndMeetingStatusResponse)
+async def end_meeting_status(meeting_id: str):
+    finalize_status = audio_service.meeting_states.get_finalize_status(meeting_id)
+    if finalize_status is None:
+        raise HTTPException(status_code=404, detail=f"No pipeline handle: {meeting_id}")
+
+    return EndMeetingStatusResponse(
+        meeting_id = meeting_id,
+        pipeline_id = meeting_id,
+        status = finalize_status["status"],
+        error = finalize_status["error"]
+    )
+
+
+def _start_finalize(meeting_id: str, db: Session) -> EndMeetingAcceptedResponse:
+    """종료 처리 task 시작 (이 worker나 다른 worker에서 이미 진행 중이면 같은 handle 반환)"""
+    if meeting_id not in finalize_tasks:
+        meeting_service.ensure_in_progress(meeting_id, db)
+
+        if audio_service.meeting_states.claim_finalize(meeting_id):
+            task = asyncio.create_task(_finalize_meeting(meeting_id))
+            finalize_tasks[meeting_id] = task
+            task.add_done_callback(lambda _: finalize_tasks.pop(meeting_id, None))
+
+    return EndMeetingAcceptedResponse(
+        meeting_id = meeting_id,
+        pipeline_id = meeting_id,
+        status_url = f"/meeting/{meeting_id}/end/status"
+    )
+
+
+async def _finalize_meeting(meeting_id: str):
+    """처리 대기 → 회의 종료 → RAG 파이프라인 (결과는 meeting_states에 기록)"""
+    meeting_states = audio_service.meeting_states
+
+    try:
+        await audio_service.wait_for_processing(meeting_id)
+
+        db = SessionLocal()
+        try:
+            await meeting_service.end_meeting(meeting_id = meeting_id, db = db)
+        finally:
+            db.close()
+
+        await pipeline_service.run_rag_pipeline(meeting_id = meeting_id)
+
+    except asyncio.CancelledError:
+        meeting_states.set_finalize_status(meeting_id, "failed", "cancelled")
+        raise
+    except Exception as e:
+        logger.error(f"End meeting pipeline failed: {e}")
+        meeting_states.set_finalize_status(meeting_id, "failed", str(e))
+        return
+
+    meeting_states.set_finalize_status(meeting_id, "completed")
@@ -42,15 +42,90 @@ class Settings(BaseSettings):
     VECTORSTORE_DIR: Path = DATA_DIR / "vectorstore"
     
     # Whisper 설정
-    WHISPER_MODEL: str = "large-v3"
+    WHISPER_MODEL: str = "large-v3"             # GPU 프로필 모델
+    WHISPER_CPU_MODEL: str = "small"            # CPU 프로필 모델
+    WHISPER_DEVICE: str = "auto"                # auto / cuda / cpu
+    WHISPER_COMPUTE_TYPE: str | None = None     # None이면 프로필 기본값 (cuda: float16, cpu: int8)
+    WHISPER_CPU_THREADS: int = 0                # 0이면 코어 수 / num_workers
+    WHISPER_NUM_WORKERS: int = 2                # 동시 transcribe 수
+
+    # STT batch 추론 (여러 사용자/회의 chunk를 모아서 한 번에)
+    STT_BATCHING: bool = False                  # segment가 VAD 구간 단위(최대 30초)라 기본 off
+    STT_BATCH_SIZE: int = 8                     # encoder/decoder batch 크기 (발화 구간 수)
+    STT_BATCH_WINDOW_MS: int = 300              # chunk 수집 대기 시간
+    STT_BATCH_MAX_CHUNKS: int = 16              # 한 번에 모을 최대 chunk 수
     EMBEDDING_MODEL: str = "text-embedding-3-large"
+
+    # 임베딩 backend (openai: EMBEDDING_MODEL / local: sentence-transformers, CPU, 네트워크 불필요)
+    EMBEDDING_BACKEND: str = "openai"
+    LOCAL_EMBEDDING_MODEL: str = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+    LOCAL_EMBEDDING_DEVICE: str = "cpu"
+    LOCAL_EMBEDDING_BATCH_SIZE: int = 32
+    VECTORSTORE_COLLECTION_CACHE_SIZE: int = 64  # 열어 둘 Chroma collection 수 (LRU)
+
+    # 회의 segment hybrid 검색 (BM25 글자 n-gram + 벡터, reciprocal rank fusion)
+    HYBRID_SEARCH_ENABLED: bool = True
+    HYBRID_CANDIDATES: int = 20                 # BM25 / 벡터 검색 각각의 후보 수
+    HYBRID_RRF_K: int = 60
+    KEYWORD_NGRAM: int = 2                      # 한국어 글자 n-gram 길이
+    MEETING_CHATBOT_SEARCH_K: int = 3           # 챗봇 답변 프롬프트에 넣을 segment 수
+
+    # 임베딩 캐시 (모델 + 텍스트 기준, SQLite, 전체 크기 기준 LRU)
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_MAX_MB: int = 256
     LLM_MODEL: str = "gpt-4o-mini"
 
+    # 진행 중 회의 상태 저장소 (memory: 단일 프로세스 / sqlite: uvicorn worker 여러 개)
+    MEETING_STATE_BACKEND: str = "memory"
+    MEETING_FINALIZE_STALE_SECONDS: int = 3600   # 이 시간 동안 갱신 없는 종료 처리는 다시 시작 허용
+
+    # LLM 텍스트 보정 (batch 동시 요청)
+    LLM_CORRECTION_CONCURRENCY: int = 4
+    LLM_CORRECTION_BATCH_TOKENS: int = 800      # batch당 입력 토큰 예산
+    LLM_CORRECTION_BATCH_SIZE: int = 20         # batch당 최대 segment 수
+    LLM_CORRECTION_MAX_RETRIES: int = 2
+    LLM_CORRECTION_RETRY_BACKOFF_SECONDS: float = 1.0
+
+    # LLM 보정 결과 캐시 (SQLite, LRU)
+    CORRECTION_CACHE_ENABLED: bool = True
+    CORRECTION_CACHE_MAX_ENTRIES: int = 50000
+
+    # 회의 요약 (긴 회의는 시간 window별 요약 → 합치기)
+    SUMMARY_SINGLE_PASS_MAX_CHARS: int = 12000  # 이하면 한 번에 요약
+    SUMMARY_WINDOW_MINUTES: int = 10
+    SUMMARY_WINDOW_MAX_CHARS: int = 12000       # window가 이보다 길면 나눠서 요약
+    SUMMARY_MAP_CONCURRENCY: int = 4            # window 요약 동시 요청 수
+    SUMMARY_REDUCE_FANIN: int = 8               # 한 번에 합칠 요약 수
+    SUMMARY_PREFETCH_WINDOWS: bool = True       # 회의 중 확정된 window 미리 요약
+
+    # 회의 중 타임라인 점진 병합 (종료 시 tail만 처리)
+    INCREMENTAL_TIMELINE: bool = True
+    INCREMENTAL_TIMELINE_MIN_SEGMENTS: int = 10  # 이만큼 확정 가능할 때 병합 (LLM 보정 batch 크기)
+
+    # 회의 중 segment 실시간 색인 (micro-batch 임베딩)
+    LIVE_SEGMENT_INDEXING: bool = True
+    LIVE_INDEX_BATCH_SIZE: int = 64
+    LIVE_INDEX_WINDOW_MS: int = 2000
+
+    # STTSegment write-behind 기록 (chunk 결과를 모아서 한 트랜잭션으로)
+    SEGMENT_WRITER_FLUSH_MS: int = 200
+    SEGMENT_WRITER_MAX_ROWS: int = 500
+
+    # chunk 저장 포맷 (wav: 무압축 / flac: 무손실 / opus: 음성 최적화 손실 압축)
+    CHUNK_STORAGE_FORMAT: str = "flac"
+
     # 잡음 제거 설정
     ENABLE_DENOISING: bool = True
 
-    # 프로세스 풀
+    # 발화 감지 pre-gate (무음 chunk는 STT 생략)
+    SPEECH_GATE_ENABLED: bool = True
+    SPEECH_GATE_BACKEND: str = "energy"         # energy / silero
+    SPEECH_GATE_MIN_RATIO: float = 0.02         # 발화 비율이 이 미만이면 skip (60초 중 약 1.2초)
+
+    # 프로세스 풀 (STT worker 프로세스, 프로세스마다 Whisper 모델 1개)
+    STT_PROCESS_POOL: bool = False
     MAX_WORKERS: int = 2
+    STT_PROCESS_TIMEOUT_SECONDS: int = 300
 
     # Timezone
     TIMEZONE: pytz.BaseTzInfo = pytz.timezone("UTC")
@@ -11,7 +11,8 @@ from sqlalchemy import (
     Boolean,
     ForeignKey,
     Float,
-    Enum
+    Enum,
+    LargeBinary
 )
 from sqlalchemy.orm import declarative_base, relationship, sessionmaker
 
@@ -203,6 +204,140 @@ class STTSegment(Base):
     def __repr__(self):
         return f"<STTSegment {self.segment_id}: '{self.text[:50]}' overlap={self.is_overlapped}>"
 
+# ------------------------
+# STT Job Queue DB
+# ------------------------
+class STTJob(Base):
+    """
+    STT 작업 큐 (재시작/크래시 후에도 유지)
+
+    status: pending → leased → done
+                        ↘ (실패) pending (재시도) / failed (최대 재시도 초과)
+    """
+    __tablename__ = "stt_job"
+
+    # PK : chunk_id ({meeting_id}_{user_id}_{chunk_index})
+    job_id = Column(String(255), primary_key=True)
+
+    meeting_id = Column(String(255), ForeignKey("meeting.meeting_id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("user.user_id"), nullable=False)
+    chunk_index = Column(Integer, nullable=False)
+
+    # 처리 입력
+    chunk_path = Column(Text, nullable=False)
+    speaker_name = Column(String(255), nullable=True)
+    chunk_relative_start_ms = Column(Integer, nullable=False)
+    content_hash = Column(String(64), nullable=True)  # 업로드 원본 sha256 (재업로드 중복 판별)
+
+    # 큐 상태
+    status = Column(String(20), nullable=False, default="pending", index=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    available_at = Column(DateTime, nullable=False, default=datetime.utcnow)  # 재시도 backoff
+    lease_owner = Column(String(255), nullable=True)
+    lease_until = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<STTJob {self.job_id}: {self.status} attempts={self.attempts}>"
+
+# ------------------------
+# Text Correction Cache DB
+# (LLM 텍스트 보정 결과, 규칙 정리 후 텍스트 기준 LRU)
+# ------------------------
+class TextCorrectionCache(Base):
+    __tablename__ = "text_correction_cache"
+
+    text_hash = Column(String(64), primary_key=True)       # sha256(정리된 텍스트)
+    source_text = Column(Text, nullable=False)
+    corrected_text = Column(Text, nullable=False)
+    hits = Column(Integer, nullable=False, default=0)
+    last_used_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+# ------------------------
+# Embedding Cache DB
+# (모델 + 텍스트 기준 임베딩 벡터, 전체 크기 기준 LRU)
+# ------------------------
+class EmbeddingCacheEntry(Base):
+    __tablename__ = "embedding_cache"
+
+    cache_key = Column(String(64), primary_key=True)       # sha256(모델 + 종류 + 텍스트)
+    model = Column(String(255), nullable=False)
+    dim = Column(Integer, nullable=False)
+    vector = Column(LargeBinary, nullable=False)           # float32 bytes
+    size_bytes = Column(Integer, nullable=False)
+    hits = Column(Integer, nullable=False, default=0)
+    last_used_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+# ------------------------
+# Segment Keyword Index DB
+# (회의 segment BM25 검색용 글자 n-gram inverted index, hybrid 검색)
+# ------------------------
+class SegmentKeywordDoc(Base):
+    __tablename__ = "segment_keyword_doc"
+
+    segment_id = Column(String(255), primary_key=True)
+    meeting_id = Column(String(255), nullable=False, index=True)
+    chat_room_id = Column(String(255), nullable=True, index=True)
+    length = Column(Integer, nullable=False)                # n-gram 수 (BM25 문서 길이)
+
+
+class SegmentKeywordPosting(Base):
+    __tablename__ = "segment_keyword_posting"
+
+    term = Column(String(64), primary_key=True)
+    segment_id = Column(String(255), primary_key=True, index=True)
+    meeting_id = Column(String(255), nullable=False)
+    chat_room_id = Column(String(255), nullable=True)
+    tf = Column(Integer, nullable=False)
+
+# ------------------------
+# Meeting Runtime State DB
+# (uvicorn worker 간 공유하는 진행 중 회의 상태 / 종료 처리 상태, MEETING_STATE_BACKEND=sqlite)
+# ------------------------
+class MeetingRuntimeState(Base):
+    __tablename__ = "meeting_runtime_state"
+
+    meeting_id = Column(String(255), primary_key=True)
+    last_chunk_time = Column(DateTime, nullable=False, default=datetime.now)
+
+
+class MeetingRuntimeUser(Base):
+    __tablename__ = "meeting_runtime_user"
+
+    meeting_id = Column(String(255), primary_key=True)
+    user_id = Column(Integer, primary_key=True)
+    last_chunk_index = Column(Integer, nullable=False, default=0)
+    last_chunk_received = Column(Boolean, nullable=False, default=False)
+
+
+class MeetingProcessingChunk(Base):
+    __tablename__ = "meeting_processing_chunk"
+
+    meeting_id = Column(String(255), primary_key=True)
+    chunk_id = Column(String(255), primary_key=True)
+
+
+class MeetingTimelineLock(Base):
+    __tablename__ = "meeting_timeline_lock"
+
+    meeting_id = Column(String(255), primary_key=True)
+    owner = Column(String(64), nullable=False)
+    lease_until = Column(DateTime, nullable=False)             # 만료 후 다른 worker가 가져갈 수 있음
+
+
+class MeetingFinalizeStatus(Base):
+    __tablename__ = "meeting_finalize_status"
+
+    meeting_id = Column(String(255), primary_key=True)
+    status = Column(String(20), nullable=False)             # finalizing / completed / failed
+    error = Column(Text, nullable=True)
+    updated_at = Column(DateTime, nullable=False, default=datetime.now)
+
 # ------------------------
 # Team Chat Room DB
 # ------------------------
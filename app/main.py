@@ -1,10 +1,12 @@
 # uvicorn app.main:app --reload --host 0.0.0.0 --port 8020
 from __future__ import annotations
+import asyncio
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
 from app.api.connection import router as connection_router
 from app.api.attendance import router as attendance_router
 from app.api.meeting import router as meeting_router
+from app.api.meeting import audio_service
 from app.api.team_chat import router as team_chat_router
 from app.core.schemas import init_db
 from app.core.db import engine
@@ -13,6 +15,7 @@ from app.config import settings
 from app.services.meeting.audio_processor import AudioProcessor
 from app.services.meeting.audio_denoiser import AudioDenoiser
 from app.services.meeting.embedding_service import EmbeddingService
+from app.services.meeting.live_indexer import LiveSegmentIndexer
 from app.api.curriculum import router as curriculum_router
 from app.api.user import router as user_router
 from app.api.learning_chatbot import router as learning_chatbot_router
@@ -40,9 +43,10 @@ def create_app() -> FastAPI:
 
         # whisper 모델 : 앱 시작시 1회 로드
         print("Initializing Whisper model...")
+        # device/모델 크기/compute type은 settings 기반 프로필에서 결정
+        # (STT_PROCESS_POOL이면 MAX_WORKERS개의 worker 프로세스가 모델 로드)
         AudioProcessor.initialize_whisper(
-            # max_workers = settings.MAX_WORKERS,
-            model_size = settings.WHISPER_MODEL
+            max_workers = settings.MAX_WORKERS,
         )
         print("Whisper model ready!")
 
@@ -53,10 +57,17 @@ def create_app() -> FastAPI:
 
         # Embedding 모델 초기화
         EmbeddingService.get_instance()
+
+        # STT 작업 큐 복구 + worker 시작
+        audio_service.recover_pending_chunks()
+        stt_worker = asyncio.create_task(audio_service.run_stt_worker())
         print("All services initialized")
         
         yield
 
+        stt_worker.cancel()
+        await audio_service.segment_writer.close()
+        await LiveSegmentIndexer.get_instance().close()
         AudioProcessor.shutdown()
         AudioDenoiser.shutdown()
         print("Application Shutdown Complete")
@@ -5,10 +5,11 @@ from typing import Callable, List, Optional
 
 from langgraph.graph import StateGraph, END
 
-from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from langchain_openai import ChatOpenAI
 import numpy as np
 
 from app.services.feedbackBoard.schemas import FeedbackBoardPost
+from app.services.meeting.embedding_service import EmbeddingService
 from app.services.feedbackBoard.io_contract import FeedbackBoardState, FinalizePayload, PipelineInput, RunConfig
 
 from app.services.feedbackBoard.nodes.normalize_filter_node import normalize_filter_node
@@ -23,7 +24,11 @@ from app.services.feedbackBoard.nodes.finalize_node import finalize_node
 
 
 EmbedFn = Callable[[List[str]], List[List[float]]]
-OpenAIEmbedFn = OpenAIEmbeddings.embed_documents
+
+def embed_texts(texts: List[str]) -> List[List[float]]:
+    """설정된 임베딩 backend (EMBEDDING_BACKEND, 임베딩 캐시 경유)"""
+    return EmbeddingService.get_instance().embed_documents(texts)
+
 
 def dummy_embed(texts):
     """
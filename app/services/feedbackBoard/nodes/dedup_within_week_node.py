@@ -26,7 +26,7 @@ def dummy_embed(texts):
 
 def dedup_within_week_node(
     state: FeedbackBoardState,
-    embed_fn,  # embedding 함수 주입 (ex. OpenAIEmbeddings().embed_documents)
+    embed_fn,  # embedding 함수 주입 (ex. graph.embed_texts)
 ) -> FeedbackBoardState:
     posts = state.posts
     # 1) (author_id, week) 기준 그룹핑
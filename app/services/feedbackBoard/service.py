@@ -1,5 +1,4 @@
 from datetime import datetime
-from langchain_openai import OpenAIEmbeddings
 from requests import Session
 
 from app.services.db_service.camp import get_week_range_by_index
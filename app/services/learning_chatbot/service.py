@@ -1,11 +1,12 @@
 import os
 import logging
 from dotenv import load_dotenv
-from langchain_openai import OpenAIEmbeddings, ChatOpenAI
+from langchain_openai import ChatOpenAI
 from langchain_chroma import Chroma
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 from operator import itemgetter
+from app.services.meeting.embedding_service import EmbeddingService
 
 # ==============================================================
 # 로깅 설정
@@ -27,7 +28,6 @@ DB_PATH = r"C:\POTENUP\MumulMumul\storage\vectorstore\curriculum_all_new"
 COLLECTION = "curriculum_all_new"
 
 LLM_MODEL = "gpt-4o-mini"
-EMBEDDING_MODEL = "text-embedding-3-large"
 
 SEARCH_K = 3
 FETCH_K = 8
@@ -70,7 +70,7 @@ def initialize_rag_chain():
 
     try:
         logger.info("1) 임베딩 모델 로딩 중...")
-        embeddings = OpenAIEmbeddings(model=EMBEDDING_MODEL)
+        embeddings = EmbeddingService.for_collection(DB_PATH, COLLECTION)
 
         logger.info("2) Chroma 벡터스토어 연결 시도...")
         vectorstore = Chroma(
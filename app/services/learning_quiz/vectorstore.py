@@ -2,8 +2,8 @@
 
 import os
 from langchain_chroma import Chroma
-from langchain_openai import OpenAIEmbeddings
 from app.core.logger import setup_logger
+from app.services.meeting.embedding_service import EmbeddingService
 
 logger = setup_logger(__name__)
 
@@ -12,7 +12,7 @@ COLLECTION = "curriculum_all_new"
 
 
 def load_vectorstore():
-    embeddings = OpenAIEmbeddings(model="text-embedding-3-large")
+    embeddings = EmbeddingService.for_collection(DB_PATH, COLLECTION)
 
     vectorstore = Chroma(
         collection_name=COLLECTION,
@@ -0,0 +1,107 @@
+import io
+from dataclasses import dataclass, replace
+from math import gcd
+import numpy as np
+import soundfile as sf
+from scipy.signal import resample_poly
+
+
+# faster-whisper에 ndarray로 넘길 때 요구되는 샘플레이트 (16kHz mono float32)
+WHISPER_SAMPLE_RATE = 16000
+
+
+@dataclass(frozen=True)
+class AudioChunk:
+    """
+    한 번만 디코딩된 음성 청크 (메모리 상주)
+
+    업로드 → 검증 → 잡음 제거 → 길이 측정 → STT 까지
+    같은 객체를 넘겨서 WAV 재디코딩/디스크 재읽기를 없앤다.
+    """
+    samples: np.ndarray     # mono float32
+    sample_rate: int
+    channels: int           # 원본 채널 수 (samples는 항상 mono)
+
+    @property
+    def num_samples(self) -> int:
+        return len(self.samples)
+
+    @property
+    def duration_ms(self) -> int:
+        if self.sample_rate <= 0:
+            return 0
+        return int((self.num_samples / self.sample_rate) * 1000)
+
+    @classmethod
+    def from_bytes(cls, file_data: bytes) -> "AudioChunk":
+        """
+        업로드 바이트 → AudioChunk
+
+        헤더(sf.info)로 먼저 검증한 뒤 본문은 한 번만 디코딩한다.
+        검증 실패 시 ValueError
+        """
+        buffer = io.BytesIO(file_data)
+
+        try:
+            info = sf.info(buffer)
+        except Exception as e:
+            raise ValueError(f"Invalid audio format: {e}")
+
+        if info.samplerate <= 0 or info.frames <= 0 or info.channels <= 0:
+            raise ValueError(
+                f"Invalid audio header: sr={info.samplerate}, "
+                f"frames={info.frames}, channels={info.channels}"
+            )
+
+        buffer.seek(0)
+        data, sample_rate = sf.read(buffer, dtype="float32", always_2d=True)
+
+        return cls(
+            samples=cls._to_mono(data),
+            sample_rate=int(sample_rate),
+            channels=int(info.channels)
+        )
+
+    @classmethod
+    def from_file(cls, audio_path) -> "AudioChunk":
+        """디스크의 오디오 파일 → AudioChunk"""
+        data, sample_rate = sf.read(str(audio_path), dtype="float32", always_2d=True)
+        return cls(
+            samples=cls._to_mono(data),
+            sample_rate=int(sample_rate),
+            channels=int(data.shape[1])
+        )
+
+    @staticmethod
+    def _to_mono(data: np.ndarray) -> np.ndarray:
+        """(frames, channels) → (frames,) float32"""
+        if data.ndim == 2:
+            data = data.mean(axis=1) if data.shape[1] > 1 else data[:, 0]
+        return np.ascontiguousarray(data, dtype=np.float32)
+
+    def with_samples(self, samples: np.ndarray) -> "AudioChunk":
+        """같은 메타데이터로 샘플만 교체한 새 청크 (잡음 제거 결과 등)"""
+        return replace(self, samples=np.ascontiguousarray(samples, dtype=np.float32))
+
+    def to_whisper_input(self) -> np.ndarray:
+        """faster-whisper 입력용 16kHz mono float32 배열"""
+        return resample_to(self.samples, self.sample_rate, WHISPER_SAMPLE_RATE)
+
+    def to_dict(self) -> dict:
+        """기존 validate_audio_file 결과와 같은 형태의 메타데이터"""
+        return {
+            "is_valid": True,
+            "duration_ms": self.duration_ms,
+            "sample_rate": self.sample_rate,
+            "channels": self.channels
+        }
+
+
+def resample_to(samples: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarray:
+    """정수비 polyphase 리샘플링 (같은 레이트면 그대로 반환)"""
+    if orig_sr == target_sr or len(samples) == 0:
+        return np.ascontiguousarray(samples, dtype=np.float32)
+
+    g = gcd(orig_sr, target_sr)
+    resampled = resample_poly(samples, target_sr // g, orig_sr // g)
+    return resampled.astype(np.float32, copy=False)
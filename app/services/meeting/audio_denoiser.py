@@ -4,6 +4,7 @@ import numpy as np
 from pathlib import Path
 from typing import Optional
 from app.core.logger import setup_logger
+from app.services.meeting.audio_chunk import AudioChunk
 
 logger = setup_logger(__name__)
 
@@ -26,6 +27,28 @@ class AudioDenoiser:
             cls.initialize()
         return cls._instance
 
+    @classmethod
+    def denoise_chunk(cls, chunk: AudioChunk) -> AudioChunk:
+        """
+        메모리 상의 AudioChunk 잡음 제거 (디스크 I/O 없음)
+
+        Returns:
+            잡음 제거된 새 AudioChunk (실패 시 원본 그대로)
+        """
+        try:
+            reduced = nr.reduce_noise(
+                y = chunk.samples,
+                sr = chunk.sample_rate,
+                stationary = True,
+                prop_decrease = 1.0
+            )
+            return chunk.with_samples(reduced)
+
+        except Exception as e:
+            logger.error(f"잡음 제거 실패 : {e}", exc_info = True)
+            logger.warning("원본 오디오 사용")
+            return chunk
+
     @classmethod
     def denoise_audio(
         cls,
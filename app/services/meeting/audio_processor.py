@@ -1,13 +1,17 @@
 import asyncio
+import os
 import time
-import io
 import numpy as np
 import soundfile as sf
 from pathlib import Path
 from typing import Dict, Optional
 from app.core.logger import setup_logger
+from app.config import settings
 from faster_whisper import WhisperModel
 from app.services.meeting.paths import PathManager
+from app.services.meeting.audio_chunk import AudioChunk, WHISPER_SAMPLE_RATE, resample_to
+from app.services.meeting.stt_batcher import STTBatchScheduler
+from app.services.meeting.stt_process_pool import STTProcessPool
 
 logger = setup_logger(__name__)
 
@@ -18,71 +22,236 @@ class AudioProcessor:
     model_size = "large-v3"
     device = "cuda"
     compute_type = "float16"
+    cpu_threads = 0
+    num_workers = 1
     
     # Queue 방식
     stt_queue = None
     max_concurrent_stt = 2
     stt_semaphore = None
+    batch_scheduler: Optional[STTBatchScheduler] = None
+    process_pool: Optional[STTProcessPool] = None
     
     CHUNK_DURATION_MS = 60000
     OVERLAP_SECONDS = 5.0
+
+    # 실행 프로필 (device별 기본 compute type)
+    # cpu: CTranslate2 int8 양자화 (int8_float32도 허용)
+    WHISPER_PROFILES = {
+        "cuda": {"compute_type": "float16"},
+        "cpu": {"compute_type": "int8"},
+    }
+
+    # chunk 저장 (압축 포맷)
+    OPUS_SAMPLE_RATES = (8000, 12000, 16000, 24000, 48000)
+    WAV_HEADER_BYTES = 44
+    storage_stats = {"raw_bytes": 0, "stored_bytes": 0}
+
+    # realtime factor 통계 (처리 시간 / 음성 길이)
+    rtf_stats = {"chunks": 0, "audio_seconds": 0.0, "stt_seconds": 0.0}
     
+    @staticmethod
+    def detect_device() -> str:
+        """settings.WHISPER_DEVICE 기준 실행 장치 결정 (auto면 CUDA 유무 확인)"""
+        requested = settings.WHISPER_DEVICE.lower()
+        if requested in ("cuda", "cpu"):
+            return requested
+
+        try:
+            import ctranslate2
+            if ctranslate2.get_cuda_device_count() > 0:
+                return "cuda"
+        except Exception as e:
+            logger.warning(f"CUDA 장치 확인 실패: {e}")
+
+        return "cpu"
+
     @classmethod
-    def initialize_whisper(cls, max_concurrent: int = 2, model_size: str = "large-v3"):
-        """Whisper 모델 초기화 (앱 시작 시 한 번만)"""
-        if cls.whisper_model is None:
+    def initialize_whisper(
+        cls,
+        max_concurrent: Optional[int] = None,
+        model_size: Optional[str] = None,
+        device: Optional[str] = None,
+        max_workers: Optional[int] = None
+    ):
+        """
+        Whisper 모델 초기화 (앱 시작 시 한 번만)
+
+        settings.STT_PROCESS_POOL이면 API 프로세스에는 모델을 올리지 않고
+        max_workers(기본 settings.MAX_WORKERS)개의 worker 프로세스가 각자 모델을 로드한다.
+        """
+        if cls.whisper_model is None and cls.process_pool is None:
+            cls.device = device or cls.detect_device()
+            profile = cls.WHISPER_PROFILES[cls.device]
+
+            # 프로필별 모델 크기 (CPU는 작은 모델)
+            if model_size is None:
+                model_size = (
+                    settings.WHISPER_MODEL if cls.device == "cuda"
+                    else settings.WHISPER_CPU_MODEL
+                )
             cls.model_size = model_size
-            cls.max_concurrent_stt = max_concurrent
+            cls.compute_type = settings.WHISPER_COMPUTE_TYPE or profile["compute_type"]
+
+            if settings.STT_PROCESS_POOL:
+                # 프로세스당 transcribe 1개, 프로세스 수만큼 동시 처리
+                pool_workers = max(1, max_workers or settings.MAX_WORKERS)
+                cls.num_workers = 1
+                cls.max_concurrent_stt = pool_workers
+                parallelism = pool_workers
+            else:
+                # 동시 transcribe 수 = CTranslate2 worker 수
+                cls.num_workers = max(1, max_concurrent or settings.WHISPER_NUM_WORKERS)
+                cls.max_concurrent_stt = cls.num_workers
+                parallelism = cls.num_workers
+
+            # CPU: worker당 스레드 수를 코어 수에 맞춰 분배 (oversubscription 방지)
+            if cls.device == "cpu":
+                cls.cpu_threads = settings.WHISPER_CPU_THREADS or max(
+                    1, (os.cpu_count() or 1) // parallelism
+                )
+            else:
+                cls.cpu_threads = 0
             
             logger.info("="*60)
-            logger.info(f"Whisper 모델 초기화 (Queue 방식)")
+            logger.info(f"Whisper 모델 초기화 ({'Process Pool' if settings.STT_PROCESS_POOL else 'Queue'} 방식)")
             logger.info(f"  Model: {cls.model_size}")
             logger.info(f"  Device: {cls.device}")
             logger.info(f"  Compute Type: {cls.compute_type}")
+            logger.info(f"  CPU Threads: {cls.cpu_threads}")
             logger.info(f"  Max Concurrent: {cls.max_concurrent_stt}")
             logger.info("="*60)
+
+            model_kwargs = {
+                "model_size_or_path": cls.model_size,
+                "device": cls.device,
+                "compute_type": cls.compute_type,
+                "cpu_threads": cls.cpu_threads,
+                "num_workers": cls.num_workers
+            }
+
+            if settings.STT_PROCESS_POOL:
+                # worker 프로세스 풀 (프로세스마다 모델 1개)
+                cls.process_pool = STTProcessPool(
+                    cls.max_concurrent_stt,
+                    model_kwargs,
+                    timeout_seconds=settings.STT_PROCESS_TIMEOUT_SECONDS
+                )
+                cls.process_pool.start()
+                logger.info(f"Whisper 프로세스 풀 준비 완료")
+                return
             
             # 단일 모델 인스턴스 생성
-            cls.whisper_model = WhisperModel(
-                cls.model_size,
-                device=cls.device,
-                compute_type=cls.compute_type,
-                num_workers=1
-            )
+            cls.whisper_model = WhisperModel(**model_kwargs)
             
             # Semaphore 생성 (동시 처리 제한)
             cls.stt_semaphore = asyncio.Semaphore(cls.max_concurrent_stt)
+
+            # Batch 스케줄러 (여러 chunk를 한 번의 decoder pass로)
+            if settings.STT_BATCHING:
+                cls.batch_scheduler = STTBatchScheduler(
+                    cls.whisper_model,
+                    batch_size=settings.STT_BATCH_SIZE,
+                    window_ms=settings.STT_BATCH_WINDOW_MS,
+                    max_chunks=settings.STT_BATCH_MAX_CHUNKS
+                )
             
             logger.info(f"Whisper 모델 준비 완료")
+
+    @classmethod
+    def record_rtf(cls, audio_seconds: float, stt_seconds: float) -> float:
+        """chunk 단위 realtime factor 기록 (1.0 미만이면 실시간보다 빠름)"""
+        rtf = stt_seconds / audio_seconds if audio_seconds > 0 else 0.0
+
+        cls.rtf_stats["chunks"] += 1
+        cls.rtf_stats["audio_seconds"] += audio_seconds
+        cls.rtf_stats["stt_seconds"] += stt_seconds
+
+        return rtf
+
+    @classmethod
+    def get_rtf_stats(cls) -> Dict:
+        """누적 realtime factor (노드 용량 산정용)"""
+        audio_seconds = cls.rtf_stats["audio_seconds"]
+        return {
+            **cls.rtf_stats,
+            "device": cls.device,
+            "model": cls.model_size,
+            "compute_type": cls.compute_type,
+            "average_rtf": (
+                cls.rtf_stats["stt_seconds"] / audio_seconds if audio_seconds > 0 else 0.0
+            )
+        }
     
     @classmethod
     def shutdown(cls):
         """종료 처리"""
+        if cls.process_pool:
+            logger.info("Whisper 프로세스 풀 종료 중...")
+            cls.process_pool.shutdown()
+            cls.process_pool = None
+
         if cls.whisper_model:
             logger.info("Whisper 모델 종료 중...")
+            if cls.batch_scheduler:
+                cls.batch_scheduler.shutdown()
+                cls.batch_scheduler = None
             cls.whisper_model = None
             logger.info("종료 완료")
     
-    @staticmethod
+    @classmethod
     def save_chunk_file(
+        cls,
         meeting_id: str,
         user_id: int,
         chunk_index: int,
-        file_data: bytes
+        chunk: AudioChunk
     ) -> Path:
-        """음성 청크 파일 저장"""
+        """
+        음성 청크 파일 저장 (잡음 제거까지 끝난 AudioChunk를 한 번만 기록)
+
+        settings.CHUNK_STORAGE_FORMAT 포맷으로 압축 저장하며,
+        읽기(AudioChunk.from_file)는 포맷과 무관하게 동작한다.
+        """
         try:
-            chunk_dir = PathManager.get_user_chunk_dir(meeting_id, str(user_id))
-            chunk_path = chunk_dir / f"chunk_{chunk_index}.wav"
-            
-            with open(chunk_path, 'wb') as f:
-                f.write(file_data)
-            
-            file_size_kb = len(file_data) / 1024
+            storage_format = settings.CHUNK_STORAGE_FORMAT
+            chunk_path = PathManager.get_chunk_path(
+                meeting_id, str(user_id), chunk_index, storage_format
+            )
+
+            # 같은 chunk의 다른 포맷 파일 정리 (포맷 변경 후 재업로드 등)
+            for other_format in PathManager.CHUNK_EXTENSIONS:
+                other_path = PathManager.get_chunk_path(
+                    meeting_id, str(user_id), chunk_index, other_format
+                )
+                if other_path != chunk_path:
+                    other_path.unlink(missing_ok=True)
+
+            samples, sample_rate = chunk.samples, chunk.sample_rate
+
+            if storage_format == "opus":
+                # Opus는 8/12/16/24/48kHz만 지원 → 그 외는 16kHz(STT 입력 레이트)로
+                if sample_rate not in cls.OPUS_SAMPLE_RATES:
+                    samples = resample_to(samples, sample_rate, WHISPER_SAMPLE_RATE)
+                    sample_rate = WHISPER_SAMPLE_RATE
+                sf.write(str(chunk_path), samples, sample_rate, format="OGG", subtype="OPUS")
+            elif storage_format == "flac":
+                sf.write(str(chunk_path), samples, sample_rate, format="FLAC", subtype="PCM_16")
+            else:
+                sf.write(str(chunk_path), samples, sample_rate, format="WAV", subtype="PCM_16")
+
+            # 무압축 PCM16 WAV 대비 절감량
+            stored_bytes = chunk_path.stat().st_size
+            raw_bytes = cls.WAV_HEADER_BYTES + chunk.num_samples * 2
+            cls.storage_stats["raw_bytes"] += raw_bytes
+            cls.storage_stats["stored_bytes"] += stored_bytes
+
+            saved_ratio = (1 - stored_bytes / raw_bytes) * 100 if raw_bytes else 0.0
             logger.info(
                 f"Audio chunk 저장\n"
                 f"   경로: {chunk_path}\n"
-                f"   크기: {file_size_kb:.2f} KB"
+                f"   크기: {stored_bytes / 1024:.2f} KB "
+                f"(WAV {raw_bytes / 1024:.2f} KB 대비 {saved_ratio:.1f}% 절감, {storage_format})"
             )
             
             return chunk_path
@@ -90,49 +259,50 @@ class AudioProcessor:
         except Exception as e:
             logger.error(f"Chunk 저장 실패: {e}")
             raise
+
+    @classmethod
+    def get_storage_stats(cls) -> Dict:
+        """chunk 저장 누적 절감량"""
+        raw_bytes = cls.storage_stats["raw_bytes"]
+        stored_bytes = cls.storage_stats["stored_bytes"]
+        return {
+            "format": settings.CHUNK_STORAGE_FORMAT,
+            "raw_bytes": raw_bytes,
+            "stored_bytes": stored_bytes,
+            "saved_bytes": raw_bytes - stored_bytes,
+            "saved_ratio": (1 - stored_bytes / raw_bytes) if raw_bytes else 0.0
+        }
     
     @staticmethod
-    def validate_audio_file(file_data: bytes) -> Dict:
-        """음성 파일 검증"""
+    def decode_audio_chunk(file_data: bytes) -> AudioChunk:
+        """
+        음성 파일 검증 + 디코딩 (업로드당 1회)
+
+        헤더 메타데이터로 검증한 뒤 한 번만 디코딩하며,
+        이후 잡음 제거/길이 측정/STT는 모두 이 AudioChunk를 사용한다.
+        """
         try:
-            audio_buffer = io.BytesIO(file_data)
-            data, sample_rate = sf.read(audio_buffer)
-            
-            if len(data.shape) == 1:
-                channels = 1
-            else:
-                channels = data.shape[1]
-            
-            duration_ms = int((len(data) / sample_rate) * 1000)
+            chunk = AudioChunk.from_bytes(file_data)
             
             logger.info(
                 f"Audio 검증 완료\n"
-                f"   Duration: {duration_ms}ms\n"
-                f"   Sample Rate: {sample_rate}Hz\n"
-                f"   Channels: {channels}"
+                f"   Duration: {chunk.duration_ms}ms\n"
+                f"   Sample Rate: {chunk.sample_rate}Hz\n"
+                f"   Channels: {chunk.channels}"
             )
             
-            return {
-                "is_valid": True,
-                "duration_ms": duration_ms,
-                "sample_rate": sample_rate,
-                "channels": channels
-            }
+            return chunk
         
         except Exception as e:
             logger.error(f"Audio 검증 실패: {e}")
-            return {
-                "is_valid": False,
-                "error": str(e)
-            }
+            raise ValueError("Invalid audio format") from e
     
     @staticmethod
     def get_audio_duration_ms(audio_path: Path) -> int:
-        """오디오 파일의 실제 길이 측정 (ms)"""
+        """오디오 파일의 실제 길이 측정 (ms, 헤더만 읽음)"""
         try:
-            data, sample_rate = sf.read(str(audio_path))
-            duration_seconds = len(data) / sample_rate
-            duration_ms = int(duration_seconds * 1000)
+            info = sf.info(str(audio_path))
+            duration_ms = int((info.frames / info.samplerate) * 1000)
             return duration_ms
         except Exception as e:
             logger.error(f"Audio duration 측정 실패: {e}")
@@ -141,8 +311,8 @@ class AudioProcessor:
     @classmethod
     async def transcribe_chunk_with_overlap(
         cls,
-        chunk_path: Path,
-        prev_chunk_path: Optional[Path] = None,
+        chunk: AudioChunk,
+        prev_tail: Optional[AudioChunk] = None,
         user_id: int = None,
         chunk_index: int = None,
         speaker_name: str = None,
@@ -159,34 +329,29 @@ class AudioProcessor:
         )
         
         try:
-            if not chunk_path.exists():
-                raise FileNotFoundError(f"Audio 파일 없음: {chunk_path}")
-            
-            current_duration_ms = cls.get_audio_duration_ms(chunk_path)
+            current_duration_ms = chunk.duration_ms
             logger.info(f"현재 chunk duration: {current_duration_ms}ms")
             
             # ===== 1단계: 겹침 처리 =====
             source_chunks = [chunk_index]
             is_overlapped = False
-            stt_audio_path = chunk_path
+            stt_audio = chunk.samples
             overlap_offset_ms = 0
             
-            if prev_chunk_path and prev_chunk_path.exists() and chunk_index > 0:
+            # prev_tail: OverlapBuffer에 보관된 직전 chunk의 마지막 OVERLAP_SECONDS
+            if prev_tail is not None and chunk_index > 0:
                 logger.info("이전 chunk와 overlap 처리 중...")
                 try:
-                    prev_data, prev_sr = sf.read(str(prev_chunk_path))
-                    curr_data, curr_sr = sf.read(str(chunk_path))
+                    prev_data = resample_to(
+                        prev_tail.samples, prev_tail.sample_rate, chunk.sample_rate
+                    )
 
-                    overlap_samples = int(cls.OVERLAP_SECONDS * prev_sr)
+                    overlap_samples = int(cls.OVERLAP_SECONDS * chunk.sample_rate)
 
                     if len(prev_data) >= overlap_samples:
                         prev_overlap = prev_data[-overlap_samples:]
-                        combined_audio = np.concatenate([prev_overlap, curr_data])
-
-                        temp_path = chunk_path.parent / f"temp_combined_{chunk_path.name}"
-                        sf.write(str(temp_path), combined_audio, curr_sr)
+                        stt_audio = np.concatenate([prev_overlap, chunk.samples])
                     
-                        stt_audio_path = temp_path
                         source_chunks = [chunk_index - 1, chunk_index]
                         is_overlapped = True
                         overlap_offset_ms = int(cls.OVERLAP_SECONDS * 1000)
@@ -197,32 +362,50 @@ class AudioProcessor:
                 
                 except Exception as e:
                     logger.warning(f"Overlap 실패: {e}")
+                    stt_audio = chunk.samples
                     is_overlapped = False
             
-            # ===== 2단계: STT 실행 (Semaphore로 제한) =====
+            # ===== 2단계: STT 실행 =====
             logger.info(f"[User {user_id}] STT 대기열 진입...")
             
-            # Semaphore 획득 (동시 처리 제한)
-            async with cls.stt_semaphore:
-                logger.info(f"[User {user_id}] STT 시작")
-                start_time = time.perf_counter()
-                
-                # asyncio.to_thread로 블로킹 함수를 비동기로 실행
-                segments, info = await asyncio.to_thread(
-                    cls._run_whisper_stt,
-                    str(stt_audio_path)
+            # RTF는 실제 추론 시간만 (대기열/batch 창 대기 제외)
+            if cls.process_pool is not None:
+                # 프로세스 풀 방식: 오디오는 shared memory로 worker 프로세스에 전달
+                whisper_input = await asyncio.to_thread(
+                    resample_to, stt_audio, chunk.sample_rate, WHISPER_SAMPLE_RATE
                 )
-                
-                elapsed = time.perf_counter() - start_time
-                logger.info(f"[User {user_id}] STT 완료: {elapsed:.2f}s")
+                segments, info = await cls.process_pool.submit(whisper_input)
+                elapsed = info["inference_seconds"]
+            elif cls.batch_scheduler is not None:
+                # Batch 방식: 다른 사용자/회의 chunk와 묶어서 한 번에 추론
+                # (overlap 구간은 이미 전사됨 → 경계 이후만 추론)
+                whisper_input = await asyncio.to_thread(
+                    resample_to, stt_audio, chunk.sample_rate, WHISPER_SAMPLE_RATE
+                )
+                segments, info = await cls.batch_scheduler.submit(
+                    whisper_input, skip_before_s=overlap_offset_ms / 1000
+                )
+                elapsed = info["inference_seconds"]
+            else:
+                # Semaphore 획득 (동시 처리 제한)
+                async with cls.stt_semaphore:
+                    logger.info(f"[User {user_id}] STT 시작")
+                    start_time = time.perf_counter()
+                    
+                    # asyncio.to_thread로 블로킹 함수를 비동기로 실행
+                    segments, info = await asyncio.to_thread(
+                        cls._run_whisper_stt,
+                        stt_audio,
+                        chunk.sample_rate
+                    )
+                    elapsed = time.perf_counter() - start_time
             
-            # 임시 파일 삭제
-            if is_overlapped and 'temp_path' in locals() and temp_path.exists():
-                try:
-                    temp_path.unlink()
-                    logger.debug(f"임시 파일 삭제 완료")
-                except Exception as e:
-                    logger.warning(f"임시 파일 삭제 실패: {e}")
+            audio_seconds = len(stt_audio) / chunk.sample_rate
+            rtf = cls.record_rtf(audio_seconds, elapsed)
+            logger.info(
+                f"[User {user_id}] STT 완료: {elapsed:.2f}s "
+                f"(audio {audio_seconds:.1f}s, RTF {rtf:.3f}, {cls.device}/{cls.compute_type})"
+            )
             
             # ===== 3단계: Segment 처리 =====
             if not segments:
@@ -244,11 +427,18 @@ class AudioProcessor:
                 
                 # Overlap 고려
                 if is_overlapped:
-                    if seg_start_in_audio < overlap_offset_ms:
+                    if seg_end_in_audio <= overlap_offset_ms:
                         logger.debug(
                             f"Segment {idx}는 overlap 구간 내 → 건너뛰기"
                         )
                         continue
+
+                    # overlap 경계에 걸친 segment는 경계 이후만 (새 음성은 유지)
+                    if seg_start_in_audio < overlap_offset_ms:
+                        logger.debug(
+                            f"Segment {idx}는 overlap 경계에 걸침 → 시작을 경계로 자름"
+                        )
+                        seg_start_in_audio = overlap_offset_ms
                     
                     actual_start_in_chunk = seg_start_in_audio - overlap_offset_ms
                     actual_end_in_chunk = seg_end_in_audio - overlap_offset_ms
@@ -287,7 +477,8 @@ class AudioProcessor:
                 "duration_ms": current_duration_ms,
                 "source_chunks": ",".join(map(str, source_chunks)),
                 "is_overlapped": is_overlapped,
-                "total_segments": len(processed_segments)
+                "total_segments": len(processed_segments),
+                "rtf": rtf
             }
         
         except Exception as e:
@@ -295,18 +486,20 @@ class AudioProcessor:
             raise
     
     @classmethod
-    def _run_whisper_stt(cls, audio_path: str):
+    def _run_whisper_stt(cls, audio: np.ndarray, sample_rate: int = WHISPER_SAMPLE_RATE):
         """
         실제 Whisper STT 실행 (동기 함수)
         
         asyncio.to_thread로 호출됨
+        audio: mono float32 배열 (16kHz로 리샘플 후 파일 디코딩 없이 바로 모델 입력)
         """
         try:
-            logger.debug(f"Whisper transcribe 시작: {audio_path}")
+            audio = resample_to(audio, sample_rate, WHISPER_SAMPLE_RATE)
+            logger.debug(f"Whisper transcribe 시작: {len(audio) / WHISPER_SAMPLE_RATE:.1f}s")
             
             # STT 수행
             segments_generator, info = cls.whisper_model.transcribe(
-                audio_path,
+                audio,
                 language="ko",
                 beam_size=5,
                 vad_filter=True,
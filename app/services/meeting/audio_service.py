@@ -2,17 +2,26 @@ from fastapi import UploadFile, BackgroundTasks
 from sqlalchemy.orm import Session
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict
+from typing import Callable, Dict, Optional, Set
 from app.core.logger import setup_logger
-from app.core.schemas import User, Meeting, MeetingParticipant, STTSegment
+from app.core.schemas import User, Meeting, MeetingParticipant, STTSegment, STTJob
 from app.services.meeting.audio_processor import AudioProcessor
 from app.services.meeting.audio_denoiser import AudioDenoiser
+from app.services.meeting.audio_chunk import AudioChunk
+from app.services.meeting.overlap_buffer import OverlapBuffer
+from app.services.meeting.stt_job_queue import STTJobQueue
+from app.services.meeting.speech_gate import SpeechGate
+from app.services.meeting.segment_writer import SegmentWriter
+from app.services.meeting.incremental_timeline import IncrementalTimeline
+from app.services.meeting.live_indexer import LiveSegmentIndexer
+from app.services.meeting.meeting_state import MeetingStateStore, get_meeting_state_store
 from app.services.meeting.paths import PathManager
 from app.services.meeting.schemas import AudioChunkUploadResponse
 from app.services.meeting.meeting_service import MeetingService
 from app.core.db import SessionLocal
 from app.config import settings
 import asyncio
+import hashlib
 
 logger = setup_logger(__name__)
 
@@ -20,11 +29,27 @@ logger = setup_logger(__name__)
 class AudioService:
     """오디오 처리 서비스"""
 
-    # 회의별 상태 추적
-    _meeting_states: Dict[str, Dict] = {}
+    # 회의별 상태 추적 (memory: 프로세스 내부 / sqlite: uvicorn worker 간 공유)
+    meeting_states: MeetingStateStore = get_meeting_state_store()
+
+    # 이 프로세스에서 처리 중인 작업 (worker가 중복 lease하지 않도록)
+    _inflight_jobs: Set[str] = set()
+    _worker_tasks: Set[asyncio.Task] = set()
+
+    # 회의별 상태 변경 이벤트 (chunk 완료 / 마지막 chunk 수신 시 set)
+    _state_events: Dict[str, asyncio.Event] = {}
 
     CHUNK_TIMEOUT_SECONDS = 300
     GRACEFUL_SHUTDOWN_WAIT_SECONDS = 30
+
+    WORKER_POLL_SECONDS = 2.0
+    WORKER_MAX_INFLIGHT = 16
+
+    # STTSegment write-behind writer (프로세스 공용)
+    segment_writer = SegmentWriter(
+        flush_ms = settings.SEGMENT_WRITER_FLUSH_MS,
+        max_rows = settings.SEGMENT_WRITER_MAX_ROWS
+    )
     
     def __init__(self):
         self.audio_processor = AudioProcessor()
@@ -34,60 +59,80 @@ class AudioService:
 
     def _init_meeting_state(self, meeting_id: str):
         """회의 상태 초기화"""
-        if meeting_id not in self._meeting_states:
-            self._meeting_states[meeting_id] = {
-                "last_chunk_time": datetime.now(),
-                "active_users": {},
-                "processing_chunks": set(),
-                "last_chunks_received": {}
-            }
+        self.meeting_states.init_meeting(meeting_id)
     
     def _update_last_chunk_time(self, meeting_id: str):
         """마지막 chunk 수신 시간 업데이트"""
-        if meeting_id in self._meeting_states:
-            self._meeting_states[meeting_id]["last_chunk_time"] = datetime.now()
+        self.meeting_states.touch(meeting_id)
     
     def _mark_chunk_processing(self, meeting_id: str, chunk_id: str):
         """처리 중인 chunk 추가"""
-        if meeting_id in self._meeting_states:
-            self._meeting_states[meeting_id]["processing_chunks"].add(chunk_id)
-            logger.debug(
-                f"  현재 처리 중인 chunks: "
-                f"{len(self._meeting_states[meeting_id]['processing_chunks'])}개"
-            )
+        self.meeting_states.add_processing(meeting_id, chunk_id)
+        logger.debug(
+            f"  현재 처리 중인 chunks: "
+            f"{self.meeting_states.processing_count(meeting_id)}개"
+        )
     
     def _mark_chunk_completed(self, meeting_id: str, chunk_id: str):
         """처리 완료된 chunk 제거"""
-        if meeting_id in self._meeting_states:
-            self._meeting_states[meeting_id]["processing_chunks"].discard(chunk_id)
-            logger.debug(
-                f"  현재 처리 중인 chunks: "
-                f"{len(self._meeting_states[meeting_id]['processing_chunks'])}개"
-            )
+        self.meeting_states.discard_processing(meeting_id, chunk_id)
+        logger.debug(
+            f"  현재 처리 중인 chunks: "
+            f"{self.meeting_states.processing_count(meeting_id)}개"
+        )
+        self._notify_state_changed(meeting_id)
+
+        # 회의 진행 중 타임라인 점진 병합
+        IncrementalTimeline.notify(meeting_id)
     
+    def _notify_state_changed(self, meeting_id: str):
+        """wait_for_processing 대기 중인 요청 깨우기"""
+        event = self._state_events.get(meeting_id)
+        if event is not None:
+            event.set()
+
+    async def _wait_for_state(
+        self,
+        meeting_id: str,
+        predicate: Callable[[str], bool],
+        deadline: float
+    ) -> bool:
+        """
+        predicate가 참이 될 때까지 대기 (상태 변경 이벤트 기반)
+
+        공유 저장소(다른 worker가 상태를 바꿀 수 있음)면 poll_seconds 간격으로도 재확인
+
+        Returns:
+            True: 조건 충족, False: deadline 초과
+        """
+        loop = asyncio.get_running_loop()
+        event = self._state_events.setdefault(meeting_id, asyncio.Event())
+        poll_seconds = self.meeting_states.poll_seconds
+
+        while True:
+            event.clear()
+            if predicate(meeting_id):
+                return True
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+
+            try:
+                await asyncio.wait_for(
+                    event.wait(),
+                    timeout = min(remaining, poll_seconds) if poll_seconds else remaining
+                )
+            except asyncio.TimeoutError:
+                pass
+
     def _is_all_chunks_processed(self, meeting_id: str) -> bool:
         """모든 chunk 처리 완료 여부"""
-        if meeting_id not in self._meeting_states:
-            return True
-        return len(self._meeting_states[meeting_id]["processing_chunks"]) == 0
+        return self.meeting_states.processing_count(meeting_id) == 0
     
     def _is_all_last_chunks_received(self, meeting_id: str) -> bool:
         """모든 사용자의 마지막 chunk 수신 완료 여부"""
-        if meeting_id not in self._meeting_states:
-            return True
-        
-        state = self._meeting_states[meeting_id]
-        
-        # 활성 사용자가 없으면 True
-        if not state["active_users"]:
-            return True
-        
-        # 모든 활성 사용자가 is_last=True를 보냈는지 확인
-        for user_id in state["active_users"]:
-            if not state["last_chunks_received"].get(user_id, False):
-                return False
-        
-        return True
+        return self.meeting_states.all_last_chunks_received(meeting_id)
     
     async def check_timeout(self, meeting_id: str, db: Session) -> bool:
         """
@@ -96,11 +141,11 @@ class AudioService:
         Returns:
             True: timeout 발생, False: 정상
         """
-        if meeting_id not in self._meeting_states:
+        last_chunk_time = self.meeting_states.get_last_chunk_time(meeting_id)
+        if last_chunk_time is None:
             return False
         
-        state = self._meeting_states[meeting_id]
-        elapsed = (datetime.now() - state["last_chunk_time"]).total_seconds()
+        elapsed = (datetime.now() - last_chunk_time).total_seconds()
         
         if elapsed > self.CHUNK_TIMEOUT_SECONDS:
             logger.warning(
@@ -136,34 +181,60 @@ class AudioService:
         start_time = datetime.now()
         max_wait_time = timedelta(seconds=self.GRACEFUL_SHUTDOWN_WAIT_SECONDS)
         
+        deadline = asyncio.get_running_loop().time() + self.GRACEFUL_SHUTDOWN_WAIT_SECONDS
+
         # 1. 마지막 chunk 대기
-        while not self._is_all_last_chunks_received(meeting_id):
-            elapsed = datetime.now() - start_time
-            if elapsed > max_wait_time:
-                logger.warning(
-                    f"  마지막 chunk 수신 대기 시간 초과 ({elapsed.total_seconds():.1f}초)"
-                )
-                break
-            
-            logger.debug(f"마지막 chunk 대기 중... ({elapsed.total_seconds():.1f}초)")
-            await asyncio.sleep(1)
+        if not await self._wait_for_state(meeting_id, self._is_all_last_chunks_received, deadline):
+            logger.warning(
+                f"  마지막 chunk 수신 대기 시간 초과 "
+                f"({(datetime.now() - start_time).total_seconds():.1f}초)"
+            )
         
         # 2. 처리 중인 chunk 대기
-        while not self._is_all_chunks_processed(meeting_id):
-            elapsed = datetime.now() - start_time
-            if elapsed > max_wait_time:
-                logger.warning(
-                    f"  chunk 처리 대기 시간 초과 ({elapsed.total_seconds():.1f}초)"
-                )
-                break
-            
-            processing_count = len(self._meeting_states[meeting_id]["processing_chunks"])
-            logger.debug(
-                f"처리 중인 chunk 대기 중... "
-                f"({processing_count}개 남음, {elapsed.total_seconds():.1f}초)"
+        if not await self._wait_for_state(meeting_id, self._is_all_chunks_processed, deadline):
+            logger.warning(
+                f"  chunk 처리 대기 시간 초과 "
+                f"({(datetime.now() - start_time).total_seconds():.1f}초, "
+                f"{self.meeting_states.processing_count(meeting_id)}개 남음)"
             )
-            await asyncio.sleep(1)
         
+        # 대기열에 남은 segment 기록 / 색인 (최종 파이프라인 색인보다 먼저)
+        await self.segment_writer.flush()
+        await LiveSegmentIndexer.get_instance().flush()
+        LiveSegmentIndexer.get_instance().forget_meeting(meeting_id)
+
+        # 더 이상 업로드가 없으므로 overlap 버퍼 / 회의 상태 해제
+        OverlapBuffer.clear_meeting(meeting_id)
+        self.meeting_states.clear_meeting(meeting_id)
+        self._state_events.pop(meeting_id, None)
+
+        gate_stats = SpeechGate.pop_stats(meeting_id)
+        if gate_stats["total"]:
+            logger.info(
+                f"[SpeechGate] 회의 {meeting_id} 무음 skip: "
+                f"{gate_stats['skipped']}/{gate_stats['total']} "
+                f"({gate_stats['skipped'] / gate_stats['total'] * 100:.1f}%)"
+            )
+
+        # STT realtime factor 누적 (노드 용량 산정용, 이 프로세스 기준)
+        rtf_stats = AudioProcessor.get_rtf_stats()
+        if rtf_stats["chunks"]:
+            logger.info(
+                f"[STT] 누적 RTF {rtf_stats['average_rtf']:.3f} "
+                f"(chunk {rtf_stats['chunks']}개, 음성 {rtf_stats['audio_seconds']:.0f}s, "
+                f"추론 {rtf_stats['stt_seconds']:.0f}s, "
+                f"{rtf_stats['device']}/{rtf_stats['model']}/{rtf_stats['compute_type']})"
+            )
+
+        storage_stats = AudioProcessor.get_storage_stats()
+        if storage_stats["raw_bytes"]:
+            logger.info(
+                f"[Storage] 누적 chunk 저장 ({storage_stats['format']}): "
+                f"{storage_stats['raw_bytes'] / 1024 / 1024:.1f}MB → "
+                f"{storage_stats['stored_bytes'] / 1024 / 1024:.1f}MB "
+                f"({storage_stats['saved_ratio'] * 100:.1f}% 절감)"
+            )
+
         end_time = datetime.now()
         wait_time = end_time - start_time
         waited = wait_time.total_seconds() > 1
@@ -204,22 +275,35 @@ class AudioService:
         self._update_last_chunk_time(meeting_id)
         
         # 활성 사용자 업데이트
-        self._meeting_states[meeting_id]["active_users"][user_id] = chunk_index
+        self.meeting_states.set_active_user(meeting_id, user_id, chunk_index)
         
         # 마지막 chunk 표시
         if is_last:
-            self._meeting_states[meeting_id]["last_chunks_received"][user_id] = True
+            self.meeting_states.mark_last_chunk(meeting_id, user_id)
+            self._notify_state_changed(meeting_id)
             logger.info(f"User {user_id}의 마지막 chunk 수신")
         
         # 1. 파일 읽기
         file_data = await audio_file.read()
         file_size_mb = len(file_data) / (1024 * 1024)
         logger.info(f"  File size: {file_size_mb:.2f} MB")
+
+        # 1-1. 중복 업로드 확인 (클라이언트 재시도 → 해시 조회로 종료)
+        chunk_id = f"{meeting_id}_{user_id}_{chunk_index}"
+        content_hash = hashlib.sha256(file_data).hexdigest()
+
+        duplicate = self._find_duplicate_upload(db, chunk_id, content_hash)
+        if duplicate is not None:
+            logger.info(f"Chunk {chunk_id} 동일 내용 재업로드 → 기존 결과 반환")
+            return AudioChunkUploadResponse(
+                meeting_id = meeting_id,
+                user_id = user_id,
+                chunk_index = chunk_index,
+                status = duplicate
+            )
         
-        # 2. 파일 검증
-        validation = AudioProcessor.validate_audio_file(file_data)
-        if not validation["is_valid"]:
-            raise ValueError("Invalid audio format")
+        # 2. 파일 검증 + 디코딩 (1회)
+        chunk = AudioProcessor.decode_audio_chunk(file_data)
         
         # 3. 회의 정보 확인
         meeting = db.query(Meeting).filter(
@@ -246,47 +330,66 @@ class AudioService:
         if not participant:
             raise ValueError("User is not participating in this meeting")
 
-        # 6. 파일 저장
-        chunk_path = AudioProcessor.save_chunk_file(
-            meeting_id, user_id, chunk_index, file_data
-        )
-
-        # 잡음 제거 (noisereduce)
-        if settings.ENABLE_DENOISING and self.denoiser:
-            try:
-                denoised_path = self.denoiser.denoise_audio(chunk_path)
-                logger.info(f"  잡음 제거 완료")
-            except Exception as e:
-                logger.warning(f"잡음 제거 실패, 원본 사용: {e}")
-                denoised_path = chunk_path
-        else:
-            logger.debug(f"잡음 제거 비활성화 (원본 사용)")
-            denoised_path = chunk_path
-
-        # 7. 음성 파일 길이 측정
-        audio_duration_ms = AudioProcessor.get_audio_duration_ms(denoised_path)
+        # 6. 음성 파일 길이 측정 (디코딩된 샘플 수 기준)
+        audio_duration_ms = chunk.duration_ms
         logger.info(f"  음성 길이: {audio_duration_ms}ms ({audio_duration_ms/1000:.1f}초)")
 
-        # 8. 녹음 시작 시점 계산
+        # 7. 녹음 시작 시점 계산
         chunk_start_timestamp = upload_timestamp - audio_duration_ms
 
-        # 9. 회의 기준 상대 시간 계산
+        # 8. 회의 기준 상대 시간 계산
         chunk_relative_start_ms = chunk_start_timestamp - meeting.start_server_timestamp
+
+        # 9. 발화 여부 판정 (무음 chunk는 잡음 제거/STT 생략)
+        if SpeechGate.should_skip(meeting_id, chunk):
+            return self._skip_silent_chunk(
+                db, meeting_id, user_id, chunk_index, chunk,
+                speaker_name = user.name,
+                chunk_relative_start_ms = chunk_relative_start_ms,
+                chunk_id = chunk_id,
+                content_hash = content_hash
+            )
+
+        # 잡음 제거 (noisereduce, 메모리 상에서 처리)
+        if settings.ENABLE_DENOISING and self.denoiser:
+            chunk = self.denoiser.denoise_chunk(chunk)
+            logger.info(f"  잡음 제거 완료")
+        else:
+            logger.debug(f"잡음 제거 비활성화 (원본 사용)")
+
+        # 파일 저장 (잡음 제거 결과를 한 번만 기록)
+        chunk_path = AudioProcessor.save_chunk_file(
+            meeting_id, user_id, chunk_index, chunk
+        )
         
-        # 10. 이전 청크 경로 (겹침 처리용)
-        chunk_dir = PathManager.get_user_chunk_dir(meeting_id, str(user_id))
-        # prev_chunk_path = chunk_dir / f"chunk_{chunk_index - 1}.wav" if chunk_index > 0 else None
-        prev_chunk_path = None
-        if chunk_index > 0:
-            prev_chunk_path = chunk_dir / f"chunk_{chunk_index - 1}.wav"
-            if not prev_chunk_path.exists():
-                prev_chunk_path = None
-
-        # 11. chunk_id 생성 (처리 추적용)
-        chunk_id = f"{meeting_id}_{user_id}_{chunk_index}"
+        # 10. 이전 청크 꼬리 (겹침 처리용, 메모리 ring buffer)
+        prev_tail = OverlapBuffer.swap(
+            meeting_id, user_id, chunk_index, chunk,
+            overlap_seconds = AudioProcessor.OVERLAP_SECONDS
+        )
+        if prev_tail is None:
+            # 재시작 등으로 버퍼가 비어 있으면 디스크의 이전 chunk로 대체
+            prev_tail = self._load_prev_tail_from_disk(meeting_id, user_id, chunk_index)
+
+        # 11. 처리 중 표시 (chunk_id 기준 추적)
         self._mark_chunk_processing(meeting_id, chunk_id)
         logger.info(f"Chunk {chunk_id} 처리 시작 표시 완료")
 
+        # 작업 큐에 기록 (이 프로세스가 lease, 크래시 시 worker가 디스크에서 재처리)
+        STTJobQueue.enqueue(
+            db,
+            job_id = chunk_id,
+            meeting_id = meeting_id,
+            user_id = user_id,
+            chunk_index = chunk_index,
+            chunk_path = str(chunk_path),
+            speaker_name = user.name,
+            chunk_relative_start_ms = chunk_relative_start_ms,
+            content_hash = content_hash,
+            leased = True
+        )
+        self._inflight_jobs.add(chunk_id)
+
         # 누적 시간 가져오기
         # cumulative_time_ms = self._get_cumulative_time(meeting_id, user_id)
         
@@ -296,12 +399,12 @@ class AudioService:
             meeting_id = meeting_id,
             user_id = user_id,
             chunk_index = chunk_index,
-            chunk_path = denoised_path,
-            # chunk_path = chunk_path,
-            prev_chunk_path = prev_chunk_path,
+            chunk = chunk,
+            prev_tail = prev_tail,
             speaker_name = user.name,
             chunk_relative_start_ms = chunk_relative_start_ms,
-            chunk_id = chunk_id
+            chunk_id = chunk_id,
+            content_hash = content_hash
         )
         
         return AudioChunkUploadResponse(
@@ -310,26 +413,80 @@ class AudioService:
             chunk_index = chunk_index
         )
     
+    def _skip_silent_chunk(
+        self,
+        db: Session,
+        meeting_id: str,
+        user_id: int,
+        chunk_index: int,
+        chunk: AudioChunk,
+        speaker_name: str,
+        chunk_relative_start_ms: int,
+        chunk_id: str,
+        content_hash: str
+    ) -> AudioChunkUploadResponse:
+        """
+        무음 chunk 처리: 모델 호출 없이 완료 처리
+
+        파일 저장과 overlap 버퍼 갱신은 그대로 해서 다음 chunk 처리에 영향이 없게 한다.
+        """
+        chunk_path = AudioProcessor.save_chunk_file(
+            meeting_id, user_id, chunk_index, chunk
+        )
+        OverlapBuffer.swap(
+            meeting_id, user_id, chunk_index, chunk,
+            overlap_seconds = AudioProcessor.OVERLAP_SECONDS
+        )
+
+        # 작업 큐에도 skipped로 남겨 재시작 복구 대상에서 제외
+        STTJobQueue.enqueue(
+            db,
+            job_id = chunk_id,
+            meeting_id = meeting_id,
+            user_id = user_id,
+            chunk_index = chunk_index,
+            chunk_path = str(chunk_path),
+            speaker_name = speaker_name,
+            chunk_relative_start_ms = chunk_relative_start_ms,
+            content_hash = content_hash
+        )
+        # 내용이 바뀐 재업로드라면 이전 segment 제거 (실시간 색인 포함)
+        stale_ids = SegmentWriter.delete_chunk_segments(db, meeting_id, user_id, chunk_index)
+        STTJobQueue.ack(db, chunk_id, status = "skipped")
+        db.commit()
+        LiveSegmentIndexer.get_instance().delete(meeting_id, stale_ids)
+
+        # processing에 넣지 않으므로 회의 상태 기준 즉시 완료 상태
+        self._mark_chunk_completed(meeting_id, chunk_id)
+        logger.info(f"[STT] {chunk_id} 무음 chunk → STT 생략")
+
+        return AudioChunkUploadResponse(
+            meeting_id = meeting_id,
+            user_id = user_id,
+            chunk_index = chunk_index,
+            status = "skipped"
+        )
+
     # 백그라운드 STT 처리
     async def _process_stt_background(
         self,
         meeting_id: str,
         user_id: int,
         chunk_index: int,
-        chunk_path: Path,
-        prev_chunk_path: Path,
+        chunk: AudioChunk,
+        prev_tail: Optional[AudioChunk],
         speaker_name: str,
         chunk_relative_start_ms: int,
-        chunk_id: str
+        chunk_id: str,
+        content_hash: Optional[str] = None
     ):
         logger.info(f"[STT] User {user_id}, Chunk {chunk_index} started")
-        db = SessionLocal()
         
         try:
             # 1. STT 처리
             stt_result = await self.audio_processor.transcribe_chunk_with_overlap(
-                chunk_path = chunk_path,
-                prev_chunk_path = prev_chunk_path,
+                chunk = chunk,
+                prev_tail = prev_tail,
                 user_id = user_id,
                 chunk_index = chunk_index,
                 speaker_name = speaker_name,
@@ -343,8 +500,8 @@ class AudioService:
             #     stt_result["duration_ms"]
             # )
 
-            # 2. 각 segment를 개별적으로 DB에 저장
-            saved_count = 0
+            # 2. segment row 구성 (DB 기록은 write-behind writer가 일괄 처리)
+            rows = []
             skipped_count = 0
 
             for seg in stt_result["segments"]:
@@ -374,23 +531,40 @@ class AudioService:
                     seg["confidence"] + (text_length / 100) * 0.1
                 )
             
-                # DB 저장
-                db_segment = STTSegment(
-                    segment_id = segment_id,
-                    meeting_id = meeting_id,
-                    user_id = user_id,
-                    chunk_index = chunk_index,
-                    text = seg["text"].strip(),
-                    confidence = adjusted_confidence,
-                    start_time_ms = seg["start_time_ms"],
-                    end_time_ms = seg["end_time_ms"],
-                    source_chunks = stt_result["source_chunks"],
-                    is_overlapped = stt_result["is_overlapped"]
-                )
-                db.add(db_segment)
-                saved_count += 1
+                rows.append({
+                    "segment_id": segment_id,
+                    "meeting_id": meeting_id,
+                    "user_id": user_id,
+                    "chunk_index": chunk_index,
+                    "text": seg["text"].strip(),
+                    "confidence": adjusted_confidence,
+                    "start_time_ms": seg["start_time_ms"],
+                    "end_time_ms": seg["end_time_ms"],
+                    "source_chunks": stt_result["source_chunks"],
+                    "is_overlapped": stt_result["is_overlapped"]
+                })
+
+            # segment 저장과 작업 완료(ack)를 같은 트랜잭션으로
+            saved = await self.segment_writer.write(
+                job_id = chunk_id,
+                meeting_id = meeting_id,
+                user_id = user_id,
+                chunk_index = chunk_index,
+                content_hash = content_hash,
+                rows = rows
+            )
+
+            # 처리 중 같은 chunk가 다른 내용으로 재업로드되었으면 결과 폐기
+            if not saved:
+                logger.info(f"[STT] {chunk_id} 새 업로드로 대체됨 → 결과 폐기")
+                return
+            saved_count = len(rows)
 
-            db.commit()
+            # 회의 중 검색이 가능하도록 실시간 색인 (원본 텍스트, 보정 후 제자리 갱신)
+            LiveSegmentIndexer.get_instance().submit(
+                meeting_id,
+                [{**row, "speaker_name": speaker_name} for row in rows]
+            )
             
             logger.info(
                 f"[STT] User {user_id}, Chunk {chunk_index} 완료\n"
@@ -402,11 +576,221 @@ class AudioService:
         
         except Exception as e:
             logger.error(f"[STT] Failed: {e}", exc_info=True)
-            db.rollback()
 
-            # 에러 발생해도 처리 완료 표시 (무한대기 방지)
+            # 작업 큐에 실패 기록 → backoff 후 worker가 재시도
+            self._fail_job(meeting_id, chunk_id, str(e))
+
+        finally:
+            self._inflight_jobs.discard(chunk_id)
+
+    def _fail_job(self, meeting_id: str, chunk_id: str, error: str):
+        """
+        작업 실패 기록
+
+        재시도가 예약되면 처리 중 상태를 유지해 wait_for_processing이 재시도 결과까지 기다리고,
+        최종 실패(또는 기록 실패)일 때만 처리 완료 표시 (무한대기 방지)
+        """
+        db = SessionLocal()
+        try:
+            final = STTJobQueue.fail(db, chunk_id, error)
+        except Exception as queue_error:
+            logger.error(f"[STTJob] 실패 기록 실패: {queue_error}")
+            final = True
+        finally:
+            db.close()
+
+        if final:
             self._mark_chunk_completed(meeting_id, chunk_id)
             logger.warning(f"[STT] {chunk_id} 에러로 인한 처리 완료 표시")
+        else:
+            logger.info(f"[STT] {chunk_id} 재시도 대기 (처리 중 유지)")
+
+    @staticmethod
+    def _find_duplicate_upload(db: Session, chunk_id: str, content_hash: str) -> Optional[str]:
+        """
+        같은 (meeting, user, chunk_index)에 같은 내용이 이미 접수되었으면 응답 status 반환
+
+        실패(failed)한 작업은 재업로드로 다시 처리한다.
+        """
+        job = STTJobQueue.get(db, chunk_id)
+        if job is None or job.content_hash != content_hash or job.status == "failed":
+            return None
+        return "skipped" if job.status == "skipped" else "received"
+
+    def _load_prev_tail_from_disk(
+        self,
+        meeting_id: str,
+        user_id: int,
+        chunk_index: int
+    ) -> Optional[AudioChunk]:
+        """디스크의 이전 chunk (overlap 버퍼가 없을 때만)"""
+        if chunk_index <= 0:
+            return None
+
+        prev_chunk_path = PathManager.find_chunk_path(
+            meeting_id, str(user_id), chunk_index - 1
+        )
+        if prev_chunk_path is None:
+            return None
+
+        try:
+            return AudioChunk.from_file(prev_chunk_path)
+        except Exception as e:
+            logger.warning(f"이전 chunk 로드 실패: {e}")
+            return None
+
+    # ===== 영속 작업 큐 worker =====
+    async def process_stt_job(self, job: STTJob):
+        """
+        큐에서 lease한 작업 처리 (디스크의 chunk 파일 사용)
+
+        진행 중 회의만 상태를 (재)생성해 처리 중으로 표시한다
+        (종료된 회의의 상태를 되살리지 않음)
+        """
+        db = SessionLocal()
+        try:
+            meeting = db.query(Meeting.status).filter(
+                Meeting.meeting_id == job.meeting_id
+            ).first()
+        finally:
+            db.close()
+
+        if meeting is not None and meeting.status == "in_progress":
+            self._init_meeting_state(job.meeting_id)
+            self._mark_chunk_processing(job.meeting_id, job.job_id)
+        self._inflight_jobs.add(job.job_id)
+
+        try:
+            chunk = AudioChunk.from_file(job.chunk_path)
+        except Exception as e:
+            logger.error(f"[STTJob] chunk 로드 실패: {job.job_id} - {e}")
+            self._fail_job(job.meeting_id, job.job_id, f"chunk 로드 실패: {e}")
+            self._inflight_jobs.discard(job.job_id)
+            return
+
+        await self._process_stt_background(
+            meeting_id = job.meeting_id,
+            user_id = job.user_id,
+            chunk_index = job.chunk_index,
+            chunk = chunk,
+            prev_tail = self._load_prev_tail_from_disk(
+                job.meeting_id, job.user_id, job.chunk_index
+            ),
+            speaker_name = job.speaker_name,
+            chunk_relative_start_ms = job.chunk_relative_start_ms,
+            chunk_id = job.job_id,
+            content_hash = job.content_hash
+        )
+
+    async def run_stt_worker(self):
+        """
+        영속 큐 drain 루프
+
+        업로드 fast path가 처리하지 못한 작업(재시작, lease 만료, 재시도)을 처리
+        """
+        logger.info("[STTJob] worker 시작")
+
+        while True:
+            try:
+                capacity = self.WORKER_MAX_INFLIGHT - len(self._inflight_jobs)
+                jobs = []
+
+                if capacity > 0:
+                    db = SessionLocal()
+                    try:
+                        jobs = STTJobQueue.lease(
+                            db,
+                            limit = capacity,
+                            exclude = self._inflight_jobs
+                        )
+                        for job in jobs:
+                            db.expunge(job)
+                    finally:
+                        db.close()
+
+                for job in jobs:
+                    logger.info(f"[STTJob] 재처리: {job.job_id} (시도 {job.attempts})")
+                    task = asyncio.create_task(self.process_stt_job(job))
+                    self._worker_tasks.add(task)
+                    task.add_done_callback(self._worker_tasks.discard)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[STTJob] worker 오류: {e}", exc_info=True)
+
+            await asyncio.sleep(self.WORKER_POLL_SECONDS)
+
+    def recover_pending_chunks(self) -> int:
+        """
+        시작 시 복구
+
+        1. 이 호스트에서 죽은 프로세스가 잡고 있던 lease 해제
+        2. 진행 중 회의의 chunk 파일 중 segment도 작업도 없는 것을 큐에 등록
+        """
+        db = SessionLocal()
+        recovered = 0
+
+        try:
+            STTJobQueue.release_dead_leases(db)
+
+            meetings = db.query(Meeting).filter(
+                Meeting.status == "in_progress"
+            ).all()
+
+            for meeting in meetings:
+                chunks_dir = PathManager.get_audio_chunks_dir(meeting.meeting_id)
+
+                for user_dir in chunks_dir.iterdir():
+                    if not user_dir.is_dir() or not user_dir.name.isdigit():
+                        continue
+                    user_id = int(user_dir.name)
+
+                    for chunk_path in PathManager.iter_chunk_files(user_dir):
+                        try:
+                            chunk_index = int(chunk_path.stem.split("_")[1])
+                        except (IndexError, ValueError):
+                            continue
+
+                        chunk_id = f"{meeting.meeting_id}_{user_id}_{chunk_index}"
+                        if STTJobQueue.exists(db, chunk_id):
+                            continue
+
+                        has_segments = db.query(STTSegment.segment_id).filter(
+                            STTSegment.meeting_id == meeting.meeting_id,
+                            STTSegment.user_id == user_id,
+                            STTSegment.chunk_index == chunk_index
+                        ).first()
+                        if has_segments:
+                            continue
+
+                        # 업로드 시각 ≈ 파일 저장 시각
+                        duration_ms = AudioProcessor.get_audio_duration_ms(chunk_path)
+                        upload_timestamp = int(chunk_path.stat().st_mtime * 1000)
+                        user = db.query(User).filter(User.user_id == user_id).first()
+
+                        STTJobQueue.enqueue(
+                            db,
+                            job_id = chunk_id,
+                            meeting_id = meeting.meeting_id,
+                            user_id = user_id,
+                            chunk_index = chunk_index,
+                            chunk_path = str(chunk_path),
+                            speaker_name = user.name if user else None,
+                            chunk_relative_start_ms = (
+                                upload_timestamp - duration_ms - meeting.start_server_timestamp
+                            ),
+                            leased = False
+                        )
+                        recovered += 1
+
+            logger.info(f"[STTJob] 복구된 chunk: {recovered}개")
+            return recovered
+
+        except Exception as e:
+            logger.error(f"[STTJob] 복구 실패: {e}", exc_info=True)
+            db.rollback()
+            return recovered
 
         finally:
             db.close()
\ No newline at end of file
@@ -0,0 +1,97 @@
+import hashlib
+from datetime import datetime
+from typing import Dict, Iterable
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.sqlite import insert
+from app.config import settings
+from app.core.db import SessionLocal
+from app.core.logger import setup_logger
+from app.core.schemas import TextCorrectionCache
+
+logger = setup_logger(__name__)
+
+
+class CorrectionCache:
+    """
+    LLM 텍스트 보정 결과 캐시 (SQLite, LRU)
+
+    key: rule_based_cleaning 이후 텍스트 (공백 정규화) 의 sha256
+    "네 맞습니다", "다음으로 넘어가죠" 같은 반복 발화는 LLM 없이 바로 적용
+    """
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return " ".join(text.split())
+
+    @classmethod
+    def key(cls, text: str) -> str:
+        return hashlib.sha256(cls.normalize(text).encode("utf-8")).hexdigest()
+
+    @classmethod
+    def get_many(cls, texts: Iterable[str]) -> Dict[str, str]:
+        """{원문: 보정문} (캐시에 있는 것만, 사용 시각 갱신)"""
+        keys = {cls.key(text): text for text in texts}
+        if not keys:
+            return {}
+
+        db = SessionLocal()
+        try:
+            rows = db.query(TextCorrectionCache).filter(
+                TextCorrectionCache.text_hash.in_(list(keys))
+            ).all()
+
+            now = datetime.utcnow()
+            for row in rows:
+                row.hits += 1
+                row.last_used_at = now
+            db.commit()
+
+            return {keys[row.text_hash]: row.corrected_text for row in rows}
+        finally:
+            db.close()
+
+    @classmethod
+    def put_many(cls, corrections: Dict[str, str]):
+        """{원문: 보정문} 저장 후 최대 개수 초과분을 오래 안 쓴 순서로 삭제"""
+        if not corrections:
+            return
+
+        now = datetime.utcnow()
+        db = SessionLocal()
+        try:
+            for source, corrected in corrections.items():
+                db.execute(
+                    insert(TextCorrectionCache)
+                    .values(
+                        text_hash=cls.key(source),
+                        source_text=cls.normalize(source),
+                        corrected_text=corrected,
+                        hits=0,
+                        last_used_at=now,
+                        created_at=now
+                    )
+                    .on_conflict_do_update(
+                        index_elements=["text_hash"],
+                        set_={"corrected_text": corrected, "last_used_at": now}
+                    )
+                )
+
+            overflow = (
+                db.execute(select(func.count()).select_from(TextCorrectionCache)).scalar()
+                - settings.CORRECTION_CACHE_MAX_ENTRIES
+            )
+            if overflow > 0:
+                oldest = (
+                    select(TextCorrectionCache.text_hash)
+                    .order_by(TextCorrectionCache.last_used_at)
+                    .limit(overflow)
+                )
+                db.execute(
+                    delete(TextCorrectionCache)
+                    .where(TextCorrectionCache.text_hash.in_(oldest.scalar_subquery()))
+                )
+                logger.info(f"[CorrectionCache] LRU 삭제 {overflow}개")
+
+            db.commit()
+        finally:
+            db.close()
@@ -0,0 +1,187 @@
+import hashlib
+import threading
+from array import array
+from datetime import datetime
+from typing import Dict, List
+from langchain_core.embeddings import Embeddings
+from sqlalchemy import func, select
+from sqlalchemy.dialects.sqlite import insert
+from app.config import settings
+from app.core.db import SessionLocal
+from app.core.logger import setup_logger
+from app.core.schemas import EmbeddingCacheEntry
+
+logger = setup_logger(__name__)
+
+
+class EmbeddingCache:
+    """
+    임베딩 벡터 캐시 (SQLite, LRU)
+
+    key: sha256(모델 + 종류(doc/query) + 텍스트)
+    회의 재색인, 파이프라인 재시도, 같은 질문 반복 시 같은 벡터를 다시 요청하지 않는다
+    전체 벡터 크기가 EMBEDDING_CACHE_MAX_MB를 넘으면 오래 안 쓴 순서로 삭제
+    """
+
+    @staticmethod
+    def key(model: str, kind: str, text: str) -> str:
+        return hashlib.sha256(f"{model}\n{kind}\n{text}".encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _encode(vector: List[float]) -> bytes:
+        return array("f", vector).tobytes()
+
+    @staticmethod
+    def _decode(data: bytes) -> List[float]:
+        vector = array("f")
+        vector.frombytes(data)
+        return vector.tolist()
+
+    @classmethod
+    def get_many(cls, keys: List[str]) -> Dict[str, List[float]]:
+        """{key: 벡터} (캐시에 있는 것만, 사용 시각 갱신)"""
+        if not keys:
+            return {}
+
+        db = SessionLocal()
+        try:
+            rows = db.query(EmbeddingCacheEntry).filter(
+                EmbeddingCacheEntry.cache_key.in_(keys)
+            ).all()
+
+            now = datetime.utcnow()
+            for row in rows:
+                row.hits += 1
+                row.last_used_at = now
+            db.commit()
+
+            return {row.cache_key: cls._decode(row.vector) for row in rows}
+        finally:
+            db.close()
+
+    @classmethod
+    def put_many(cls, model: str, vectors: Dict[str, List[float]]):
+        """{key: 벡터} 저장 후 최대 크기 초과분을 오래 안 쓴 순서로 삭제"""
+        if not vectors:
+            return
+
+        now = datetime.utcnow()
+        db = SessionLocal()
+        try:
+            for key, vector in vectors.items():
+                data = cls._encode(vector)
+                db.execute(
+                    insert(EmbeddingCacheEntry)
+                    .values(
+                        cache_key=key,
+                        model=model,
+                        dim=len(vector),
+                        vector=data,
+                        size_bytes=len(data),
+                        hits=0,
+                        last_used_at=now,
+                        created_at=now
+                    )
+                    .on_conflict_do_update(
+                        index_elements=["cache_key"],
+                        set_={"vector": data, "size_bytes": len(data), "last_used_at": now}
+                    )
+                )
+
+            total = db.execute(
+                select(func.coalesce(func.sum(EmbeddingCacheEntry.size_bytes), 0))
+            ).scalar()
+            overflow = total - settings.EMBEDDING_CACHE_MAX_MB * 1024 * 1024
+
+            if overflow > 0:
+                oldest = db.execute(
+                    select(EmbeddingCacheEntry.cache_key, EmbeddingCacheEntry.size_bytes)
+                    .order_by(EmbeddingCacheEntry.last_used_at)
+                ).all()
+
+                evict, freed = [], 0
+                for key, size in oldest:
+                    if freed >= overflow:
+                        break
+                    evict.append(key)
+                    freed += size
+
+                for start in range(0, len(evict), 500):
+                    db.query(EmbeddingCacheEntry).filter(
+                        EmbeddingCacheEntry.cache_key.in_(evict[start:start + 500])
+                    ).delete(synchronize_session=False)
+                logger.info(f"[EmbeddingCache] LRU 삭제 {len(evict)}개 ({freed / 1024 / 1024:.1f}MB)")
+
+            db.commit()
+        finally:
+            db.close()
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    캐시를 거치는 임베딩 wrapper (LangChain Embeddings 호환)
+
+    - cache hit은 바로 반환, miss만 모아서 원래 모델에 한 번에 요청
+    - 같은 호출 안의 중복 텍스트는 한 번만 요청
+    - hits / misses 카운터 (stats())
+    """
+
+    def __init__(self, embeddings: Embeddings, model: str):
+        self.embeddings = embeddings
+        self.model = model
+
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self._embed(texts, "doc", self.embeddings.embed_documents)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed(
+            [text], "query", lambda texts: [self.embeddings.embed_query(texts[0])]
+        )[0]
+
+    def stats(self) -> Dict[str, int]:
+        with self._stats_lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+    def _embed(self, texts: List[str], kind: str, embed_fn) -> List[List[float]]:
+        if not texts:
+            return []
+        if not settings.EMBEDDING_CACHE_ENABLED:
+            return embed_fn(list(texts))
+
+        keys = [EmbeddingCache.key(self.model, kind, text) for text in texts]
+
+        try:
+            found = EmbeddingCache.get_many(list(set(keys)))
+        except Exception as e:
+            logger.warning(f"[EmbeddingCache] 조회 실패, 캐시 없이 진행: {e}")
+            found = {}
+
+        # cache miss (중복 제거, 순서 유지)
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in found and key not in missing:
+                missing[key] = text
+
+        if missing:
+            vectors = embed_fn(list(missing.values()))
+            computed = dict(zip(missing, vectors))
+            found.update(computed)
+
+            try:
+                EmbeddingCache.put_many(self.model, computed)
+            except Exception as e:
+                logger.warning(f"[EmbeddingCache] 저장 실패: {e}")
+
+        with self._stats_lock:
+            self.hits += len(texts) - len(missing)
+            self.misses += len(missing)
+
+        logger.debug(
+            f"[EmbeddingCache] {self.model}: {len(texts)}개 중 "
+            f"{len(texts) - len(missing)}개 hit"
+        )
+        return [found[key] for key in keys]
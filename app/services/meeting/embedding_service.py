@@ -1,25 +1,133 @@
+import threading
+from typing import Dict, List, Tuple
+from langchain_core.embeddings import Embeddings
 from langchain_openai import OpenAIEmbeddings
 from app.config import settings
 from app.core.logger import setup_logger
+from app.services.meeting.embedding_cache import CachedEmbeddings
 
 logger = setup_logger(__name__)
 
+
+class LocalEmbeddings(Embeddings):
+    """sentence-transformers 로컬 임베딩 (CPU, batch encode, 정규화된 벡터)"""
+
+    def __init__(self, model_name: str, device: str = "cpu", batch_size: int = 32):
+        from sentence_transformers import SentenceTransformer
+
+        self.model = SentenceTransformer(model_name, device=device)
+        self.batch_size = batch_size
+
+        # 같은 모델을 여러 thread가 동시에 encode하면 CPU 경합만 늘어남
+        self.lock = threading.Lock()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+
+        with self.lock:
+            vectors = self.model.encode(
+                list(texts),
+                batch_size=self.batch_size,
+                normalize_embeddings=True,
+                convert_to_numpy=True,
+                show_progress_bar=False
+            )
+        return vectors.tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+
 class EmbeddingService:
-    """LangChain 기반 임베딩 서비스 (OpenAI Embeddings)"""
-    
-    _instance = None
-    
+    """
+    LangChain 기반 임베딩 서비스
+
+    backend (settings.EMBEDDING_BACKEND)
+    - openai : OpenAI Embeddings (EMBEDDING_MODEL)
+    - local  : sentence-transformers (LOCAL_EMBEDDING_MODEL, CPU)
+
+    앱의 모든 임베딩(회의 검색, 커리큘럼 RAG, 퀴즈, 피드백 보드)은 여기서 받은
+    인스턴스를 사용한다 → (backend, 모델)별 1개, 임베딩 캐시(EmbeddingCache) 공유
+    """
+
+    _instances: Dict[Tuple[str, str], CachedEmbeddings] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def resolve(backend: str = None, model: str = None) -> Tuple[str, str]:
+        """(backend, 모델) 결정 (지정하지 않으면 설정값)"""
+        backend = backend or settings.EMBEDDING_BACKEND
+
+        if backend not in ("openai", "local"):
+            logger.warning(f"알 수 없는 EMBEDDING_BACKEND={backend}, openai 사용")
+            backend = "openai"
+
+        if model is None:
+            model = settings.LOCAL_EMBEDDING_MODEL if backend == "local" else settings.EMBEDDING_MODEL
+
+        return backend, model
+
     @classmethod
-    def get_instance(cls):
-        if cls._instance is None:
-            logger.info(f"Initializing OpenAI embedding model: {settings.EMBEDDING_MODEL}")
-            
-            # OpenAI 임베딩 모델 초기화
-            cls._instance = OpenAIEmbeddings(
-                model=settings.EMBEDDING_MODEL,
-                api_key=settings.OPENAI_API_KEY
-            )
+    def get_instance(cls, backend: str = None, model: str = None) -> CachedEmbeddings:
+        backend, model = cls.resolve(backend, model)
+
+        with cls._lock:
+            if (backend, model) not in cls._instances:
+                if backend == "local":
+                    logger.info(f"Initializing local embedding model: {model}")
+                    embeddings = LocalEmbeddings(
+                        model,
+                        device=settings.LOCAL_EMBEDDING_DEVICE,
+                        batch_size=settings.LOCAL_EMBEDDING_BATCH_SIZE
+                    )
+                else:
+                    logger.info(f"Initializing OpenAI embedding model: {model}")
+
+                    # OpenAI 임베딩 모델 초기화
+                    embeddings = OpenAIEmbeddings(
+                        model=model,
+                        api_key=settings.OPENAI_API_KEY
+                    )
+
+                cls._instances[(backend, model)] = CachedEmbeddings(embeddings, model)
+                logger.info(f"Embedding model initialized ({backend})")
+
+        return cls._instances[(backend, model)]
 
-            logger.info("OpenAI Embedding model initialized")
-        
-        return cls._instance
\ No newline at end of file
+    @classmethod
+    def for_collection(cls, persist_directory: str, collection_name: str) -> CachedEmbeddings:
+        """
+        이미 만들어진 collection을 읽을 때 사용할 임베딩
+
+        collection metadata에 기록된 모델을 따름
+        (기록이 없는 이전 collection은 OpenAI EMBEDDING_MODEL로 만든 것으로 간주)
+        """
+        # vectorStore_service가 이 모듈을 import하므로 지연 import
+        from app.services.meeting.vectorStore_service import VectorStoreService
+
+        metadata = {}
+        try:
+            client = VectorStoreService.client_for(persist_directory)
+            metadata = client.get_collection(collection_name).metadata or {}
+        except Exception as e:
+            logger.warning(f"collection metadata 조회 실패 ({collection_name}): {e}")
+
+        return cls.get_instance(
+            backend=metadata.get("embedding_backend", "openai"),
+            model=metadata.get("embedding_model", settings.EMBEDDING_MODEL)
+        )
+
+    @staticmethod
+    def collection_metadata(backend: str = None, model: str = None) -> Dict[str, str]:
+        """collection을 만든 임베딩 기록용 metadata"""
+        backend, model = EmbeddingService.resolve(backend, model)
+        return {"embedding_backend": backend, "embedding_model": model}
+
+    @classmethod
+    def stats(cls) -> Dict[str, Dict[str, int]]:
+        """모델별 캐시 hit / miss"""
+        return {
+            f"{backend}:{model}": embedder.stats()
+            for (backend, model), embedder in cls._instances.items()
+        }
@@ -0,0 +1,453 @@
+import asyncio
+import json
+import os
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.core.db import SessionLocal
+from app.core.logger import setup_logger
+from app.core.schemas import Meeting, MeetingParticipant, STTJob
+from app.services.meeting.live_indexer import LiveSegmentIndexer
+from app.services.meeting.meeting_state import get_meeting_state_store
+from app.services.meeting.overlap_handler import OverlapHandler
+from app.services.meeting.paths import PathManager
+from app.services.meeting.timeline_service import TimelineService
+
+logger = setup_logger(__name__)
+
+
+class IncrementalTimeline:
+    """
+    회의 진행 중 타임라인 점진 병합
+
+    chunk STT가 끝날 때마다 "확정 구간"(앞으로 segment가 더 들어올 수 없는 시간)까지의
+    새 segment만 겹침 처리 + 규칙 정리 + LLM 보정해서 누적 저장한다.
+    회의 종료 시에는 확정 구간 이후(tail)만 처리하면 된다.
+
+    확정 시각(watermark)
+    - 사용자별로 아직 처리되지 않은(pending / leased / failed) 가장 이른 chunk 시작 시각
+      (모두 처리됐으면 마지막 chunk 시작 시각, 이후 chunk의 segment는 그 뒤에서 시작)
+    - 아직 chunk를 올리지 않은 참가자는 입장 시각
+    - 모든 사용자 중 최솟값
+    - 경계를 걸치는 segment가 있으면 그 시작점으로 당겨서, 경계 앞뒤 segment 사이에
+      음성-음성 겹침이 생기지 않게 한다 (겹침 처리를 구간별로 나눠도 결과가 같음)
+
+    확정 구간 안의 chunk가 다시 처리되면(실패 chunk 재업로드, 내용이 바뀐 재업로드)
+    그 chunk 시작 시각으로 확정 구간을 되돌려 다시 병합한다
+
+    상태는 storage/meetings/{meeting_id}/summaries/timeline_partial.json 에 저장
+    병합은 MeetingStateStore의 lease를 잡은 worker 하나만 (uvicorn worker 여러 개)
+    """
+
+    # 처리 안 끝난 것으로 보는 작업 상태 (failed도 재업로드될 수 있음)
+    OPEN_JOB_STATUSES = ("pending", "leased", "failed")
+
+    LOCK_SECONDS = 600
+    LOCK_POLL_SECONDS = 0.25
+
+    # 이 프로세스에서 실행 중인 갱신 task (끝나면 제거)
+    _tasks: Dict[str, asyncio.Task] = {}
+    _dirty: Set[str] = set()
+
+    _text_processor = None
+    _rag_service = None
+
+    # -----------------
+    # 진행 중 갱신
+    # -----------------
+    @classmethod
+    def notify(cls, meeting_id: str):
+        """chunk 처리 완료 알림 → 백그라운드 갱신 (실행 중이면 끝난 뒤 한 번 더)"""
+        if not settings.INCREMENTAL_TIMELINE:
+            return
+
+        task = cls._tasks.get(meeting_id)
+        if task is not None and not task.done():
+            cls._dirty.add(meeting_id)
+            return
+
+        cls._tasks[meeting_id] = asyncio.get_running_loop().create_task(
+            cls._run(meeting_id)
+        )
+
+    @classmethod
+    async def _run(cls, meeting_id: str):
+        try:
+            while True:
+                cls._dirty.discard(meeting_id)
+                await cls.update(meeting_id)
+                if meeting_id not in cls._dirty:
+                    break
+
+            if settings.SUMMARY_PREFETCH_WINDOWS:
+                await cls._prefetch_summaries(meeting_id)
+        except Exception as e:
+            logger.error(f"[Timeline] 점진 병합 실패 ({meeting_id}): {e}", exc_info=True)
+        finally:
+            cls._tasks.pop(meeting_id, None)
+            cls._dirty.discard(meeting_id)
+
+    @classmethod
+    async def update(cls, meeting_id: str) -> int:
+        """
+        확정 구간까지 처리
+
+        Returns:
+            이번에 확정된 segment 수
+        """
+        async with cls._timeline_lock(meeting_id):
+            state = cls._load_state(meeting_id)
+            if state.get("finalized"):
+                return 0
+
+            db = SessionLocal()
+            try:
+                meeting = db.query(Meeting).filter(
+                    Meeting.meeting_id == meeting_id
+                ).first()
+                if not meeting:
+                    return 0
+
+                rewound = cls._rewind_for_reprocessed_chunks(db, meeting, state)
+                watermark = cls._watermark_ms(db, meeting)
+                if watermark is None or watermark <= state["frozen_until_ms"]:
+                    window = None
+                else:
+                    window = TimelineService.load_voice_segments(
+                        db, meeting, start_from_ms=state["frozen_until_ms"]
+                    )
+            finally:
+                db.close()
+
+            ready = []
+            if window is not None:
+                boundary = cls._gap_boundary(window, watermark)
+                ready = [seg for seg in window if seg["start_time_ms"] < boundary]
+
+            # LLM 보정 batch 크기만큼 모였을 때만 확정
+            if len(ready) < settings.INCREMENTAL_TIMELINE_MIN_SEGMENTS:
+                if rewound:
+                    cls._save_state(meeting_id, state)
+                return 0
+
+            processed, overlaps = await cls._process_window(meeting_id, ready)
+
+            # 보정된 텍스트로 실시간 색인 갱신
+            LiveSegmentIndexer.get_instance().submit(meeting_id, processed)
+
+            state["segments"].extend(processed)
+            state["overlaps"]["voice_voice"].extend(overlaps)
+            state["frozen_until_ms"] = boundary
+            cls._save_state(meeting_id, state)
+
+            logger.info(
+                f"[Timeline] {meeting_id} 점진 병합: +{len(processed)}개 "
+                f"(확정 ~{boundary / 1000:.0f}s, 누적 {len(state['segments'])}개)"
+            )
+            return len(ready)
+
+    @classmethod
+    async def _prefetch_summaries(cls, meeting_id: str):
+        """
+        확정 구간 안에서 끝난 요약 window를 미리 요약 (종료 시 캐시 재사용)
+
+        확정된 텍스트만으로 한 번에 요약할 길이를 넘었을 때만
+        (종료 시 어차피 window 요약을 쓰게 되는 회의)
+        """
+        state = cls._load_state(meeting_id)
+        if state.get("finalized") or not state["frozen_until_ms"]:
+            return
+
+        frozen_chars = sum(len(seg["text"]) + 20 for seg in state["segments"])
+        if frozen_chars <= settings.SUMMARY_SINGLE_PASS_MAX_CHARS:
+            return
+
+        await cls._get_rag_service().summarize_windows(
+            meeting_id,
+            list(state["segments"]),
+            until_ms=state["frozen_until_ms"]
+        )
+
+    # -----------------
+    # 회의 종료
+    # -----------------
+    @classmethod
+    async def finalize(
+        cls,
+        db: Session,
+        meeting_id: str,
+        chat_messages: List[Dict] = None,
+        use_llm: bool = True
+    ) -> Dict:
+        """
+        확정 구간 이후(tail) + 채팅만 처리해서 merge_timeline과 같은 형식으로 반환
+
+        반환 segment는 텍스트 후처리까지 끝난 상태
+        """
+        async with cls._timeline_lock(meeting_id):
+            meeting = db.query(Meeting).filter(
+                Meeting.meeting_id == meeting_id
+            ).first()
+            if not meeting:
+                raise ValueError(f"회의를 찾을 수 없음: {meeting_id}")
+
+            # 이미 종료 병합한 회의(파이프라인 재실행)는 처음부터 다시
+            state = cls._load_state(meeting_id)
+            if state.get("finalized"):
+                state = cls._new_state()
+
+            # 확정 구간 안에서 다시 처리된 chunk가 있으면 그 앞으로 되돌림
+            cls._rewind_for_reprocessed_chunks(db, meeting, state)
+
+            # 1. tail 음성 segment
+            tail = TimelineService.load_voice_segments(
+                db, meeting, start_from_ms=state["frozen_until_ms"]
+            )
+            tail_processed, tail_overlaps = await cls._process_window(meeting_id, tail, use_llm)
+
+            voice_segments = state["segments"] + tail_processed
+            voice_voice = state["overlaps"]["voice_voice"] + tail_overlaps
+
+            logger.info(
+                f"[Timeline] {meeting_id} 종료 병합: 확정 {len(state['segments'])}개 "
+                f"+ tail {len(tail)}개"
+            )
+
+            # 2. 채팅 (음성-채팅 겹침은 채팅에만 마커를 붙이므로 여기서 한 번에)
+            chat_segments = TimelineService.build_chat_segments(meeting, chat_messages)
+            if chat_segments:
+                voice_chat = OverlapHandler.detect_all_overlaps(
+                    voice_segments + chat_segments
+                )["voice_chat"]
+                chat_segments = OverlapHandler.process_overlaps(
+                    voice_segments + chat_segments,
+                    {"voice_voice": [], "voice_chat": voice_chat}
+                )
+                chat_segments = [seg for seg in chat_segments if seg["type"] == "chat"]
+                chat_segments = await cls._get_text_processor().process_segments(
+                    segments=chat_segments,
+                    use_llm=use_llm,
+                    meeting_id=meeting_id
+                )
+            else:
+                voice_chat = []
+
+            all_segments = voice_segments + chat_segments
+            all_segments.sort(key=lambda x: x["start_time_ms"])
+
+            full_text = OverlapHandler.format_overlapping_text(all_segments)
+            TimelineService.save_full_text(meeting_id, full_text)
+
+            # 이후 늦게 온 갱신 알림은 무시 (다른 worker 포함)
+            state["finalized"] = True
+            cls._save_state(meeting_id, state)
+            cls._dirty.discard(meeting_id)
+
+            return {
+                "segments": all_segments,
+                "full_text": full_text,
+                "total_segments": len(all_segments),
+                "voice_segments": len(voice_segments),
+                "chat_segments": len(chat_segments),
+                "speakers": TimelineService._calculate_speaker_stats(all_segments),
+                "overlaps": {"voice_voice": voice_voice, "voice_chat": voice_chat}
+            }
+
+    # -----------------
+    # 내부
+    # -----------------
+    @classmethod
+    async def _process_window(
+        cls,
+        meeting_id: str,
+        segments: List[Dict],
+        use_llm: bool = True
+    ):
+        """구간 단위 겹침 처리 → 규칙 정리 → LLM 보정"""
+        if not segments:
+            return [], []
+
+        segments = sorted(segments, key=lambda x: x["start_time_ms"])
+        overlaps = OverlapHandler.detect_all_overlaps(segments)
+
+        if overlaps["voice_voice"]:
+            segments = OverlapHandler.process_overlaps(segments, overlaps)
+
+        processed = await cls._get_text_processor().process_segments(
+            segments=segments,
+            use_llm=use_llm,
+            meeting_id=meeting_id
+        )
+        return processed, overlaps["voice_voice"]
+
+    @classmethod
+    def _watermark_ms(cls, db: Session, meeting: Meeting) -> Optional[int]:
+        """모든 사용자에 대해 이후 segment가 더 들어올 수 없는 시각"""
+        jobs = (
+            db.query(STTJob.user_id, STTJob.chunk_relative_start_ms, STTJob.status)
+            .filter(STTJob.meeting_id == meeting.meeting_id)
+            .all()
+        )
+        if not jobs:
+            return None
+
+        per_user: Dict[int, Dict[str, List[int]]] = {}
+        for user_id, start_ms, status in jobs:
+            entry = per_user.setdefault(user_id, {"all": [], "open": []})
+            entry["all"].append(start_ms)
+            if status in cls.OPEN_JOB_STATUSES:
+                entry["open"].append(start_ms)
+
+        watermarks = [
+            min(entry["open"]) if entry["open"] else max(entry["all"])
+            for entry in per_user.values()
+        ]
+
+        # 아직 chunk를 올리지 않은 참가자 → 입장 시각부터 열려 있음
+        participants = (
+            db.query(MeetingParticipant.user_id, MeetingParticipant.join_time)
+            .filter(
+                MeetingParticipant.meeting_id == meeting.meeting_id,
+                MeetingParticipant.is_active == 1
+            )
+            .all()
+        )
+        for user_id, join_time in participants:
+            if user_id not in per_user:
+                watermarks.append(
+                    max(0, (join_time or 0) - (meeting.start_server_timestamp or 0))
+                )
+
+        return min(watermarks)
+
+    @classmethod
+    def _rewind_for_reprocessed_chunks(cls, db: Session, meeting: Meeting, state: Dict) -> bool:
+        """
+        지난 확인 이후 다시 처리된 chunk 중 확정 구간 안에서 시작하는 것이 있으면
+        가장 이른 chunk 시작 시각으로 확정 구간을 되돌림
+
+        (재업로드는 STTJob을 다시 대기 상태로 만들고 segment를 교체하므로 updated_at이 바뀜)
+
+        Returns:
+            되돌렸는지
+        """
+        checked_at = datetime.utcnow()
+        last_checked = state.get("jobs_checked_at")
+        state["jobs_checked_at"] = checked_at.isoformat()
+
+        if not last_checked or not state["frozen_until_ms"]:
+            return False
+
+        earliest = (
+            db.query(func.min(STTJob.chunk_relative_start_ms))
+            .filter(
+                STTJob.meeting_id == meeting.meeting_id,
+                STTJob.updated_at > datetime.fromisoformat(last_checked),
+                STTJob.chunk_relative_start_ms < state["frozen_until_ms"]
+            )
+            .scalar()
+        )
+        if earliest is None:
+            return False
+
+        boundary = cls._gap_boundary(state["segments"], earliest)
+        boundary_abs = (meeting.start_server_timestamp or 0) + boundary
+
+        state["segments"] = [
+            seg for seg in state["segments"] if seg["start_time_ms"] < boundary
+        ]
+        state["overlaps"]["voice_voice"] = [
+            overlap for overlap in state["overlaps"]["voice_voice"]
+            if overlap["overlap_start_ms"] < boundary_abs
+        ]
+
+        logger.info(
+            f"[Timeline] {meeting.meeting_id} 확정 구간 안의 chunk 재처리 → "
+            f"{state['frozen_until_ms'] / 1000:.0f}s에서 {boundary / 1000:.0f}s로 되돌림"
+        )
+        state["frozen_until_ms"] = boundary
+        return True
+
+    @staticmethod
+    def _gap_boundary(segments: List[Dict], watermark: int) -> int:
+        """watermark 이하에서 어떤 segment도 걸치지 않는 시각"""
+        boundary = watermark
+        for seg in sorted(segments, key=lambda x: x["start_time_ms"], reverse=True):
+            if seg["start_time_ms"] < boundary < seg["end_time_ms"]:
+                boundary = seg["start_time_ms"]
+        return boundary
+
+    @classmethod
+    @asynccontextmanager
+    async def _timeline_lock(cls, meeting_id: str):
+        """회의별 병합 lease (프로세스/worker 무관하게 한 번에 하나만)"""
+        store = get_meeting_state_store()
+        owner = uuid.uuid4().hex
+
+        while not store.acquire_timeline_lock(meeting_id, owner, cls.LOCK_SECONDS):
+            await asyncio.sleep(cls.LOCK_POLL_SECONDS)
+
+        try:
+            yield
+        finally:
+            store.release_timeline_lock(meeting_id, owner)
+
+    @classmethod
+    def _get_text_processor(cls):
+        if cls._text_processor is None:
+            from app.services.meeting.text_processor import TextProcessor
+            cls._text_processor = TextProcessor()
+        return cls._text_processor
+
+    @classmethod
+    def _get_rag_service(cls):
+        if cls._rag_service is None:
+            from app.services.meeting.rag_service import RAGService
+            cls._rag_service = RAGService()
+        return cls._rag_service
+
+    @staticmethod
+    def _state_path(meeting_id: str):
+        return PathManager.get_meeting_dir(meeting_id) / "summaries" / "timeline_partial.json"
+
+    @staticmethod
+    def _new_state() -> Dict:
+        return {
+            "frozen_until_ms": 0,
+            "jobs_checked_at": None,
+            "segments": [],
+            "overlaps": {"voice_voice": []}
+        }
+
+    @classmethod
+    def _load_state(cls, meeting_id: str) -> Dict:
+        """
+        저장된 상태 (없으면 새 상태)
+
+        프로세스에 캐시하지 않음 → 다른 worker가 병합한 결과도 이어서 사용
+        """
+        path = cls._state_path(meeting_id)
+        if path.exists():
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    saved = json.load(f)
+                if saved.get("frozen_until_ms") is not None:
+                    return saved
+            except Exception as e:
+                logger.warning(f"[Timeline] 저장된 상태 로드 실패, 처음부터 병합: {e}")
+
+        return cls._new_state()
+
+    @classmethod
+    def _save_state(cls, meeting_id: str, state: Dict):
+        path = cls._state_path(meeting_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
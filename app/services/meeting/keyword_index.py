@@ -0,0 +1,167 @@
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy import func, insert
+from app.config import settings
+from app.core.db import SessionLocal
+from app.core.schemas import SegmentKeywordDoc, SegmentKeywordPosting
+
+
+class KeywordIndex:
+    """
+    회의 segment BM25 inverted index (SQLite)
+
+    - term: 단어별 글자 n-gram (KEYWORD_NGRAM, 기본 2)
+      "API 명세" → api → "ap", "pi" / 명세 → "명세"
+      조사가 붙어도("명세서를") 같은 n-gram이 남아 형태소 분석 없이 매칭된다
+    - segment가 색인될 때마다 해당 segment의 posting만 교체 (점진 갱신)
+    - 검색 범위: meeting_id 또는 chat_room_id (그룹)
+    """
+
+    K1 = 1.2
+    B = 0.75
+
+    _WORD = re.compile(r"\w+")
+
+    @classmethod
+    def terms(cls, text: str) -> Counter:
+        n = max(1, settings.KEYWORD_NGRAM)
+        counts = Counter()
+        for word in cls._WORD.findall(text.lower()):
+            if len(word) <= n:
+                counts[word] += 1
+            else:
+                for i in range(len(word) - n + 1):
+                    counts[word[i:i + n]] += 1
+        return counts
+
+    @classmethod
+    def upsert(cls, meeting_id: str, chat_room_id: Optional[str], segments: List[Dict]):
+        """segments: segment_id, text"""
+        if not segments:
+            return
+
+        docs, postings = [], []
+        for seg in segments:
+            counts = cls.terms(seg["text"])
+            docs.append({
+                "segment_id": seg["segment_id"],
+                "meeting_id": meeting_id,
+                "chat_room_id": chat_room_id,
+                "length": sum(counts.values())
+            })
+            postings.extend(
+                {
+                    "term": term,
+                    "segment_id": seg["segment_id"],
+                    "meeting_id": meeting_id,
+                    "chat_room_id": chat_room_id,
+                    "tf": tf
+                }
+                for term, tf in counts.items()
+            )
+
+        db = SessionLocal()
+        try:
+            cls._delete(db, [seg["segment_id"] for seg in segments])
+            db.execute(insert(SegmentKeywordDoc), docs)
+            if postings:
+                db.execute(insert(SegmentKeywordPosting), postings)
+            db.commit()
+        finally:
+            db.close()
+
+    @classmethod
+    def delete(cls, segment_ids: Iterable[str]):
+        segment_ids = list(segment_ids)
+        if not segment_ids:
+            return
+
+        db = SessionLocal()
+        try:
+            cls._delete(db, segment_ids)
+            db.commit()
+        finally:
+            db.close()
+
+    @staticmethod
+    def _delete(db, segment_ids: List[str]):
+        for start in range(0, len(segment_ids), 500):
+            batch = segment_ids[start:start + 500]
+            for model in (SegmentKeywordPosting, SegmentKeywordDoc):
+                db.query(model).filter(
+                    model.segment_id.in_(batch)
+                ).delete(synchronize_session=False)
+
+    @classmethod
+    def segment_ids(cls, meeting_id: str = None, chat_room_id: str = None) -> Set[str]:
+        """색인된 segment_id (범위 내)"""
+        db = SessionLocal()
+        try:
+            query = db.query(SegmentKeywordDoc.segment_id)
+            return {row[0] for row in cls._scoped(query, SegmentKeywordDoc, meeting_id, chat_room_id)}
+        finally:
+            db.close()
+
+    @classmethod
+    def search(
+        cls,
+        query: str,
+        k: int,
+        meeting_id: str = None,
+        chat_room_id: str = None
+    ) -> List[Tuple[str, float]]:
+        """BM25 상위 k개 [(segment_id, score)]"""
+        query_terms = list(cls.terms(query))
+        if not query_terms:
+            return []
+
+        db = SessionLocal()
+        try:
+            total, total_length = cls._scoped(
+                db.query(
+                    func.count(SegmentKeywordDoc.segment_id),
+                    func.coalesce(func.sum(SegmentKeywordDoc.length), 0)
+                ),
+                SegmentKeywordDoc, meeting_id, chat_room_id
+            ).one()
+            if not total:
+                return []
+
+            rows = cls._scoped(
+                db.query(
+                    SegmentKeywordPosting.term,
+                    SegmentKeywordPosting.segment_id,
+                    SegmentKeywordPosting.tf,
+                    SegmentKeywordDoc.length
+                )
+                .join(
+                    SegmentKeywordDoc,
+                    SegmentKeywordDoc.segment_id == SegmentKeywordPosting.segment_id
+                )
+                .filter(SegmentKeywordPosting.term.in_(query_terms)),
+                SegmentKeywordPosting, meeting_id, chat_room_id
+            ).all()
+        finally:
+            db.close()
+
+        avg_length = total_length / total or 1.0
+
+        doc_freq = Counter(term for term, _, _, _ in rows)
+        scores: Dict[str, float] = defaultdict(float)
+        for term, segment_id, tf, length in rows:
+            df = doc_freq[term]
+            idf = math.log(1 + (total - df + 0.5) / (df + 0.5))
+            norm = tf + cls.K1 * (1 - cls.B + cls.B * length / avg_length)
+            scores[segment_id] += idf * tf * (cls.K1 + 1) / norm
+
+        return sorted(scores.items(), key=lambda x: x[1], reverse=True)[:k]
+
+    @staticmethod
+    def _scoped(query, model, meeting_id: Optional[str], chat_room_id: Optional[str]):
+        if meeting_id:
+            query = query.filter(model.meeting_id == meeting_id)
+        if chat_room_id:
+            query = query.filter(model.chat_room_id == chat_room_id)
+        return query
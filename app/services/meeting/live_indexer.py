@@ -0,0 +1,192 @@
+import asyncio
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+from app.config import settings
+from app.core.db import SessionLocal
+from app.core.logger import setup_logger
+from app.core.schemas import Meeting
+
+logger = setup_logger(__name__)
+
+
+class LiveSegmentIndexer:
+    """
+    회의 진행 중 segment 실시간 색인 (micro-batch)
+
+    chunk STT 결과가 commit될 때마다 submit()으로 넣으면
+    window_ms 또는 batch_size 단위로 모아 회의별 collection에 upsert 한다.
+    - segment_id 기준 upsert: 같은 텍스트면 임베딩 생략, 보정된 텍스트면 제자리 갱신
+    - 재업로드로 사라진 segment는 delete()로 제거 (요청 순서대로 반영)
+    - 회의 종료 파이프라인 전에 flush()로 대기열을 비운다
+    """
+
+    _instance = None
+
+    @classmethod
+    def get_instance(cls) -> "LiveSegmentIndexer":
+        if cls._instance is None:
+            cls._instance = cls(
+                batch_size=settings.LIVE_INDEX_BATCH_SIZE,
+                window_ms=settings.LIVE_INDEX_WINDOW_MS
+            )
+        return cls._instance
+
+    def __init__(self, batch_size: int = 64, window_ms: int = 2000):
+        self.batch_size = max(1, batch_size)
+        self.window_seconds = window_ms / 1000
+
+        self.queue: Optional[asyncio.Queue] = None
+        self.worker: Optional[asyncio.Task] = None
+
+        self.vector_store = None
+        self.meeting_starts: Dict[str, int] = {}
+
+    def submit(self, meeting_id: str, segments: List[Dict]):
+        """
+        segment 색인 요청 (대기하지 않음)
+
+        segments: segment_id, user_id, speaker_name, text, confidence,
+                  start_time_ms, end_time_ms (회의 시작 기준 상대시간)
+        """
+        if not settings.LIVE_SEGMENT_INDEXING or not segments:
+            return
+
+        self._ensure_worker()
+        self.queue.put_nowait((meeting_id, segments))
+
+    def delete(self, meeting_id: str, segment_ids: Iterable[str]):
+        """색인된 segment 삭제 요청 (대기하지 않음, 앞선 submit 이후에 반영)"""
+        segment_ids = set(segment_ids)
+        if not settings.LIVE_SEGMENT_INDEXING or not segment_ids:
+            return
+
+        self._ensure_worker()
+        self.queue.put_nowait((meeting_id, segment_ids))
+
+    async def flush(self):
+        """현재 대기열까지 색인 완료를 기다림"""
+        if self.worker is None or self.worker.done():
+            return
+
+        marker = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait(marker)
+        await marker
+
+    def forget_meeting(self, meeting_id: str):
+        self.meeting_starts.pop(meeting_id, None)
+
+    async def close(self):
+        await self.flush()
+
+        if self.worker is not None:
+            self.worker.cancel()
+            self.worker = None
+
+    def _ensure_worker(self):
+        if self.worker is None or self.worker.done():
+            self.queue = self.queue or asyncio.Queue()
+            self.worker = asyncio.get_running_loop().create_task(self._run())
+            logger.info(
+                f"실시간 segment 색인 시작 "
+                f"(batch={self.batch_size}, window={self.window_seconds * 1000:.0f}ms)"
+            )
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+
+        while True:
+            items, markers = [], []
+            self._collect(await self.queue.get(), items, markers)
+            deadline = loop.time() + self.window_seconds
+
+            while not markers and sum(len(segs) for _, segs in items) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self.queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                self._collect(item, items, markers)
+
+            # 회의별로 묶어서 upsert / delete (나중 요청이 앞선 요청을 덮어씀)
+            upserts: Dict[str, Dict[str, Dict]] = {}
+            deletes: Dict[str, Set[str]] = {}
+            for meeting_id, payload in items:
+                meeting_upserts = upserts.setdefault(meeting_id, {})
+                meeting_deletes = deletes.setdefault(meeting_id, set())
+                if isinstance(payload, set):
+                    for segment_id in payload:
+                        meeting_upserts.pop(segment_id, None)
+                    meeting_deletes |= payload
+                else:
+                    for seg in payload:
+                        meeting_deletes.discard(seg["segment_id"])
+                        meeting_upserts[seg["segment_id"]] = seg
+
+            for meeting_id, segments in upserts.items():
+                try:
+                    await asyncio.to_thread(
+                        self._index, meeting_id, list(segments.values()), deletes[meeting_id]
+                    )
+                except Exception as e:
+                    # 실시간 색인 실패는 회의 종료 파이프라인에서 다시 색인됨
+                    logger.warning(f"[LiveIndex] {meeting_id} 색인 실패: {e}")
+
+            for marker in markers:
+                if not marker.done():
+                    marker.set_result(None)
+
+    @staticmethod
+    def _collect(
+        item: Union[Tuple[str, Union[List[Dict], Set[str]]], asyncio.Future],
+        items: List[Tuple[str, Union[List[Dict], Set[str]]]],
+        markers: List[asyncio.Future]
+    ):
+        if isinstance(item, asyncio.Future):
+            markers.append(item)
+        else:
+            items.append(item)
+
+    def _index(self, meeting_id: str, segments: List[Dict], stale_ids: Set[str]):
+        if self.vector_store is None:
+            from app.services.meeting.vectorStore_service import VectorStoreService
+            self.vector_store = VectorStoreService()
+
+        if stale_ids:
+            self.vector_store.delete_segments(stale_ids)
+            logger.info(f"[LiveIndex] {meeting_id}: 교체된 segment {len(stale_ids)}개 삭제")
+
+        if not segments:
+            return
+
+        start_ms = self._meeting_start(meeting_id)
+        if start_ms is None:
+            return
+
+        docs = [
+            {
+                **seg,
+                "absolute_start_ms": start_ms + seg["start_time_ms"],
+                "absolute_end_ms": start_ms + seg["end_time_ms"]
+            }
+            for seg in segments
+        ]
+
+        changed = self.vector_store.upsert_segments(meeting_id, docs)
+        logger.info(f"[LiveIndex] {meeting_id}: {len(docs)}개 중 {changed}개 임베딩")
+
+    def _meeting_start(self, meeting_id: str) -> Optional[int]:
+        if meeting_id not in self.meeting_starts:
+            db = SessionLocal()
+            try:
+                meeting = db.query(Meeting).filter(
+                    Meeting.meeting_id == meeting_id
+                ).first()
+            finally:
+                db.close()
+
+            if not meeting:
+                return None
+            self.meeting_starts[meeting_id] = meeting.start_server_timestamp
+
+        return self.meeting_starts[meeting_id]
@@ -210,6 +210,21 @@ class MeetingService:
             db.rollback()
             raise
     
+    @staticmethod
+    def ensure_in_progress(meeting_id: str, db: Session) -> Meeting:
+        """종료 가능한(진행 중) 회의인지 확인"""
+        meeting = db.query(Meeting).filter(
+            Meeting.meeting_id == meeting_id
+        ).first()
+
+        if not meeting:
+            raise ValueError(f"Meeting not found: {meeting_id}")
+
+        if meeting.status != "in_progress":
+            raise ValueError(f"Meeting not in progress: {meeting.status}")
+
+        return meeting
+
     # 회의 종료
     @staticmethod
     async def end_meeting(
@@ -222,15 +237,7 @@ class MeetingService:
             logger.info("="*60)
             
             # 1. 회의 확인
-            meeting = db.query(Meeting).filter(
-                Meeting.meeting_id == meeting_id
-            ).first()
-            
-            if not meeting:
-                raise ValueError(f"Meeting not found: {meeting_id}")
-            
-            if meeting.status != "in_progress":
-                raise ValueError(f"Meeting not in progress: {meeting.status}")
+            meeting = MeetingService.ensure_in_progress(meeting_id, db)
             
             # 2. 시간 계산
             end_timestamp = get_current_timestamp()
@@ -0,0 +1,432 @@
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+from sqlalchemy import delete, func, or_, select
+from sqlalchemy.dialects.sqlite import insert
+from app.config import settings
+from app.core.db import SessionLocal
+from app.core.logger import setup_logger
+from app.core.schemas import (
+    MeetingRuntimeState,
+    MeetingRuntimeUser,
+    MeetingProcessingChunk,
+    MeetingFinalizeStatus,
+    MeetingTimelineLock
+)
+
+logger = setup_logger(__name__)
+
+
+class MeetingStateStore(ABC):
+    """
+    진행 중 회의 상태 저장소 인터페이스
+
+    - last_chunk_time   : 마지막 chunk 수신 시간 (timeout 판단)
+    - active users      : 사용자별 마지막 chunk_index / is_last 수신 여부
+    - processing chunks : STT 처리 중인 chunk_id 집합
+    - finalize status   : wait=false 종료 처리 상태 (clear_meeting 후에도 유지)
+    - timeline lock     : 점진 타임라인 병합 lease (한 번에 한 worker만 병합)
+
+    모든 연산은 단건 원자 연산 (add / discard / check)
+    메서드를 모두 구현하지 않은 backend는 생성 시점에 TypeError
+
+    poll_seconds: 다른 프로세스가 상태를 바꿀 수 있는 저장소의 재확인 간격
+                  (None이면 같은 프로세스의 완료 이벤트만으로 충분)
+    """
+
+    poll_seconds: Optional[float] = None
+
+    @abstractmethod
+    def init_meeting(self, meeting_id: str):
+        """회의 상태 생성 (이미 있으면 그대로)"""
+
+    @abstractmethod
+    def exists(self, meeting_id: str) -> bool:
+        """진행 중 상태가 있는지"""
+
+    @abstractmethod
+    def touch(self, meeting_id: str):
+        """마지막 chunk 수신 시간 갱신"""
+
+    @abstractmethod
+    def get_last_chunk_time(self, meeting_id: str) -> Optional[datetime]:
+        """마지막 chunk 수신 시간 (상태가 없으면 None)"""
+
+    @abstractmethod
+    def set_active_user(self, meeting_id: str, user_id: int, chunk_index: int):
+        """사용자의 마지막 chunk_index 기록"""
+
+    @abstractmethod
+    def mark_last_chunk(self, meeting_id: str, user_id: int):
+        """사용자의 is_last chunk 수신 기록"""
+
+    @abstractmethod
+    def all_last_chunks_received(self, meeting_id: str) -> bool:
+        """모든 활성 사용자가 is_last chunk를 보냈는지 (활성 사용자가 없으면 True)"""
+
+    @abstractmethod
+    def add_processing(self, meeting_id: str, chunk_id: str):
+        """STT 처리 중 chunk 추가"""
+
+    @abstractmethod
+    def discard_processing(self, meeting_id: str, chunk_id: str):
+        """STT 처리 중 chunk 제거 (없으면 무시)"""
+
+    @abstractmethod
+    def processing_count(self, meeting_id: str) -> int:
+        """STT 처리 중 chunk 수"""
+
+    @abstractmethod
+    def clear_meeting(self, meeting_id: str):
+        """회의 상태 전체 삭제 (종료 처리 상태는 제외)"""
+
+    @abstractmethod
+    def claim_finalize(self, meeting_id: str) -> bool:
+        """
+        종료 처리 시작 (상태를 finalizing으로)
+
+        이미 다른 worker가 진행 중이면 False
+        (MEETING_FINALIZE_STALE_SECONDS 넘게 갱신이 없으면 중단된 것으로 보고 다시 시작)
+        """
+
+    @abstractmethod
+    def set_finalize_status(self, meeting_id: str, status: str, error: Optional[str] = None):
+        """종료 처리 상태 기록 (completed / failed)"""
+
+    @abstractmethod
+    def get_finalize_status(self, meeting_id: str) -> Optional[Dict]:
+        """{"status", "error"} (종료 처리를 시작한 적 없으면 None)"""
+
+    @abstractmethod
+    def acquire_timeline_lock(self, meeting_id: str, owner: str, lease_seconds: float) -> bool:
+        """타임라인 병합 lease 획득 (다른 owner의 lease가 유효하면 False)"""
+
+    @abstractmethod
+    def release_timeline_lock(self, meeting_id: str, owner: str):
+        """타임라인 병합 lease 해제 (owner가 다르면 무시)"""
+
+
+class InMemoryMeetingStateStore(MeetingStateStore):
+    """프로세스 내부 dict (uvicorn worker 1개일 때 기본값)"""
+
+    # 보관할 종료 처리 상태 수 (오래된 것부터 제거)
+    FINALIZE_STATUS_MAX = 1000
+
+    def __init__(self):
+        self.states: Dict[str, Dict] = {}
+        self.finalize_statuses: "OrderedDict[str, Dict]" = OrderedDict()
+        self.timeline_locks: Dict[str, Tuple[str, datetime]] = {}
+        self.lock = threading.Lock()
+
+    def init_meeting(self, meeting_id: str):
+        with self.lock:
+            if meeting_id not in self.states:
+                self.states[meeting_id] = {
+                    "last_chunk_time": datetime.now(),
+                    "active_users": {},
+                    "processing_chunks": set(),
+                    "last_chunks_received": {}
+                }
+
+    def exists(self, meeting_id: str) -> bool:
+        return meeting_id in self.states
+
+    def touch(self, meeting_id: str):
+        with self.lock:
+            if meeting_id in self.states:
+                self.states[meeting_id]["last_chunk_time"] = datetime.now()
+
+    def get_last_chunk_time(self, meeting_id: str) -> Optional[datetime]:
+        state = self.states.get(meeting_id)
+        return state["last_chunk_time"] if state else None
+
+    def set_active_user(self, meeting_id: str, user_id: int, chunk_index: int):
+        with self.lock:
+            if meeting_id in self.states:
+                self.states[meeting_id]["active_users"][user_id] = chunk_index
+
+    def mark_last_chunk(self, meeting_id: str, user_id: int):
+        with self.lock:
+            if meeting_id in self.states:
+                self.states[meeting_id]["last_chunks_received"][user_id] = True
+
+    def all_last_chunks_received(self, meeting_id: str) -> bool:
+        with self.lock:
+            state = self.states.get(meeting_id)
+            if state is None:
+                return True
+            return all(
+                state["last_chunks_received"].get(user_id, False)
+                for user_id in state["active_users"]
+            )
+
+    def add_processing(self, meeting_id: str, chunk_id: str):
+        with self.lock:
+            if meeting_id in self.states:
+                self.states[meeting_id]["processing_chunks"].add(chunk_id)
+
+    def discard_processing(self, meeting_id: str, chunk_id: str):
+        with self.lock:
+            if meeting_id in self.states:
+                self.states[meeting_id]["processing_chunks"].discard(chunk_id)
+
+    def processing_count(self, meeting_id: str) -> int:
+        state = self.states.get(meeting_id)
+        return len(state["processing_chunks"]) if state else 0
+
+    def clear_meeting(self, meeting_id: str):
+        with self.lock:
+            self.states.pop(meeting_id, None)
+
+    def claim_finalize(self, meeting_id: str) -> bool:
+        with self.lock:
+            current = self.finalize_statuses.get(meeting_id)
+            if current is not None and current["status"] == "finalizing" and not self._is_stale(current):
+                return False
+            self._put_finalize_status(meeting_id, "finalizing", None)
+            return True
+
+    def set_finalize_status(self, meeting_id: str, status: str, error: Optional[str] = None):
+        with self.lock:
+            self._put_finalize_status(meeting_id, status, error)
+
+    def get_finalize_status(self, meeting_id: str) -> Optional[Dict]:
+        current = self.finalize_statuses.get(meeting_id)
+        return {"status": current["status"], "error": current["error"]} if current else None
+
+    def _put_finalize_status(self, meeting_id: str, status: str, error: Optional[str]):
+        self.finalize_statuses[meeting_id] = {
+            "status": status,
+            "error": error,
+            "updated_at": datetime.now()
+        }
+        self.finalize_statuses.move_to_end(meeting_id)
+        while len(self.finalize_statuses) > self.FINALIZE_STATUS_MAX:
+            self.finalize_statuses.popitem(last=False)
+
+    @staticmethod
+    def _is_stale(current: Dict) -> bool:
+        age = datetime.now() - current["updated_at"]
+        return age > timedelta(seconds=settings.MEETING_FINALIZE_STALE_SECONDS)
+
+    def acquire_timeline_lock(self, meeting_id: str, owner: str, lease_seconds: float) -> bool:
+        now = datetime.now()
+        with self.lock:
+            current = self.timeline_locks.get(meeting_id)
+            if current is not None and current[0] != owner and current[1] > now:
+                return False
+            self.timeline_locks[meeting_id] = (owner, now + timedelta(seconds=lease_seconds))
+            return True
+
+    def release_timeline_lock(self, meeting_id: str, owner: str):
+        with self.lock:
+            current = self.timeline_locks.get(meeting_id)
+            if current is not None and current[0] == owner:
+                del self.timeline_locks[meeting_id]
+
+
+class SQLiteMeetingStateStore(MeetingStateStore):
+    """
+    앱 SQLite DB 테이블 기반 (여러 uvicorn worker가 같은 상태를 공유)
+
+    add/discard는 INSERT OR IGNORE / DELETE 단건 문으로 처리해
+    worker 간 경쟁에도 원자적이다.
+    """
+
+    poll_seconds = 0.25
+
+    def _execute(self, statement):
+        db = SessionLocal()
+        try:
+            result = db.execute(statement)
+            db.commit()
+            return result
+        finally:
+            db.close()
+
+    def _scalar(self, statement):
+        db = SessionLocal()
+        try:
+            return db.execute(statement).scalar()
+        finally:
+            db.close()
+
+    def init_meeting(self, meeting_id: str):
+        self._execute(
+            insert(MeetingRuntimeState)
+            .values(meeting_id=meeting_id, last_chunk_time=datetime.now())
+            .on_conflict_do_nothing()
+        )
+
+    def exists(self, meeting_id: str) -> bool:
+        return self._scalar(
+            select(MeetingRuntimeState.meeting_id)
+            .where(MeetingRuntimeState.meeting_id == meeting_id)
+        ) is not None
+
+    def touch(self, meeting_id: str):
+        self._execute(
+            MeetingRuntimeState.__table__.update()
+            .where(MeetingRuntimeState.meeting_id == meeting_id)
+            .values(last_chunk_time=datetime.now())
+        )
+
+    def get_last_chunk_time(self, meeting_id: str) -> Optional[datetime]:
+        return self._scalar(
+            select(MeetingRuntimeState.last_chunk_time)
+            .where(MeetingRuntimeState.meeting_id == meeting_id)
+        )
+
+    def set_active_user(self, meeting_id: str, user_id: int, chunk_index: int):
+        self._execute(
+            insert(MeetingRuntimeUser)
+            .values(meeting_id=meeting_id, user_id=user_id, last_chunk_index=chunk_index)
+            .on_conflict_do_update(
+                index_elements=["meeting_id", "user_id"],
+                set_={"last_chunk_index": chunk_index}
+            )
+        )
+
+    def mark_last_chunk(self, meeting_id: str, user_id: int):
+        self._execute(
+            insert(MeetingRuntimeUser)
+            .values(meeting_id=meeting_id, user_id=user_id, last_chunk_received=True)
+            .on_conflict_do_update(
+                index_elements=["meeting_id", "user_id"],
+                set_={"last_chunk_received": True}
+            )
+        )
+
+    def all_last_chunks_received(self, meeting_id: str) -> bool:
+        pending = self._scalar(
+            select(func.count())
+            .select_from(MeetingRuntimeUser)
+            .where(
+                MeetingRuntimeUser.meeting_id == meeting_id,
+                MeetingRuntimeUser.last_chunk_received.is_(False)
+            )
+        )
+        return pending == 0
+
+    def add_processing(self, meeting_id: str, chunk_id: str):
+        self._execute(
+            insert(MeetingProcessingChunk)
+            .values(meeting_id=meeting_id, chunk_id=chunk_id)
+            .on_conflict_do_nothing()
+        )
+
+    def discard_processing(self, meeting_id: str, chunk_id: str):
+        self._execute(
+            delete(MeetingProcessingChunk).where(
+                MeetingProcessingChunk.meeting_id == meeting_id,
+                MeetingProcessingChunk.chunk_id == chunk_id
+            )
+        )
+
+    def processing_count(self, meeting_id: str) -> int:
+        return self._scalar(
+            select(func.count())
+            .select_from(MeetingProcessingChunk)
+            .where(MeetingProcessingChunk.meeting_id == meeting_id)
+        )
+
+    def clear_meeting(self, meeting_id: str):
+        db = SessionLocal()
+        try:
+            for model in (MeetingRuntimeState, MeetingRuntimeUser, MeetingProcessingChunk):
+                db.execute(delete(model).where(model.meeting_id == meeting_id))
+            db.commit()
+        finally:
+            db.close()
+
+    def claim_finalize(self, meeting_id: str) -> bool:
+        # 진행 중(finalizing)이 아니거나 오래 갱신 없는 경우에만 갱신 → 한 worker만 성공
+        now = datetime.now()
+        stale_before = now - timedelta(seconds=settings.MEETING_FINALIZE_STALE_SECONDS)
+        result = self._execute(
+            insert(MeetingFinalizeStatus)
+            .values(meeting_id=meeting_id, status="finalizing", error=None, updated_at=now)
+            .on_conflict_do_update(
+                index_elements=["meeting_id"],
+                set_={"status": "finalizing", "error": None, "updated_at": now},
+                where=or_(
+                    MeetingFinalizeStatus.status != "finalizing",
+                    MeetingFinalizeStatus.updated_at < stale_before
+                )
+            )
+        )
+        return result.rowcount > 0
+
+    def set_finalize_status(self, meeting_id: str, status: str, error: Optional[str] = None):
+        now = datetime.now()
+        self._execute(
+            insert(MeetingFinalizeStatus)
+            .values(meeting_id=meeting_id, status=status, error=error, updated_at=now)
+            .on_conflict_do_update(
+                index_elements=["meeting_id"],
+                set_={"status": status, "error": error, "updated_at": now}
+            )
+        )
+
+    def get_finalize_status(self, meeting_id: str) -> Optional[Dict]:
+        db = SessionLocal()
+        try:
+            row = db.execute(
+                select(MeetingFinalizeStatus.status, MeetingFinalizeStatus.error)
+                .where(MeetingFinalizeStatus.meeting_id == meeting_id)
+            ).first()
+        finally:
+            db.close()
+        return {"status": row.status, "error": row.error} if row else None
+
+    def acquire_timeline_lock(self, meeting_id: str, owner: str, lease_seconds: float) -> bool:
+        # 없거나 만료된 lease만 가져감 → 한 worker만 성공
+        now = datetime.now()
+        lease_until = now + timedelta(seconds=lease_seconds)
+        result = self._execute(
+            insert(MeetingTimelineLock)
+            .values(meeting_id=meeting_id, owner=owner, lease_until=lease_until)
+            .on_conflict_do_update(
+                index_elements=["meeting_id"],
+                set_={"owner": owner, "lease_until": lease_until},
+                where=or_(
+                    MeetingTimelineLock.lease_until < now,
+                    MeetingTimelineLock.owner == owner
+                )
+            )
+        )
+        return result.rowcount > 0
+
+    def release_timeline_lock(self, meeting_id: str, owner: str):
+        self._execute(
+            delete(MeetingTimelineLock).where(
+                MeetingTimelineLock.meeting_id == meeting_id,
+                MeetingTimelineLock.owner == owner
+            )
+        )
+
+
+_store: Optional[MeetingStateStore] = None
+
+
+def get_meeting_state_store() -> MeetingStateStore:
+    """프로세스 공용 저장소 (AudioService, IncrementalTimeline이 같은 인스턴스 사용)"""
+    global _store
+    if _store is None:
+        _store = create_meeting_state_store()
+    return _store
+
+
+def create_meeting_state_store(backend: str = None) -> MeetingStateStore:
+    """settings.MEETING_STATE_BACKEND (memory / sqlite)에 맞는 저장소 생성"""
+    backend = backend or settings.MEETING_STATE_BACKEND
+
+    if backend == "sqlite":
+        logger.info("회의 상태 저장소: SQLite (worker 간 공유)")
+        return SQLiteMeetingStateStore()
+
+    if backend != "memory":
+        logger.warning(f"알 수 없는 MEETING_STATE_BACKEND={backend}, memory 사용")
+    return InMemoryMeetingStateStore()
@@ -0,0 +1,141 @@
+# app/services/meeting/migrate_segment_index.py
+# 회의별 segment collection → 단일 segment index 이전
+#   python app/services/meeting/migrate_segment_index.py            (복사만)
+#   python app/services/meeting/migrate_segment_index.py --drop     (복사 확인 후 이전 collection 삭제)
+#   python app/services/meeting/migrate_segment_index.py --dry-run
+import sys
+import argparse
+from pathlib import Path
+
+CURRENT_FILE = Path(__file__).resolve()
+ROOT_DIR = CURRENT_FILE.parents[3]   # .../MumulMumul
+sys.path.append(str(ROOT_DIR))
+
+from app.core.logger import setup_logger
+from app.services.meeting.vectorStore_service import VectorStoreService
+
+logger = setup_logger(__name__)
+
+PAGE_SIZE = 500
+
+
+def legacy_collection_names(client) -> list:
+    names = []
+    for collection in client.list_collections():
+        name = getattr(collection, "name", collection)
+        if (
+            name.startswith(VectorStoreService.LEGACY_SEGMENT_PREFIX)
+            and not name.startswith(VectorStoreService.SEGMENT_INDEX)
+        ):
+            names.append(name)
+    return sorted(names)
+
+
+def migrate_collection(vector_store: VectorStoreService, index, name: str, dry_run: bool) -> int:
+    """
+    collection 하나를 index로 복사 (저장된 임베딩 그대로 사용 → 재임베딩 없음)
+
+    Returns:
+        복사한 segment 수
+    """
+    client = vector_store.get_client()
+    source = client.get_collection(name)
+    meeting_id = name[len(VectorStoreService.LEGACY_SEGMENT_PREFIX):]
+
+    chat_room_id = VectorStoreService.get_chat_room_id(meeting_id)
+    if chat_room_id is None:
+        logger.warning(f"{name}: SQLite에 회의가 없음 → chat_room_id 없이 이전")
+
+    total = source.count()
+    if dry_run:
+        logger.info(f"{name}: {total}개 (dry-run)")
+        return total
+
+    copied = 0
+    for offset in range(0, total, PAGE_SIZE):
+        page = source.get(
+            include=["documents", "metadatas", "embeddings"],
+            limit=PAGE_SIZE,
+            offset=offset
+        )
+        if not page["ids"]:
+            break
+
+        metadatas = []
+        for metadata in page["metadatas"]:
+            metadata = dict(metadata or {})
+            metadata["meeting_id"] = meeting_id
+            if chat_room_id:
+                metadata["chat_room_id"] = chat_room_id
+            metadatas.append(metadata)
+
+        index.upsert(
+            ids=page["ids"],
+            embeddings=page["embeddings"],
+            metadatas=metadatas,
+            documents=page["documents"]
+        )
+        copied += len(page["ids"])
+
+    logger.info(f"{name}: {copied}/{total}개 이전")
+    return copied
+
+
+def verify_collection(vector_store: VectorStoreService, index, name: str) -> bool:
+    """이전 collection의 모든 id가 index에 있는지"""
+    source = vector_store.get_client().get_collection(name)
+    source_ids = set(source.get(include=[])["ids"])
+    if not source_ids:
+        return True
+
+    found = set(index.get(ids=list(source_ids), include=[])["ids"])
+    return found == source_ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description="회의별 segment collection → segment index 이전")
+    parser.add_argument("--drop", action="store_true", help="복사 확인 후 이전 collection 삭제")
+    parser.add_argument("--dry-run", action="store_true", help="대상과 개수만 출력")
+    args = parser.parse_args()
+
+    vector_store = VectorStoreService()
+    client = vector_store.get_client()
+
+    # 회의별 collection은 모두 OpenAI 임베딩 → 같은 모델의 index로만 옮길 수 있음
+    if vector_store.embedding_backend != "openai":
+        logger.error("이전 collection은 OpenAI 임베딩으로 만들어짐 → EMBEDDING_BACKEND=openai로 실행하세요")
+        sys.exit(1)
+
+    # 앱과 같은 설정으로 index collection 생성 (langchain Chroma 핸들의 원본 collection)
+    index = vector_store.get_segments_vectorstore()._collection
+
+    names = legacy_collection_names(client)
+    logger.info(f"이전 대상 collection {len(names)}개")
+
+    total, dropped, failed = 0, 0, []
+    for name in names:
+        try:
+            total += migrate_collection(vector_store, index, name, args.dry_run)
+
+            if args.drop and not args.dry_run:
+                if verify_collection(vector_store, index, name):
+                    client.delete_collection(name)
+                    dropped += 1
+                else:
+                    logger.error(f"{name}: index에 없는 segment가 있어 삭제하지 않음")
+                    failed.append(name)
+        except Exception as e:
+            logger.error(f"{name} 이전 실패: {e}", exc_info=True)
+            failed.append(name)
+
+    logger.info(
+        f"완료: collection {len(names)}개, segment {total}개, "
+        f"삭제 {dropped}개, 실패 {len(failed)}개"
+    )
+    if failed:
+        logger.info(f"실패 collection: {failed}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+import threading
+import numpy as np
+from typing import Dict, Optional, Tuple
+from app.core.logger import setup_logger
+from app.services.meeting.audio_chunk import AudioChunk
+
+logger = setup_logger(__name__)
+
+
+class _TailRing:
+    """고정 크기 ring buffer (화자별 마지막 N초 오디오)"""
+
+    def __init__(self, capacity: int, sample_rate: int):
+        self.buffer = np.zeros(capacity, dtype=np.float32)
+        self.capacity = capacity
+        self.sample_rate = sample_rate
+        self.write_pos = 0
+        self.filled = 0
+        self.chunk_index = -1
+
+    def push(self, samples: np.ndarray, chunk_index: int):
+        """새 청크의 마지막 capacity 샘플만 기록"""
+        tail = samples[-self.capacity:]
+        n = len(tail)
+
+        first = min(n, self.capacity - self.write_pos)
+        self.buffer[self.write_pos:self.write_pos + first] = tail[:first]
+        if first < n:
+            self.buffer[:n - first] = tail[first:]
+
+        self.write_pos = (self.write_pos + n) % self.capacity
+        self.filled = min(self.capacity, self.filled + n)
+        self.chunk_index = chunk_index
+
+    def read(self) -> np.ndarray:
+        """기록 순서대로 정렬된 복사본"""
+        if self.filled < self.capacity:
+            start = (self.write_pos - self.filled) % self.capacity
+            if start + self.filled <= self.capacity:
+                return self.buffer[start:start + self.filled].copy()
+            return np.concatenate([
+                self.buffer[start:],
+                self.buffer[:self.filled - (self.capacity - start)]
+            ])
+        return np.concatenate([
+            self.buffer[self.write_pos:],
+            self.buffer[:self.write_pos]
+        ])
+
+
+class OverlapBuffer:
+    """
+    (meeting_id, user_id)별 마지막 OVERLAP_SECONDS 오디오 보관
+
+    이전 chunk WAV를 디스크에서 다시 읽지 않고 메모리에서 overlap을 붙인다.
+    업로드 순서대로 swap()을 호출하면 직전 chunk의 꼬리를 돌려받는다.
+    """
+
+    _rings: Dict[Tuple[str, int], _TailRing] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def swap(
+        cls,
+        meeting_id: str,
+        user_id: int,
+        chunk_index: int,
+        chunk: AudioChunk,
+        overlap_seconds: float
+    ) -> Optional[AudioChunk]:
+        """
+        현재 chunk 꼬리를 저장하고, 직전 chunk(chunk_index - 1)의 꼬리를 반환
+
+        직전 chunk가 아니거나 샘플레이트가 다르면 None
+        """
+        key = (meeting_id, user_id)
+        capacity = int(overlap_seconds * chunk.sample_rate)
+
+        if capacity <= 0:
+            return None
+
+        with cls._lock:
+            ring = cls._rings.get(key)
+            prev_tail = None
+
+            if (
+                ring is not None
+                and ring.chunk_index == chunk_index - 1
+                and ring.sample_rate == chunk.sample_rate
+            ):
+                prev_tail = chunk.with_samples(ring.read())
+
+            if ring is None or ring.capacity != capacity or ring.sample_rate != chunk.sample_rate:
+                ring = _TailRing(capacity, chunk.sample_rate)
+                cls._rings[key] = ring
+
+            ring.push(chunk.samples, chunk_index)
+
+        return prev_tail
+
+    @classmethod
+    def clear_meeting(cls, meeting_id: str):
+        """회의 종료 시 해당 회의의 버퍼 해제"""
+        with cls._lock:
+            keys = [key for key in cls._rings if key[0] == meeting_id]
+            for key in keys:
+                del cls._rings[key]
+
+        if keys:
+            logger.debug(f"Overlap buffer 해제: {meeting_id} ({len(keys)}명)")
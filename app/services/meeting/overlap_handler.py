@@ -1,3 +1,5 @@
+import bisect
+import heapq
 from typing import List, Dict, Tuple
 from app.core.logger import setup_logger
 
@@ -17,56 +19,71 @@ class OverlapHandler:
     ) -> Dict[str, List[Dict]]:
         """
         모든 겹침 구간 감지 (음성-음성, 음성-채팅)
+
+        sweep line: 시작 시간순으로 훑으며 아직 끝나지 않은 음성 구간만 유지
+        - 음성-음성 : 인접 쌍이 아니라 겹치는 모든 쌍 (3명 이상 동시 발화 포함)
+        - 음성-채팅 : 정렬된 채팅 시각에서 음성 구간 [시작, 끝]을 이진 탐색
+        O((V + C) log n + k), k = 겹침 쌍 수
         """
         voice_voice_overlaps = []
         voice_chat_overlaps = []
 
-        # 음성 segment만 분리
-        voice_segs = [s for s in segments if s["type"] == "voice"]
-        chat_segs = [s for s in segments if s["type"] == "chat"]
+        # 음성 segment만 분리 (시작 시간순)
+        voice_segs = sorted(
+            (s for s in segments if s["type"] == "voice"),
+            key=lambda s: s["absolute_start_ms"]
+        )
+        chat_segs = sorted(
+            (s for s in segments if s["type"] == "chat"),
+            key=lambda s: s["absolute_start_ms"]
+        )
 
         # 1. 음성-음성 겹침 감지
-        for i in range(len(voice_segs) - 1):
-            current = voice_segs[i]
-            next_seg = voice_segs[i + 1]
-
-            # 다른 화자이면서 시간이 겹치는 경우
-            if current["user_id"] != next_seg["user_id"]:
-                overlap_start = max(
-                    current["absolute_start_ms"], 
-                    next_seg["absolute_start_ms"]
-                )
-                overlap_end = min(
-                    current["absolute_end_ms"], 
-                    next_seg["absolute_end_ms"]
-                )
-                overlap_duration = overlap_end - overlap_start
-
-                if overlap_duration > 0:
-                    voice_voice_overlaps.append({
-                        "segment1_id": current["segment_id"],
-                        "segment2_id": next_seg["segment_id"],
-                        "speaker1": current["speaker_name"],
-                        "speaker2": next_seg["speaker_name"],
-                        "overlap_duration_ms": overlap_duration,
-                        "overlap_start_ms": overlap_start,
-                        "overlap_end_ms": overlap_end
-                    })
+        active: List[Tuple[int, int, Dict]] = []     # (끝 시간, 순번, segment) min-heap
+
+        for order, current in enumerate(voice_segs):
+            start = current["absolute_start_ms"]
+
+            # 현재 시작 전에 끝난 구간 제거 (겹침 길이 0 이하)
+            while active and active[0][0] <= start:
+                heapq.heappop(active)
+
+            for end, _, earlier in active:
+                # 다른 화자이면서 시간이 겹치는 경우
+                if earlier["user_id"] == current["user_id"]:
+                    continue
+
+                overlap_end = min(end, current["absolute_end_ms"])
+                voice_voice_overlaps.append({
+                    "segment1_id": earlier["segment_id"],
+                    "segment2_id": current["segment_id"],
+                    "speaker1": earlier["speaker_name"],
+                    "speaker2": current["speaker_name"],
+                    "overlap_duration_ms": overlap_end - start,
+                    "overlap_start_ms": start,
+                    "overlap_end_ms": overlap_end
+                })
+
+            heapq.heappush(active, (current["absolute_end_ms"], order, current))
         
         # 2. 음성-채팅 겹침 감지
+        chat_times = [chat_seg["absolute_start_ms"] for chat_seg in chat_segs]
+
         for voice_seg in voice_segs:
-            for chat_seg in chat_segs:
-                # 채팅 시간이 음성 구간 안에 있으면
-                if (voice_seg["absolute_start_ms"] <= chat_seg["absolute_start_ms"] <= voice_seg["absolute_end_ms"]):
-                    voice_chat_overlaps.append({
-                        "voice_segment_id": voice_seg["segment_id"],
-                        "chat_segment_id": chat_seg["segment_id"],
-                        "voice_speaker": voice_seg["speaker_name"],
-                        "chat_speaker": chat_seg["speaker_name"],
-                        "chat_timestamp_ms": chat_seg["absolute_start_ms"],
-                        "voice_start_ms": voice_seg["absolute_start_ms"],
-                        "voice_end_ms": voice_seg["absolute_end_ms"]
-                    })
+            # 채팅 시간이 음성 구간 안에 있으면
+            lo = bisect.bisect_left(chat_times, voice_seg["absolute_start_ms"])
+            hi = bisect.bisect_right(chat_times, voice_seg["absolute_end_ms"])
+
+            for chat_seg in chat_segs[lo:hi]:
+                voice_chat_overlaps.append({
+                    "voice_segment_id": voice_seg["segment_id"],
+                    "chat_segment_id": chat_seg["segment_id"],
+                    "voice_speaker": voice_seg["speaker_name"],
+                    "chat_speaker": chat_seg["speaker_name"],
+                    "chat_timestamp_ms": chat_seg["absolute_start_ms"],
+                    "voice_start_ms": voice_seg["absolute_start_ms"],
+                    "voice_end_ms": voice_seg["absolute_end_ms"]
+                })
         
         logger.info(
             f"겹침 감지 완료\n"
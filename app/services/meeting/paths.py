@@ -3,6 +3,13 @@ from app.config import settings
 
 class PathManager:
     """로컬 파일 시스템 경로 관리"""
+
+    # chunk 저장 포맷별 확장자 (읽기 시에는 모든 확장자를 확인)
+    CHUNK_EXTENSIONS = {
+        "wav": ".wav",
+        "flac": ".flac",
+        "opus": ".opus",
+    }
     
     @staticmethod
     def get_meeting_dir(meeting_id: str) -> Path:
@@ -33,9 +40,31 @@ class PathManager:
         return user_dir
     
     @staticmethod
-    def get_chunk_path(meeting_id: str, user_id: str, chunk_index: int) -> Path:
-        """특정 chunk 파일 경로"""
-        return PathManager.get_user_chunk_dir(meeting_id, user_id) / f"chunk_{chunk_index}.wav"
+    def get_chunk_path(
+        meeting_id: str,
+        user_id: str,
+        chunk_index: int,
+        storage_format: str = None
+    ) -> Path:
+        """특정 chunk 파일 경로 (저장용, 기본은 settings.CHUNK_STORAGE_FORMAT)"""
+        ext = PathManager.CHUNK_EXTENSIONS[storage_format or settings.CHUNK_STORAGE_FORMAT]
+        return PathManager.get_user_chunk_dir(meeting_id, user_id) / f"chunk_{chunk_index}{ext}"
+
+    @staticmethod
+    def find_chunk_path(meeting_id: str, user_id: str, chunk_index: int) -> Path | None:
+        """저장된 chunk 파일 찾기 (포맷 무관, 없으면 None)"""
+        user_dir = PathManager.get_user_chunk_dir(meeting_id, user_id)
+        for ext in PathManager.CHUNK_EXTENSIONS.values():
+            path = user_dir / f"chunk_{chunk_index}{ext}"
+            if path.exists():
+                return path
+        return None
+
+    @staticmethod
+    def iter_chunk_files(user_dir: Path):
+        """사용자 chunk 디렉토리의 모든 chunk 파일 (포맷 무관)"""
+        for ext in PathManager.CHUNK_EXTENSIONS.values():
+            yield from user_dir.glob(f"chunk_*{ext}")
     
 
 path_manager = PathManager()
\ No newline at end of file
@@ -1,12 +1,15 @@
+import asyncio
 import json
 import os
 from pathlib import Path
 from sqlalchemy.orm import Session
+from app.config import settings
 from app.core.logger import setup_logger
 from app.core.db import SessionLocal
 from app.core.mongodb import get_mongo_db, MeetingTranscript, MeetingSegment, OverlapInfo, MeetingSummary
 from app.core.schemas import Meeting
 from app.services.meeting.timeline_service import TimelineService
+from app.services.meeting.incremental_timeline import IncrementalTimeline
 from app.services.meeting.chat_service import ChatService
 from app.services.meeting.text_processor import TextProcessor
 from app.services.meeting.mongodb_service import MongoMeetingService
@@ -78,12 +81,22 @@ class RAGPipelineService:
                 logger.info(f"채팅 메시지: {len(chat_messages)}개")
 
             # ===== 3. 음성 + 채팅 타임라인 병합 =====
-            logger.info("타임라인 병합 (음성 + 채팅)")
-            merged_data = self.timeline_service.merge_timeline(
-                db = db,
-                meeting_id = meeting_id,
-                chat_messages = chat_messages
-            )
+            if settings.INCREMENTAL_TIMELINE:
+                # 회의 중 확정된 구간은 이미 병합/후처리됨 → tail + 채팅만 처리
+                logger.info("타임라인 병합 (점진 병합 tail + 채팅)")
+                merged_data = await IncrementalTimeline.finalize(
+                    db = db,
+                    meeting_id = meeting_id,
+                    chat_messages = chat_messages,
+                    use_llm = True
+                )
+            else:
+                logger.info("타임라인 병합 (음성 + 채팅)")
+                merged_data = self.timeline_service.merge_timeline(
+                    db = db,
+                    meeting_id = meeting_id,
+                    chat_messages = chat_messages
+                )
             
             if not merged_data["segments"]:
                 logger.warning("segment가 없어서 파이프라인 종료")
@@ -96,55 +109,50 @@ class RAGPipelineService:
             )
 
             # ===== 4. 텍스트 후처리 =====
-            logger.info("4. 텍스트 후처리")
-            
-            processed_segments = await self.text_processor.process_segments(
-                segments=merged_data["segments"],
-                use_llm=True  # LLM 보정 사용
-            )
-            
-            # 후처리된 segment로 교체
-            merged_data["segments"] = processed_segments
-            merged_data["total_segments"] = len(processed_segments)
-            
-            # 전체 텍스트도 재생성
-            merged_data["full_text"] = self._regenerate_full_text(processed_segments)
-            
-            logger.info(f"후처리 완료: {len(processed_segments)}개 segment")
+            if not settings.INCREMENTAL_TIMELINE:
+                logger.info("4. 텍스트 후처리")
+                
+                processed_segments = await self.text_processor.process_segments(
+                    segments=merged_data["segments"],
+                    use_llm=True,  # LLM 보정 사용
+                    meeting_id=meeting_id
+                )
+                
+                # 후처리된 segment로 교체
+                merged_data["segments"] = processed_segments
+                merged_data["total_segments"] = len(processed_segments)
+                
+                # 전체 텍스트도 재생성
+                merged_data["full_text"] = self._regenerate_full_text(processed_segments)
+                
+                logger.info(f"후처리 완료: {len(processed_segments)}개 segment")
+            else:
+                merged_data["full_text"] = self._regenerate_full_text(merged_data["segments"])
+
+            cache_stats = TextProcessor.pop_cache_stats(meeting_id)
+            if cache_stats["lookups"]:
+                logger.info(
+                    f"보정 캐시 hit rate: {cache_stats['hits']}/{cache_stats['lookups']} "
+                    f"({cache_stats['hits'] / cache_stats['lookups'] * 100:.1f}%)"
+                )
+
+            # ===== 5~6. 저장 + LLM 분석 (서로 독립인 단계는 동시에) =====
+            #
+            #   transcript ─┬─ MongoDB 전사본 저장
+            #               ├─ ChromaDB segment 임베딩
+            #               └─ LLM 요약 생성 ─┬─ MongoDB 요약
+            #                                 ├─ ChromaDB 요약 임베딩
+            #                                 └─ JSON 파일
+            logger.info("2. MongoDB & ChromaDB 저장 + 3. LLM 요약 생성 (동시)")
 
-            # ===== 5. 데이터 저장 =====
-            logger.info("2. MongoDB & ChromaDB 저장")
-            
-            # MongoDB 전사본 저장
             transcript = self._create_transcript(db, meeting_id, merged_data)
-            self.mongo_service.save_transcript(transcript)
-            logger.info("MongoDB에 전사본 저장")
-            
-            # ChromaDB 임베딩 저장
-            self.vector_store.add_segments_batch(
-                meeting_id=meeting_id,
-                segments=merged_data["segments"]
-            )
-            logger.info("ChromaDB에 segment 임베딩 저장")
-            
 
-            # ===== 6. LLM 분석 =====
-            logger.info("3. LLM 요약 생성")
-            
-            summary = await self.rag_service.generate_meeting_summary(
-                meeting_id=meeting_id,
-                full_text=transcript.full_text,
-                segments=merged_data["segments"],
-                speakers=merged_data["speakers"]
+            await self._run_concurrently(
+                self._save_transcript(transcript),
+                self._embed_segments(meeting_id, merged_data["segments"]),
+                self._summarize_and_save(meeting_id, merged_data, transcript)
             )
-            logger.info("요약 생성 완료")
-            
-            # 요약본 4곳 저장
-            await self._save_summary_all_stores(
-                db, meeting_id, summary, transcript
-            )
-            logger.info("요약본 모든 저장소에 저장 완료")
-            
+
             logger.info("="*60)
             logger.info(f"RAG Pipeline 완료: {meeting_id}")
             logger.info(f"   Segments: {merged_data['total_segments']}")
@@ -158,6 +166,45 @@ class RAGPipelineService:
         finally:
             db.close()
     
+    @staticmethod
+    async def _run_concurrently(*branches):
+        """모든 branch가 끝날 때까지 기다린 뒤 첫 번째 실패를 다시 raise"""
+        results = await asyncio.gather(*branches, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
+    async def _save_transcript(self, transcript: MeetingTranscript):
+        await asyncio.to_thread(self.mongo_service.save_transcript, transcript)
+        logger.info("MongoDB에 전사본 저장")
+
+    async def _embed_segments(self, meeting_id: str, segments: list):
+        await asyncio.to_thread(
+            self.vector_store.add_segments_batch,
+            meeting_id=meeting_id,
+            segments=segments
+        )
+        logger.info("ChromaDB에 segment 임베딩 저장")
+
+    async def _summarize_and_save(
+        self,
+        meeting_id: str,
+        merged_data: dict,
+        transcript: MeetingTranscript
+    ):
+        summary = await self.rag_service.generate_meeting_summary(
+            meeting_id=meeting_id,
+            full_text=transcript.full_text,
+            segments=merged_data["segments"],
+            speakers=merged_data["speakers"]
+        )
+        logger.info("요약 생성 완료")
+
+        # 요약본 4곳 저장
+        await self._save_summary_all_stores(meeting_id, summary, transcript)
+        logger.info("요약본 모든 저장소에 저장 완료")
+
     def _regenerate_full_text(self, segments: list) -> str:
         """후처리된 segment로 전체 텍스트 재생성"""
         lines = []
@@ -256,12 +303,11 @@ class RAGPipelineService:
     
     async def _save_summary_all_stores(
         self,
-        db: Session,
         meeting_id: str,
         summary: dict,
         transcript: MeetingTranscript
     ):
-        """요약본을 4곳에 저장"""
+        """요약본을 4곳에 저장 (서로 독립이므로 동시에, blocking I/O는 thread에서)"""
         
         logger.info("요약본 저장 중...")
         
@@ -275,26 +321,44 @@ class RAGPipelineService:
             decisions=summary.get("decisions", []),
             model_used=summary.get("model", "gpt-4o-mini")
         )
-        self.mongo_service.save_summary(mongo_summary)
-        logger.info("MongoDB")
         
         # 2. ChromaDB 임베딩
-        self.vector_store.add_summary(
-            meeting_id=meeting_id,
-            summary_text=summary["summary_text"],
-            metadata={
-                "title": transcript.title,
-                "date": transcript.start_time,
-                "participant_count": transcript.participant_count,
-                "duration_ms": transcript.duration_ms
-            }
-        )
-        logger.info("ChromaDB")
+        summary_metadata = {
+            "title": transcript.title,
+            "date": transcript.start_time,
+            "participant_count": transcript.participant_count,
+            "duration_ms": transcript.duration_ms
+        }
         
         # 3. SQLite 저장 (TODO: 나중에 추가)
         logger.info("SQLite (TODO)")
         
-        # 4. JSON 파일 저장
+        await self._run_concurrently(
+            self._logged(
+                "MongoDB",
+                asyncio.to_thread(self.mongo_service.save_summary, mongo_summary)
+            ),
+            self._logged(
+                "ChromaDB",
+                asyncio.to_thread(
+                    self.vector_store.add_summary,
+                    meeting_id=meeting_id,
+                    summary_text=summary["summary_text"],
+                    metadata=summary_metadata
+                )
+            ),
+            # 4. JSON 파일 저장
+            asyncio.to_thread(self._write_summary_json, meeting_id, summary, transcript)
+        )
+
+    @staticmethod
+    async def _logged(label: str, awaitable):
+        result = await awaitable
+        logger.info(label)
+        return result
+
+    @staticmethod
+    def _write_summary_json(meeting_id: str, summary: dict, transcript: MeetingTranscript):
         summary_dir = PathManager.get_meeting_dir(meeting_id) / "summaries"
         summary_dir.mkdir(parents=True, exist_ok=True)
         
@@ -315,4 +379,4 @@ class RAGPipelineService:
         with open(summary_path, "w", encoding="utf-8") as f:
             json.dump(summary_data, f, ensure_ascii=False, indent=2)
     
-        logger.info(f"JSON: {summary_path}")
\ No newline at end of file
+        logger.info(f"JSON: {summary_path}")
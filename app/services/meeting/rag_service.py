@@ -2,22 +2,38 @@ from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from app.config import settings
 from app.core.logger import setup_logger
-from typing import Dict, List
+from app.services.meeting.summary_cache import WindowSummaryCache
+from typing import Dict, List, Optional
+import asyncio
 import json
 
 logger = setup_logger(__name__)
 
 
+SUMMARY_SCHEMA = """{{
+            "summary_text": "전체 요약 (3-5문장)",
+            "key_points": ["핵심 포인트 1", "핵심 포인트 2", ...],
+            "action_items": ["실행 항목 1", "실행 항목 2", ...],
+            "decisions": ["결정 사항 1", "결정 사항 2", ...],
+            "next_agenda": ["다음 회의 안건 1", "다음 회의 안건 2", ...]
+            }}"""
+
+SUMMARY_LIST_FIELDS = ("key_points", "action_items", "decisions", "next_agenda")
+
+
 class RAGService:
     """LLM 기반 요약 및 분석"""
-    
+
+    # 진행 중인 window 요약 (회의 중 미리 요약과 종료 시 요약이 겹치면 한 번만 호출)
+    _inflight: Dict[str, asyncio.Task] = {}
+
     def __init__(self):
         self.llm = ChatOpenAI(
             model=settings.LLM_MODEL,
             api_key=settings.OPENAI_API_KEY,
             temperature=0.3
         )
-    
+
     async def generate_meeting_summary(
         self,
         meeting_id: str,
@@ -25,35 +41,57 @@ class RAGService:
         segments: List[Dict],
         speakers: List[Dict]
     ) -> Dict:
-        """회의 요약 생성"""
-        
+        """
+        회의 요약 생성
+
+        - full_text가 SUMMARY_SINGLE_PASS_MAX_CHARS 이하 : 한 번에 요약
+        - 그보다 길면 : 시간 window별 요약(동시) → 합치기 (회의 전체 반영)
+        """
+
         logger.info(f"요약 생성 시작: {meeting_id}")
-        
+
         # 화자 정보 요약
         speaker_info = "\n".join([
             f"- {s['name']}: {s['segment_count']}개 발화, "
             f"{s['total_duration_ms']//1000}초 발화"
             for s in speakers
         ])
-        
-        # 프롬프트 템플릿
+
+        try:
+            if len(full_text) <= settings.SUMMARY_SINGLE_PASS_MAX_CHARS or not segments:
+                summary_data = await self._summarize_transcript(speaker_info, full_text)
+            else:
+                partials = await self.summarize_windows(meeting_id, segments)
+                summary_data = await self._reduce_summaries(partials, speaker_info)
+                WindowSummaryCache.forget(meeting_id)
+
+            summary_data["model"] = settings.LLM_MODEL
+
+            logger.info("요약 생성 완료")
+            logger.info(f"  Key points: {len(summary_data.get('key_points', []))}")
+            logger.info(f"  Action items: {len(summary_data.get('action_items', []))}")
+
+            return summary_data
+
+        except Exception as e:
+            logger.error(f"요약 생성 실패: {e}", exc_info=True)
+            raise
+
+    # -----------------
+    # 한 번에 요약
+    # -----------------
+    async def _summarize_transcript(self, speaker_info: str, full_text: str) -> Dict:
         prompt = ChatPromptTemplate.from_messages([
-            ("system", 
-            """당신은 회의록 전문 분석가입니다. 
+            ("system",
+            """당신은 회의록 전문 분석가입니다.
             주어진 회의 내용을 분석하여 JSON 형식으로 요약하세요.
 
             다음 JSON 구조를 반드시 따르세요:
-            {{
-            "summary_text": "전체 요약 (3-5문장)",
-            "key_points": ["핵심 포인트 1", "핵심 포인트 2", ...],
-            "action_items": ["실행 항목 1", "실행 항목 2", ...],
-            "decisions": ["결정 사항 1", "결정 사항 2", ...],
-            "next_agenda": ["다음 회의 안건 1", "다음 회의 안건 2", ...]
-            }}
+            """ + SUMMARY_SCHEMA + """
 
             명확하고 간결하게 작성하세요."""),
-            
-            ("human", 
+
+            ("human",
             """회의 정보:
             참석자:
             {speaker_info}
@@ -63,53 +101,259 @@ class RAGService:
 
             위 회의 내용을 JSON 형식으로 요약해주세요.""")
         ])
-        
-        chain = prompt | self.llm
-        
+
+        # 토큰 제한 고려하여 텍스트 자르기
+        max_chars = settings.SUMMARY_SINGLE_PASS_MAX_CHARS  # 약 3000 토큰
+        transcript_text = full_text[:max_chars]
+        if len(full_text) > max_chars:
+            transcript_text += "\n\n... (이하 생략)"
+
+        return await self._invoke_json(prompt, {
+            "speaker_info": speaker_info,
+            "transcript": transcript_text
+        })
+
+    # -----------------
+    # window 요약 (map)
+    # -----------------
+    async def summarize_windows(
+        self,
+        meeting_id: str,
+        segments: List[Dict],
+        until_ms: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        시간 window별 요약 (SUMMARY_MAP_CONCURRENCY개씩 동시, 시간순 반환)
+
+        until_ms: 이 시각 이전에 끝나는 window만 요약 (회의 중 미리 요약용)
+        이미 요약한 window는 WindowSummaryCache에서 재사용
+        """
+        windows = self.split_windows(segments)
+        if until_ms is not None:
+            windows = [w for w in windows if w["window_end_ms"] <= until_ms]
+        if not windows:
+            return []
+
+        await WindowSummaryCache.preload(meeting_id)
+
+        semaphore = asyncio.Semaphore(max(1, settings.SUMMARY_MAP_CONCURRENCY))
         try:
-            # 토큰 제한 고려하여 텍스트 자르기
-            max_chars = 12000  # 약 3000 토큰
-            transcript_text = full_text[:max_chars]
-            if len(full_text) > max_chars:
-                transcript_text += "\n\n... (이하 생략)"
-            
-            response = await chain.ainvoke({
-                "speaker_info": speaker_info,
-                "transcript": transcript_text
+            partials = await asyncio.gather(*[
+                self._summarize_window(meeting_id, window, semaphore)
+                for window in windows
+            ])
+        finally:
+            # 새로 요약한 window를 한 번에 파일로 (일부 실패해도 성공분은 저장)
+            await WindowSummaryCache.save(meeting_id)
+
+        logger.info(f"[Summary] {meeting_id}: window {len(windows)}개 요약")
+        return list(partials)
+
+    @staticmethod
+    def split_windows(segments: List[Dict]) -> List[Dict]:
+        """
+        segment를 SUMMARY_WINDOW_MINUTES 단위 시간 window로 나눔
+
+        window 경계는 회의 시작 기준 고정 격자 → 회의 중/종료 후 같은 window가 나온다
+        텍스트가 SUMMARY_WINDOW_MAX_CHARS를 넘는 window는 순서대로 다시 나눈다
+        """
+        window_ms = max(1, settings.SUMMARY_WINDOW_MINUTES) * 60_000
+        max_chars = settings.SUMMARY_WINDOW_MAX_CHARS
+
+        grouped: Dict[int, List[str]] = {}
+        for seg in sorted(segments, key=lambda x: x["start_time_ms"]):
+            relative_ms = seg["start_time_ms"]
+            minutes = relative_ms // 60000
+            seconds = (relative_ms % 60000) // 1000
+            line = f"[{minutes:02d}:{seconds:02d}] [{seg['speaker_name']}] {seg['text']}"
+            grouped.setdefault(relative_ms // window_ms, []).append(line)
+
+        windows = []
+        for index, lines in sorted(grouped.items()):
+            parts, current, size = [], [], 0
+            for line in lines:
+                if current and size + len(line) + 1 > max_chars:
+                    parts.append(current)
+                    current, size = [], 0
+                current.append(line)
+                size += len(line) + 1
+            parts.append(current)
+
+            for part in parts:
+                windows.append({
+                    "window_start_ms": index * window_ms,
+                    "window_end_ms": (index + 1) * window_ms,
+                    "text": "\n".join(part)
+                })
+
+        return windows
+
+    async def _summarize_window(
+        self,
+        meeting_id: str,
+        window: Dict,
+        semaphore: asyncio.Semaphore
+    ) -> Dict:
+        key = WindowSummaryCache.key(window["text"])
+
+        cached = WindowSummaryCache.get(meeting_id, key)
+        if cached is not None:
+            return cached
+
+        inflight_key = f"{meeting_id}:{key}"
+        task = self._inflight.get(inflight_key)
+        if task is None:
+            task = asyncio.create_task(
+                self._summarize_window_uncached(meeting_id, key, window, semaphore)
+            )
+            self._inflight[inflight_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(inflight_key, None))
+
+        return await asyncio.shield(task)
+
+    async def _summarize_window_uncached(
+        self,
+        meeting_id: str,
+        key: str,
+        window: Dict,
+        semaphore: asyncio.Semaphore
+    ) -> Dict:
+        prompt = ChatPromptTemplate.from_messages([
+            ("system",
+            """당신은 회의록 전문 분석가입니다.
+            긴 회의의 일부 구간이 주어집니다. 이 구간만 분석하여 JSON 형식으로 요약하세요.
+
+            다음 JSON 구조를 반드시 따르세요:
+            """ + SUMMARY_SCHEMA + """
+
+            summary_text는 2-3문장으로, 이 구간에 없는 내용은 만들지 마세요."""),
+
+            ("human",
+            """회의 구간 ({time_range}):
+            {transcript}
+
+            위 구간을 JSON 형식으로 요약해주세요.""")
+        ])
+
+        async with semaphore:
+            partial = await self._invoke_json(prompt, {
+                "time_range": self._format_range(window),
+                "transcript": window["text"]
             })
-            
-            # JSON 파싱
-            content = response.content
-            
-            # ```json ... ``` 제거
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
-            
+
+        partial["window_start_ms"] = window["window_start_ms"]
+        partial["window_end_ms"] = window["window_end_ms"]
+
+        WindowSummaryCache.put(meeting_id, key, partial)
+        return partial
+
+    # -----------------
+    # 합치기 (reduce)
+    # -----------------
+    async def _reduce_summaries(self, partials: List[Dict], speaker_info: str) -> Dict:
+        """SUMMARY_REDUCE_FANIN개씩 묶어 합치기를 반복 → 최종 요약"""
+        fanin = max(2, settings.SUMMARY_REDUCE_FANIN)
+        semaphore = asyncio.Semaphore(max(1, settings.SUMMARY_MAP_CONCURRENCY))
+
+        async def reduce_group(group: List[Dict]) -> Dict:
+            async with semaphore:
+                merged = await self._reduce_once(group, speaker_info=None)
+            merged["window_start_ms"] = group[0]["window_start_ms"]
+            merged["window_end_ms"] = group[-1]["window_end_ms"]
+            return merged
+
+        level = 0
+        while len(partials) > fanin:
+            level += 1
+            groups = [partials[i:i + fanin] for i in range(0, len(partials), fanin)]
+            logger.info(f"[Summary] 중간 합치기 {level}단계: {len(partials)}개 → {len(groups)}개")
+            partials = list(await asyncio.gather(*[reduce_group(g) for g in groups]))
+
+        return await self._reduce_once(partials, speaker_info)
+
+    async def _reduce_once(self, partials: List[Dict], speaker_info: Optional[str]) -> Dict:
+        prompt = ChatPromptTemplate.from_messages([
+            ("system",
+            """당신은 회의록 전문 분석가입니다.
+            회의를 시간 구간별로 요약한 결과가 시간순으로 주어집니다.
+            모든 구간을 반영해 하나의 JSON 요약으로 합치세요.
+
+            다음 JSON 구조를 반드시 따르세요:
+            """ + SUMMARY_SCHEMA + """
+
+            중복 항목은 합치고, 뒤 구간에서 바뀐 결정은 최종 결정을 따르세요."""),
+
+            ("human",
+            """회의 정보:
+            참석자:
+            {speaker_info}
+
+            구간별 요약:
+            {partials}
+
+            위 구간별 요약을 하나의 JSON 요약으로 합쳐주세요.""")
+        ])
+
+        return await self._invoke_json(prompt, {
+            "speaker_info": speaker_info or "(생략)",
+            "partials": "\n\n".join(self._format_partial(p) for p in partials)
+        })
+
+    # -----------------
+    # 공통
+    # -----------------
+    async def _invoke_json(self, prompt: ChatPromptTemplate, inputs: Dict) -> Dict:
+        """LLM 호출 → JSON 파싱 (실패 시 응답 전체를 summary_text로)"""
+        chain = prompt | self.llm
+
+        response = await chain.ainvoke(inputs)
+
+        # JSON 파싱
+        content = response.content
+
+        # ```json ... ``` 제거
+        if "```json" in content:
+            content = content.split("```json")[1].split("```")[0].strip()
+        elif "```" in content:
+            content = content.split("```")[1].split("```")[0].strip()
+
+        try:
             summary_data = json.loads(content)
-            summary_data["model"] = settings.LLM_MODEL
-            
-            logger.info("요약 생성 완료")
-            logger.info(f"  Key points: {len(summary_data.get('key_points', []))}")
-            logger.info(f"  Action items: {len(summary_data.get('action_items', []))}")
-            
-            return summary_data
-        
         except json.JSONDecodeError as e:
             logger.error(f"JSON 파싱 실패: {e}")
             logger.error(f"응답 내용: {content}")
-            
+            summary_data = None
+
+        # JSON이지만 객체가 아닌 경우(리스트 등)도 같은 fallback
+        if not isinstance(summary_data, dict):
+            if summary_data is not None:
+                logger.error(f"JSON 객체가 아님: {type(summary_data).__name__}")
+
             # Fallback: 전체 텍스트를 summary_text로 사용
-            return {
-                "summary_text": content,
-                "key_points": [],
-                "action_items": [],
-                "decisions": [],
-                "next_agenda": [],
-                "model": settings.LLM_MODEL
-            }
-        
-        except Exception as e:
-            logger.error(f"요약 생성 실패: {e}", exc_info=True)
-            raise
\ No newline at end of file
+            summary_data = {"summary_text": content}
+
+        for field in SUMMARY_LIST_FIELDS:
+            summary_data.setdefault(field, [])
+        summary_data.setdefault("summary_text", "")
+
+        return summary_data
+
+    @staticmethod
+    def _format_range(window: Dict) -> str:
+        start = window["window_start_ms"] // 1000
+        end = window["window_end_ms"] // 1000
+        return f"{start // 60:02d}:{start % 60:02d} ~ {end // 60:02d}:{end % 60:02d}"
+
+    @classmethod
+    def _format_partial(cls, partial: Dict) -> str:
+        lines = [f"[{cls._format_range(partial)}]", f"요약: {partial.get('summary_text', '')}"]
+        labels = {
+            "key_points": "핵심",
+            "action_items": "실행 항목",
+            "decisions": "결정",
+            "next_agenda": "다음 안건"
+        }
+        for field, label in labels.items():
+            for item in partial.get(field, []):
+                lines.append(f"- {label}: {item}")
+        return "\n".join(lines)
@@ -68,4 +68,18 @@ class EndMeetingResponse(BaseModel):
     participant_count: int
     total_segments: int
     # waited_for_processing: bool = False
-    # wait_time_ms: int = 0
\ No newline at end of file
+    # wait_time_ms: int = 0
+
+class EndMeetingAcceptedResponse(BaseModel):
+    """회의 종료 접수 응답 (wait=false, 처리 대기/종료/RAG는 백그라운드)"""
+    meeting_id: str
+    status: str = "finalizing"
+    pipeline_id: str
+    status_url: str
+
+class EndMeetingStatusResponse(BaseModel):
+    """회의 종료 백그라운드 처리 상태"""
+    meeting_id: str
+    pipeline_id: str
+    status: str                    # finalizing / completed / failed
+    error: Optional[str] = None
@@ -0,0 +1,223 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Union
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from app.core.db import SessionLocal
+from app.core.logger import setup_logger
+from app.core.schemas import STTSegment
+from app.services.meeting.live_indexer import LiveSegmentIndexer
+from app.services.meeting.stt_job_queue import STTJobQueue
+
+logger = setup_logger(__name__)
+
+
+@dataclass
+class SegmentBatch:
+    """chunk 1개의 STT 결과 (segment row + 작업 완료 정보)"""
+    job_id: str
+    meeting_id: str
+    user_id: int
+    chunk_index: int
+    content_hash: Optional[str]
+    rows: List[Dict]
+    future: asyncio.Future
+    # 교체되어 사라진 이전 segment_id (실시간 색인에서도 삭제)
+    stale_segment_ids: List[str] = field(default_factory=list)
+
+
+class SegmentWriter:
+    """
+    STTSegment write-behind writer
+
+    chunk마다 세션을 열고 commit하던 방식 대신, 대기열에 모인 chunk 결과를
+    flush_ms 또는 max_rows 단위로 한 트랜잭션에서 bulk insert 한다.
+    (SQLite write lock 경합 감소)
+
+    - write : chunk 결과를 넣고 commit될 때까지 대기 (True: 저장 / False: 새 업로드로 대체됨)
+    - flush : 대기열에 쌓인 결과를 즉시 기록 (회의 종료 시)
+    - close : flush 후 worker 종료 (앱 종료 시)
+    """
+
+    def __init__(self, flush_ms: int = 200, max_rows: int = 500):
+        self.flush_seconds = flush_ms / 1000
+        self.max_rows = max(1, max_rows)
+
+        self.queue: Optional[asyncio.Queue] = None
+        self.worker: Optional[asyncio.Task] = None
+
+    async def write(
+        self,
+        job_id: str,
+        meeting_id: str,
+        user_id: int,
+        chunk_index: int,
+        content_hash: Optional[str],
+        rows: List[Dict]
+    ) -> bool:
+        self._ensure_worker()
+
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put(SegmentBatch(
+            job_id=job_id,
+            meeting_id=meeting_id,
+            user_id=user_id,
+            chunk_index=chunk_index,
+            content_hash=content_hash,
+            rows=rows,
+            future=future
+        ))
+
+        return await future
+
+    async def flush(self):
+        """현재 대기열까지 기록 완료를 기다림"""
+        if self.worker is None or self.worker.done():
+            return
+
+        marker = asyncio.get_running_loop().create_future()
+        await self.queue.put(marker)
+        await marker
+
+    async def close(self):
+        await self.flush()
+
+        if self.worker is not None:
+            self.worker.cancel()
+            self.worker = None
+
+        logger.info("Segment writer 종료")
+
+    def _ensure_worker(self):
+        if self.worker is None or self.worker.done():
+            self.queue = self.queue or asyncio.Queue()
+            self.worker = asyncio.get_running_loop().create_task(self._run())
+            logger.info(
+                f"Segment writer 시작 "
+                f"(flush={self.flush_seconds * 1000:.0f}ms, max_rows={self.max_rows})"
+            )
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batches, markers = [], []
+            self._collect(await self.queue.get(), batches, markers)
+            deadline = loop.time() + self.flush_seconds
+
+            # flush 요청이 없으면 시간 창 / 최대 row 수까지 수집
+            while not markers and sum(len(b.rows) for b in batches) < self.max_rows:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self.queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                self._collect(item, batches, markers)
+
+            if batches:
+                results = await asyncio.to_thread(self._flush_batches, batches)
+                for batch, result in zip(batches, results):
+                    if batch.future.done():
+                        continue
+                    if isinstance(result, Exception):
+                        batch.future.set_exception(result)
+                    else:
+                        # 새 segment 색인 요청보다 먼저 큐에 넣어 순서 보장
+                        if result and batch.stale_segment_ids:
+                            LiveSegmentIndexer.get_instance().delete(
+                                batch.meeting_id, batch.stale_segment_ids
+                            )
+                        batch.future.set_result(result)
+
+            for marker in markers:
+                if not marker.done():
+                    marker.set_result(None)
+
+    @staticmethod
+    def _collect(
+        item: Union[SegmentBatch, asyncio.Future],
+        batches: List[SegmentBatch],
+        markers: List[asyncio.Future]
+    ):
+        if isinstance(item, SegmentBatch):
+            batches.append(item)
+        else:
+            markers.append(item)
+
+    # -----------------
+    # DB 기록 (동기, 스레드에서 실행)
+    # -----------------
+    def _flush_batches(self, batches: List[SegmentBatch]) -> List[Union[bool, Exception]]:
+        """
+        한 트랜잭션에서 기록, 실패 시 chunk별로 나눠 재시도해 실패 chunk만 골라낸다
+        """
+        db = SessionLocal()
+        try:
+            results = self._write(db, batches)
+            db.commit()
+
+            logger.info(
+                f"[SegmentWriter] {len(batches)} chunks, "
+                f"{sum(len(b.rows) for b, saved in zip(batches, results) if saved)} segments 기록"
+            )
+            return results
+
+        except Exception as e:
+            db.rollback()
+            if len(batches) == 1:
+                logger.error(f"[SegmentWriter] {batches[0].job_id} 기록 실패: {e}")
+                return [e]
+
+        finally:
+            db.close()
+
+        return [self._flush_batches([batch])[0] for batch in batches]
+
+    def _write(self, db: Session, batches: List[SegmentBatch]) -> List[bool]:
+        results = []
+        rows_by_chunk: Dict[Tuple[str, int, int], List[Dict]] = {}
+
+        for batch in batches:
+            # 처리 중 같은 chunk가 다른 내용으로 재업로드되었으면 결과 폐기
+            job = STTJobQueue.get(db, batch.job_id)
+            if job is not None and job.content_hash != batch.content_hash:
+                results.append(False)
+                continue
+
+            # 재처리/내용 변경 재업로드 시 이전 segment 교체
+            key = (batch.meeting_id, batch.user_id, batch.chunk_index)
+            old_ids = self.delete_chunk_segments(db, *key)
+            new_ids = {row["segment_id"] for row in batch.rows}
+            batch.stale_segment_ids = [i for i in old_ids if i not in new_ids]
+            rows_by_chunk[key] = batch.rows
+
+            STTJobQueue.ack(db, batch.job_id)
+            results.append(True)
+
+        rows = [row for chunk_rows in rows_by_chunk.values() for row in chunk_rows]
+        if rows:
+            db.execute(insert(STTSegment), rows)
+
+        return results
+
+    @staticmethod
+    def delete_chunk_segments(
+        db: Session,
+        meeting_id: str,
+        user_id: int,
+        chunk_index: int
+    ) -> List[str]:
+        """chunk의 기존 segment 삭제 (commit은 호출자), 삭제한 segment_id 반환"""
+        query = db.query(STTSegment).filter(
+            STTSegment.meeting_id == meeting_id,
+            STTSegment.user_id == user_id,
+            STTSegment.chunk_index == chunk_index
+        )
+        deleted = [row[0] for row in query.with_entities(STTSegment.segment_id)]
+        if deleted:
+            query.delete(synchronize_session=False)
+            logger.info(f"[STT] 기존 segment {len(deleted)}개 교체 (chunk {chunk_index})")
+
+        return deleted
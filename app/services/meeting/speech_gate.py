@@ -0,0 +1,99 @@
+import numpy as np
+from collections import defaultdict
+from typing import Dict
+from app.config import settings
+from app.core.logger import setup_logger
+from app.services.meeting.audio_chunk import AudioChunk, WHISPER_SAMPLE_RATE, resample_to
+
+logger = setup_logger(__name__)
+
+
+class SpeechGate:
+    """
+    STT 대기열 진입 전 발화 여부 판정 (무음 chunk는 Whisper 생략)
+
+    backend
+    - energy : 30ms 프레임 RMS(dBFS) 기준, 잡음 바닥 + margin 이상을 발화로 간주
+    - silero : faster-whisper 내장 Silero VAD (16kHz 리샘플 필요)
+    """
+
+    FRAME_MS = 30
+    ENERGY_FLOOR_DBFS = -50.0       # 이 아래는 무조건 무음
+    SPEECH_CEILING_DBFS = -35.0     # 이 위는 무조건 발화 (적응 임계값 상한)
+    NOISE_MARGIN_DB = 12.0          # 잡음 바닥(하위 10%) 대비 여유
+
+    # 회의별 통계 {meeting_id: {"total": n, "skipped": n}}
+    _stats: Dict[str, Dict[str, int]] = defaultdict(lambda: {"total": 0, "skipped": 0})
+
+    @classmethod
+    def speech_ratio(cls, chunk: AudioChunk) -> float:
+        """전체 길이 대비 발화 구간 비율 (0.0 ~ 1.0)"""
+        if chunk.num_samples == 0:
+            return 0.0
+
+        if settings.SPEECH_GATE_BACKEND == "silero":
+            return cls._silero_ratio(chunk)
+        return cls._energy_ratio(chunk)
+
+    @classmethod
+    def _energy_ratio(cls, chunk: AudioChunk) -> float:
+        frame_len = max(1, int(chunk.sample_rate * cls.FRAME_MS / 1000))
+        num_frames = chunk.num_samples // frame_len
+        if num_frames == 0:
+            return 0.0
+
+        frames = chunk.samples[:num_frames * frame_len].reshape(num_frames, frame_len)
+        rms = np.sqrt(np.mean(np.square(frames, dtype=np.float64), axis=1))
+        db = 20 * np.log10(np.maximum(rms, 1e-10))
+
+        noise_floor = np.percentile(db, 10)
+        threshold = min(
+            max(cls.ENERGY_FLOOR_DBFS, noise_floor + cls.NOISE_MARGIN_DB),
+            cls.SPEECH_CEILING_DBFS
+        )
+
+        return float(np.count_nonzero(db > threshold)) / num_frames
+
+    @classmethod
+    def _silero_ratio(cls, chunk: AudioChunk) -> float:
+        from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+        audio = resample_to(chunk.samples, chunk.sample_rate, WHISPER_SAMPLE_RATE)
+        timestamps = get_speech_timestamps(
+            audio,
+            VadOptions(threshold=0.5, min_speech_duration_ms=250)
+        )
+        speech_samples = sum(ts["end"] - ts["start"] for ts in timestamps)
+        return speech_samples / len(audio) if len(audio) else 0.0
+
+    @classmethod
+    def should_skip(cls, meeting_id: str, chunk: AudioChunk) -> bool:
+        """발화 비율이 임계값 미만이면 True (통계/로그 기록)"""
+        if not settings.SPEECH_GATE_ENABLED:
+            return False
+
+        try:
+            ratio = cls.speech_ratio(chunk)
+        except Exception as e:
+            logger.warning(f"[SpeechGate] 판정 실패, STT 진행: {e}")
+            return False
+
+        skip = ratio < settings.SPEECH_GATE_MIN_RATIO
+
+        stats = cls._stats[meeting_id]
+        stats["total"] += 1
+        if skip:
+            stats["skipped"] += 1
+
+        logger.info(
+            f"[SpeechGate] speech ratio {ratio:.3f} → {'skip' if skip else 'STT'} "
+            f"(회의 skip rate {stats['skipped']}/{stats['total']} "
+            f"= {stats['skipped'] / stats['total'] * 100:.1f}%)"
+        )
+
+        return skip
+
+    @classmethod
+    def pop_stats(cls, meeting_id: str) -> Dict[str, int]:
+        """회의 종료 시 통계 반환 및 정리"""
+        return cls._stats.pop(meeting_id, {"total": 0, "skipped": 0})
@@ -0,0 +1,265 @@
+import asyncio
+import time
+import numpy as np
+import ctranslate2
+from typing import Dict, List, Optional, Tuple
+from faster_whisper import WhisperModel
+from faster_whisper.tokenizer import Tokenizer
+from faster_whisper.vad import VadOptions, get_speech_timestamps
+from app.core.logger import setup_logger
+from app.services.meeting.audio_chunk import WHISPER_SAMPLE_RATE
+
+logger = setup_logger(__name__)
+
+
+class STTBatchScheduler:
+    """
+    여러 사용자/회의의 STT 요청을 짧은 시간 창 안에서 모아 한 번에 추론
+
+    1. 창(window_ms) 동안 대기열에 들어온 chunk들을 모은다
+    2. chunk마다 VAD로 발화 구간(최대 30초)을 잘라낸다
+    3. 모든 chunk의 발화 구간을 batch_size 단위로 묶어
+       CTranslate2 encode/generate를 한 번에 실행한다
+    4. 결과를 chunk별로 다시 나눠 각 대기 중인 호출자에게 돌려준다
+
+    VAD 구간이 segment가 되므로 overlap 경계(skip_before_s)에 걸친 구간은
+    경계에서 나눠 추론한다 (경계 이후의 새 음성이 통째로 버려지지 않게)
+
+    faster-whisper 1.0.x에는 chunk 간 batch API가 없으므로
+    BatchedInferencePipeline과 같은 방식(VAD 구간 = segment, timestamp 토큰 없음)을
+    모델 내부 primitive로 직접 구성한다.
+    """
+
+    # 기존 단건 transcribe와 같은 VAD 파라미터
+    VAD_OPTIONS = VadOptions(
+        threshold=0.5,
+        min_speech_duration_ms=250,
+        min_silence_duration_ms=2000,
+        max_speech_duration_s=30
+    )
+
+    BEAM_SIZE = 5
+    MAX_LENGTH = 448
+    NO_SPEECH_THRESHOLD = 0.6
+    LOG_PROB_THRESHOLD = -1.0
+
+    def __init__(
+        self,
+        model: WhisperModel,
+        batch_size: int = 8,
+        window_ms: int = 300,
+        max_chunks: int = 16,
+        language: str = "ko"
+    ):
+        self.model = model
+        self.batch_size = max(1, batch_size)
+        self.window_seconds = window_ms / 1000
+        self.max_chunks = max(1, max_chunks)
+
+        self.tokenizer = Tokenizer(
+            model.hf_tokenizer,
+            model.model.is_multilingual,
+            task="transcribe",
+            language=language
+        )
+        self.prompt = list(self.tokenizer.sot_sequence) + [self.tokenizer.no_timestamps]
+        self.nb_max_frames = model.feature_extractor.nb_max_frames
+
+        self.queue: Optional[asyncio.Queue] = None
+        self.worker: Optional[asyncio.Task] = None
+
+        # 통계
+        self.batches = 0
+        self.batched_chunks = 0
+
+    # -----------------
+    # asyncio 측
+    # -----------------
+    async def submit(self, audio: np.ndarray, skip_before_s: float = 0.0) -> Tuple[List[Dict], Dict]:
+        """
+        16kHz mono 배열 STT 요청 → 다음 batch 결과를 기다림
+
+        skip_before_s: 이 시각 이전 음성은 이미 전사됨 (이전 chunk overlap)
+                       → 이 시각에서 VAD 구간을 나누고 앞부분은 추론하지 않음
+
+        Returns:
+            (segments, {"inference_seconds": batch 추론 시간 중 이 chunk 몫})
+        """
+        self._ensure_worker()
+
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((audio, skip_before_s, future))
+
+        return await future
+
+    def _ensure_worker(self):
+        if self.worker is None or self.worker.done():
+            self.queue = self.queue or asyncio.Queue()
+            self.worker = asyncio.get_running_loop().create_task(self._run())
+            logger.info(
+                f"STT batch scheduler 시작 "
+                f"(batch_size={self.batch_size}, window={self.window_seconds * 1000:.0f}ms)"
+            )
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+
+        while True:
+            pending = [await self.queue.get()]
+            deadline = loop.time() + self.window_seconds
+
+            # 창이 끝나거나 최대 chunk 수에 도달할 때까지 수집
+            while len(pending) < self.max_chunks:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    pending.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            audios = [audio for audio, _, _ in pending]
+            skip_before = [skip_before_s for _, skip_before_s, _ in pending]
+
+            try:
+                # 추론 시간은 창 대기/대기열 시간을 빼고 여기서부터 측정
+                start_time = time.perf_counter()
+                results = await asyncio.to_thread(self.transcribe_batch, audios, skip_before)
+                elapsed = time.perf_counter() - start_time
+
+                # batch 추론 시간을 chunk 길이 비율로 나눔 (RTF 계산용)
+                total_samples = sum(len(audio) for audio in audios) or 1
+                for (audio, _, future), segments in zip(pending, results):
+                    if not future.done():
+                        future.set_result((
+                            segments,
+                            {"inference_seconds": elapsed * len(audio) / total_samples}
+                        ))
+
+            except Exception as e:
+                logger.error(f"Batch STT 실패: {e}", exc_info=True)
+                for _, _, future in pending:
+                    if not future.done():
+                        future.set_exception(e)
+
+    def shutdown(self):
+        """worker 종료 (대기 중인 요청은 취소)"""
+        if self.worker is not None:
+            self.worker.cancel()
+            self.worker = None
+
+        if self.queue is not None:
+            while not self.queue.empty():
+                _, _, future = self.queue.get_nowait()
+                if not future.done():
+                    future.cancel()
+
+    # -----------------
+    # 추론 (동기, 스레드에서 실행)
+    # -----------------
+    def transcribe_batch(
+        self,
+        audios: List[np.ndarray],
+        skip_before: Optional[List[float]] = None
+    ) -> List[List[Dict]]:
+        """
+        여러 chunk를 한 번에 추론
+
+        Args:
+            skip_before: chunk별 overlap 경계(초), 경계 이전 음성은 추론하지 않음
+
+        Returns:
+            chunk별 segment 리스트 (_run_whisper_stt와 같은 형식)
+        """
+        start_time = time.perf_counter()
+        skip_before = skip_before or [0.0] * len(audios)
+
+        # 1. chunk별 VAD 구간 → (chunk 번호, 시작 샘플, 끝 샘플)
+        min_samples = self.VAD_OPTIONS.min_speech_duration_ms * WHISPER_SAMPLE_RATE // 1000
+        items = []
+        for audio_idx, audio in enumerate(audios):
+            boundary = int(skip_before[audio_idx] * WHISPER_SAMPLE_RATE)
+            for ts in get_speech_timestamps(audio, self.VAD_OPTIONS):
+                # 경계 이전 구간은 건너뛰고, 경계에 걸친 구간은 경계부터
+                start = max(ts["start"], boundary)
+                if ts["end"] - start < min_samples:
+                    continue
+                items.append((audio_idx, start, ts["end"]))
+
+        results: List[List[Dict]] = [[] for _ in audios]
+
+        # 2. batch_size 단위로 encode + generate
+        for i in range(0, len(items), self.batch_size):
+            batch = items[i:i + self.batch_size]
+            outputs = self._generate(
+                [audios[audio_idx][start:end] for audio_idx, start, end in batch]
+            )
+
+            for (audio_idx, start, end), output in zip(batch, outputs):
+                if output is None:
+                    continue
+                text, avg_logprob = output
+                results[audio_idx].append({
+                    "start": start / WHISPER_SAMPLE_RATE,
+                    "end": end / WHISPER_SAMPLE_RATE,
+                    "text": text,
+                    "confidence": avg_logprob
+                })
+
+        self.batches += 1
+        self.batched_chunks += len(audios)
+
+        logger.info(
+            f"Batch STT 완료: chunks={len(audios)}, 구간={len(items)}, "
+            f"{time.perf_counter() - start_time:.2f}s"
+        )
+
+        return results
+
+    def _generate(self, windows: List[np.ndarray]) -> List[Optional[Tuple[str, float]]]:
+        """발화 구간(≤30초) 리스트 → (텍스트, avg_logprob) 또는 None(무음)"""
+        features = np.stack([self._features(window) for window in windows])
+
+        ct2_model = self.model.model
+        to_cpu = ct2_model.device == "cuda" and len(ct2_model.device_index) > 1
+        encoder_output = ct2_model.encode(
+            ctranslate2.StorageView.from_array(features),
+            to_cpu=to_cpu
+        )
+
+        results = ct2_model.generate(
+            encoder_output,
+            [self.prompt] * len(windows),
+            beam_size=self.BEAM_SIZE,
+            max_length=self.MAX_LENGTH,
+            return_scores=True,
+            return_no_speech_prob=True,
+            suppress_blank=True,
+            suppress_tokens=[-1]
+        )
+
+        outputs = []
+        for result in results:
+            tokens = [t for t in result.sequences_ids[0] if t < self.tokenizer.eot]
+            seq_len = len(tokens)
+            avg_logprob = result.scores[0] * seq_len / (seq_len + 1)
+
+            # faster-whisper와 같은 무음 판정
+            if (
+                result.no_speech_prob > self.NO_SPEECH_THRESHOLD
+                and avg_logprob < self.LOG_PROB_THRESHOLD
+            ):
+                outputs.append(None)
+                continue
+
+            text = self.tokenizer.decode(tokens).strip()
+            outputs.append((text, float(avg_logprob)) if text else None)
+
+        return outputs
+
+    def _features(self, window: np.ndarray) -> np.ndarray:
+        """log-mel (n_mels, 3000) 고정 길이"""
+        mel = self.model.feature_extractor(window)[:, :self.nb_max_frames]
+        if mel.shape[1] < self.nb_max_frames:
+            mel = np.pad(mel, ((0, 0), (0, self.nb_max_frames - mel.shape[1])))
+        return np.ascontiguousarray(mel, dtype=np.float32)
@@ -0,0 +1,232 @@
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.orm import Session
+from app.core.logger import setup_logger
+from app.core.schemas import STTJob
+
+logger = setup_logger(__name__)
+
+
+class STTJobQueue:
+    """
+    SQLite 기반 영속 STT 작업 큐
+
+    - enqueue : 업로드 시 작업 기록 (업로드한 프로세스가 바로 lease)
+    - lease   : pending 또는 lease 만료 작업을 원자적으로 가져감
+    - ack     : 처리 완료 (segment 저장과 같은 트랜잭션에서 호출)
+    - fail    : backoff 후 재시도, MAX_ATTEMPTS 초과 시 failed
+    """
+
+    LEASE_SECONDS = 600
+    MAX_ATTEMPTS = 3
+    RETRY_BACKOFF_SECONDS = 10
+
+    # 프로세스 식별자 (lease 소유자)
+    OWNER = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+    @classmethod
+    def enqueue(
+        cls,
+        db: Session,
+        job_id: str,
+        meeting_id: str,
+        user_id: int,
+        chunk_index: int,
+        chunk_path: str,
+        speaker_name: Optional[str],
+        chunk_relative_start_ms: int,
+        content_hash: Optional[str] = None,
+        leased: bool = True
+    ) -> STTJob:
+        """
+        작업 등록 (같은 job_id가 있으면 입력을 갱신하고 다시 대기 상태로)
+
+        leased=True면 현재 프로세스가 즉시 lease (메모리 fast path에서 처리)
+        """
+        now = datetime.utcnow()
+
+        job = db.query(STTJob).filter(STTJob.job_id == job_id).first()
+        if job is None:
+            job = STTJob(job_id=job_id, created_at=now)
+            db.add(job)
+
+        job.meeting_id = meeting_id
+        job.user_id = user_id
+        job.chunk_index = chunk_index
+        job.chunk_path = chunk_path
+        job.speaker_name = speaker_name
+        job.chunk_relative_start_ms = chunk_relative_start_ms
+        job.content_hash = content_hash
+        job.attempts = 1 if leased else 0
+        job.available_at = now
+        job.last_error = None
+        job.updated_at = now
+
+        if leased:
+            job.status = "leased"
+            job.lease_owner = cls.OWNER
+            job.lease_until = now + timedelta(seconds=cls.LEASE_SECONDS)
+        else:
+            job.status = "pending"
+            job.lease_owner = None
+            job.lease_until = None
+
+        db.commit()
+        return job
+
+    @classmethod
+    def lease(
+        cls,
+        db: Session,
+        limit: int = 4,
+        exclude: Iterable[str] = ()
+    ) -> List[STTJob]:
+        """
+        처리할 작업을 원자적으로 lease
+
+        exclude: 이 프로세스가 이미 메모리에서 처리 중인 job_id
+        """
+        now = datetime.utcnow()
+        lease_token = f"{cls.OWNER}:{uuid.uuid4().hex[:8]}"
+
+        candidates = (
+            select(STTJob.job_id)
+            .where(
+                or_(
+                    and_(STTJob.status == "pending", STTJob.available_at <= now),
+                    and_(STTJob.status == "leased", STTJob.lease_until < now)
+                )
+            )
+            .order_by(STTJob.created_at)
+            .limit(limit)
+        )
+        exclude = list(exclude)
+        if exclude:
+            candidates = candidates.where(STTJob.job_id.not_in(exclude))
+
+        # 단일 UPDATE로 선점 (SQLite write lock 안에서 원자적)
+        db.execute(
+            update(STTJob)
+            .where(STTJob.job_id.in_(candidates.scalar_subquery()))
+            .values(
+                status="leased",
+                lease_owner=lease_token,
+                lease_until=now + timedelta(seconds=cls.LEASE_SECONDS),
+                attempts=STTJob.attempts + 1,
+                updated_at=now
+            )
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+
+        return (
+            db.query(STTJob)
+            .filter(STTJob.lease_owner == lease_token)
+            .order_by(STTJob.created_at)
+            .all()
+        )
+
+    @staticmethod
+    def ack(db: Session, job_id: str, status: str = "done"):
+        """
+        처리 완료 표시 (commit은 호출자가 segment 저장과 함께)
+
+        status: done / skipped (무음 chunk)
+        """
+        db.query(STTJob).filter(STTJob.job_id == job_id).update({
+            "status": status,
+            "lease_owner": None,
+            "lease_until": None,
+            "last_error": None,
+            "updated_at": datetime.utcnow()
+        })
+
+    @classmethod
+    def fail(cls, db: Session, job_id: str, error: str) -> bool:
+        """
+        처리 실패 → backoff 후 재시도 (최대 횟수 초과 시 failed)
+
+        Returns:
+            True: 최종 실패 (더 이상 재시도 없음), False: 재시도 예약
+        """
+        job = db.query(STTJob).filter(STTJob.job_id == job_id).first()
+        if job is None:
+            return True
+
+        now = datetime.utcnow()
+        job.last_error = error[:1000]
+        job.lease_owner = None
+        job.lease_until = None
+        job.updated_at = now
+
+        if job.attempts >= cls.MAX_ATTEMPTS:
+            job.status = "failed"
+            logger.error(f"[STTJob] {job_id} 최대 재시도 초과 → failed")
+            final = True
+        else:
+            job.status = "pending"
+            job.available_at = now + timedelta(
+                seconds=cls.RETRY_BACKOFF_SECONDS * (2 ** (job.attempts - 1))
+            )
+            logger.warning(
+                f"[STTJob] {job_id} 재시도 예약 ({job.attempts}/{cls.MAX_ATTEMPTS})"
+            )
+            final = False
+
+        db.commit()
+        return final
+
+    @staticmethod
+    def release_dead_leases(db: Session) -> int:
+        """
+        이 호스트에서 종료된 프로세스가 잡고 있던 lease를 즉시 해제
+
+        (다른 호스트의 lease는 LEASE_SECONDS 만료 후 자연 회수)
+        """
+        hostname = socket.gethostname()
+        released = 0
+
+        jobs = db.query(STTJob).filter(STTJob.status == "leased").all()
+        for job in jobs:
+            owner = (job.lease_owner or "").split(":")[0]
+            host, _, rest = owner.rpartition("-")[0].rpartition("-")
+            if host != hostname or not rest.isdigit():
+                continue
+
+            pid = int(rest)
+            if pid == os.getpid() or _pid_alive(pid):
+                continue
+
+            job.status = "pending"
+            job.lease_owner = None
+            job.lease_until = None
+            job.available_at = datetime.utcnow()
+            released += 1
+
+        db.commit()
+
+        if released:
+            logger.info(f"[STTJob] 종료된 프로세스의 lease {released}개 해제")
+        return released
+
+    @staticmethod
+    def get(db: Session, job_id: str) -> Optional[STTJob]:
+        return db.query(STTJob).filter(STTJob.job_id == job_id).first()
+
+    @staticmethod
+    def exists(db: Session, job_id: str) -> bool:
+        return db.query(STTJob.job_id).filter(STTJob.job_id == job_id).first() is not None
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
@@ -0,0 +1,241 @@
+import asyncio
+import multiprocessing as mp
+import os
+import queue
+import threading
+import time
+import uuid
+import numpy as np
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+from app.core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def _stt_worker_main(task_queue, result_queue, model_kwargs: Dict):
+    """
+    STT worker 프로세스 진입점 (프로세스마다 WhisperModel 1개)
+
+    task  : (job_id, shm_name, num_samples)  - 16kHz mono float32
+    result: (job_id, (segments, info) | None, error | None)
+            info = {"inference_seconds": transcribe 실행 시간}
+    작업 시작 시 ("__started__", (pid, job_id), None)을 먼저 보낸다 (worker 비정상 종료 감지용)
+    """
+    from faster_whisper import WhisperModel
+    from app.services.meeting.audio_processor import AudioProcessor
+
+    AudioProcessor.whisper_model = WhisperModel(**model_kwargs)
+    result_queue.put(("__ready__", None, None))
+
+    while True:
+        task = task_queue.get()
+        if task is None:
+            break
+
+        job_id, shm_name, num_samples = task
+        result_queue.put(("__started__", (os.getpid(), job_id), None))
+        try:
+            shm = shared_memory.SharedMemory(name=shm_name)
+            try:
+                audio = np.ndarray((num_samples,), dtype=np.float32, buffer=shm.buf).copy()
+            finally:
+                shm.close()
+
+            start_time = time.perf_counter()
+            segments, _ = AudioProcessor._run_whisper_stt(audio)
+            info = {"inference_seconds": time.perf_counter() - start_time}
+            result_queue.put((job_id, (segments, info), None))
+
+        except Exception as e:
+            result_queue.put((job_id, None, repr(e)))
+
+
+class STTProcessPool:
+    """
+    프로세스 풀 STT 실행 모드
+
+    - worker 프로세스 N개가 각자 WhisperModel을 보유 (API 프로세스 GIL과 분리)
+    - 오디오는 shared memory로 전달 (queue로는 이름/길이만)
+    - 결과는 수신 스레드가 asyncio future로 돌려준다
+    """
+
+    RESULT_POLL_SECONDS = 1.0
+
+    def __init__(self, num_workers: int, model_kwargs: Dict, timeout_seconds: float = 300):
+        self.num_workers = max(1, num_workers)
+        self.model_kwargs = model_kwargs
+        self.timeout_seconds = timeout_seconds
+
+        # CUDA 컨텍스트는 fork와 호환되지 않으므로 spawn
+        self.ctx = mp.get_context("spawn")
+        self.task_queue = self.ctx.Queue()
+        self.result_queue = self.ctx.Queue()
+        self.processes: List[mp.Process] = []
+
+        # job_id → (future, loop, shm)
+        self.pending: Dict[str, Tuple[asyncio.Future, asyncio.AbstractEventLoop, shared_memory.SharedMemory]] = {}
+        self.lock = threading.Lock()
+
+        # worker pid → 처리 중인 job_id (worker가 죽으면 해당 작업만 즉시 실패)
+        self.worker_jobs: Dict[int, str] = {}
+
+        self.running = False
+        self.result_thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self.running = True
+        for _ in range(self.num_workers):
+            self._spawn_worker()
+
+        self.result_thread = threading.Thread(
+            target=self._collect_results, name="stt-pool-results", daemon=True
+        )
+        self.result_thread.start()
+
+        logger.info(f"STT 프로세스 풀 시작: {self.num_workers} workers")
+
+    def _spawn_worker(self) -> mp.Process:
+        process = self.ctx.Process(
+            target=_stt_worker_main,
+            args=(self.task_queue, self.result_queue, self.model_kwargs),
+            daemon=True
+        )
+        process.start()
+        self.processes.append(process)
+        return process
+
+    async def submit(self, audio: np.ndarray) -> Tuple[List[Dict], Dict]:
+        """
+        16kHz mono float32 배열 → worker 프로세스 STT 결과
+
+        Returns:
+            (segments, {"inference_seconds": worker에서 transcribe한 시간})
+        """
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
+        job_id = uuid.uuid4().hex
+
+        shm = shared_memory.SharedMemory(create=True, size=max(1, audio.nbytes))
+        np.ndarray(audio.shape, dtype=np.float32, buffer=shm.buf)[:] = audio
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        with self.lock:
+            self.pending[job_id] = (future, loop, shm)
+
+        self.task_queue.put((job_id, shm.name, len(audio)))
+
+        try:
+            return await asyncio.wait_for(future, timeout=self.timeout_seconds)
+        finally:
+            self._release(job_id)
+
+    def _release(self, job_id: str):
+        """shared memory 해제 (결과 수신 또는 timeout 시)"""
+        with self.lock:
+            entry = self.pending.pop(job_id, None)
+
+        if entry is not None:
+            _, _, shm = entry
+            shm.close()
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _collect_results(self):
+        """결과 수신 스레드: worker 결과 → asyncio future"""
+        while self.running:
+            try:
+                job_id, result, error = self.result_queue.get(
+                    timeout=self.RESULT_POLL_SECONDS
+                )
+            except queue.Empty:
+                self._respawn_dead_workers()
+                continue
+            except (EOFError, OSError):
+                break
+
+            if job_id == "__ready__":
+                logger.info("STT worker 프로세스 모델 로드 완료")
+            elif job_id == "__started__":
+                pid, started_job_id = result
+                if any(process.pid == pid for process in self.processes):
+                    self.worker_jobs[pid] = started_job_id
+                else:
+                    # 시작 알림보다 종료 감지가 먼저 처리된 경우
+                    self._fail_job(started_job_id, pid)
+            else:
+                self._finish_job(job_id, result, error)
+
+            # 결과가 계속 들어와도 매 반복마다 worker 생존 확인
+            self._respawn_dead_workers()
+
+    def _finish_job(self, job_id: str, result, error: Optional[str]):
+        for pid, worker_job_id in list(self.worker_jobs.items()):
+            if worker_job_id == job_id:
+                del self.worker_jobs[pid]
+
+        with self.lock:
+            entry = self.pending.get(job_id)
+
+        if entry is None:
+            return
+
+        future, loop, _ = entry
+        if error is not None:
+            loop.call_soon_threadsafe(_set_exception, future, RuntimeError(error))
+        else:
+            loop.call_soon_threadsafe(_set_result, future, result)
+
+    def _fail_job(self, job_id: str, pid: int):
+        """죽은 worker가 처리 중이던 작업 즉시 실패 (timeout까지 기다리지 않음)"""
+        self._finish_job(
+            job_id, None, f"STT worker 비정상 종료 (pid={pid})"
+        )
+
+    def _respawn_dead_workers(self):
+        """비정상 종료된 worker 교체 + 처리 중이던 작업 실패 처리"""
+        if not self.running:
+            return
+
+        for process in list(self.processes):
+            if not process.is_alive():
+                logger.warning(
+                    f"STT worker 종료 감지 (pid={process.pid}, exitcode={process.exitcode}) → 재시작"
+                )
+                self.processes.remove(process)
+
+                job_id = self.worker_jobs.pop(process.pid, None)
+                if job_id is not None:
+                    self._fail_job(job_id, process.pid)
+
+                self._spawn_worker()
+
+    def shutdown(self, timeout: float = 10.0):
+        self.running = False
+
+        for _ in self.processes:
+            self.task_queue.put(None)
+
+        for process in self.processes:
+            process.join(timeout=timeout)
+            if process.is_alive():
+                process.terminate()
+        self.processes = []
+
+        for job_id in list(self.pending):
+            self._release(job_id)
+
+        logger.info("STT 프로세스 풀 종료")
+
+
+def _set_result(future: asyncio.Future, value):
+    if not future.done():
+        future.set_result(value)
+
+
+def _set_exception(future: asyncio.Future, error: Exception):
+    if not future.done():
+        future.set_exception(error)
@@ -0,0 +1,95 @@
+import asyncio
+import hashlib
+import json
+import os
+from typing import Dict, Optional, Set
+from app.config import settings
+from app.core.logger import setup_logger
+from app.services.meeting.paths import PathManager
+
+logger = setup_logger(__name__)
+
+
+class WindowSummaryCache:
+    """
+    시간 window 요약 캐시 (회의별 JSON 파일)
+
+    key: 모델 + window 텍스트의 sha256 → 텍스트가 바뀐 window만 다시 요약
+    회의 중 미리 요약한 window를 종료 파이프라인이 그대로 재사용한다
+
+    storage/meetings/{meeting_id}/summaries/window_summaries.json
+    put은 메모리만 갱신하고, save()가 바뀐 내용을 파일에 한 번에 기록한다
+    """
+
+    _entries: Dict[str, Dict[str, Dict]] = {}
+    _dirty: Set[str] = set()
+
+    @staticmethod
+    def key(text: str) -> str:
+        return hashlib.sha256(f"{settings.LLM_MODEL}\n{text}".encode("utf-8")).hexdigest()
+
+    @classmethod
+    def get(cls, meeting_id: str, key: str) -> Optional[Dict]:
+        return cls._load(meeting_id).get(key)
+
+    @classmethod
+    def put(cls, meeting_id: str, key: str, summary: Dict):
+        cls._load(meeting_id)[key] = summary
+        cls._dirty.add(meeting_id)
+
+    @classmethod
+    async def preload(cls, meeting_id: str):
+        """파일 캐시를 스레드에서 미리 로드 (get이 이벤트 루프에서 파일을 읽지 않도록)"""
+        if meeting_id not in cls._entries:
+            await asyncio.to_thread(cls._load, meeting_id)
+
+    @classmethod
+    async def save(cls, meeting_id: str):
+        """put으로 바뀐 내용을 파일에 한 번에 기록 (스레드에서)"""
+        if meeting_id not in cls._dirty:
+            return
+        cls._dirty.discard(meeting_id)
+
+        entries = dict(cls._load(meeting_id))
+        try:
+            await asyncio.to_thread(cls._write, meeting_id, entries)
+        except Exception as e:
+            logger.warning(f"[SummaryCache] 캐시 저장 실패: {e}")
+            cls._dirty.add(meeting_id)
+
+    @classmethod
+    def forget(cls, meeting_id: str):
+        """메모리에서만 제거 (파일은 유지)"""
+        cls._entries.pop(meeting_id, None)
+        cls._dirty.discard(meeting_id)
+
+    @staticmethod
+    def _path(meeting_id: str):
+        return PathManager.get_meeting_dir(meeting_id) / "summaries" / "window_summaries.json"
+
+    @classmethod
+    def _write(cls, meeting_id: str, entries: Dict[str, Dict]):
+        path = cls._path(meeting_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def _load(cls, meeting_id: str) -> Dict[str, Dict]:
+        if meeting_id in cls._entries:
+            return cls._entries[meeting_id]
+
+        entries = {}
+        path = cls._path(meeting_id)
+        if path.exists():
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    entries = json.load(f)
+            except Exception as e:
+                logger.warning(f"[SummaryCache] 캐시 로드 실패, 새로 요약: {e}")
+
+        cls._entries[meeting_id] = entries
+        return entries
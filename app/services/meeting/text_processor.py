@@ -1,9 +1,12 @@
+import asyncio
 import re
+from collections import defaultdict
 from typing import List, Dict
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from app.config import settings
 from app.core.logger import setup_logger
+from app.services.meeting.correction_cache import CorrectionCache
 
 logger = setup_logger(__name__)
 
@@ -11,6 +14,9 @@ logger = setup_logger(__name__)
 class TextProcessor:
     """STT 텍스트 후처리 서비스"""
 
+    # 회의별 보정 캐시 통계 {meeting_id: {"lookups": n, "hits": n}}
+    _cache_stats: Dict[str, Dict[str, int]] = defaultdict(lambda: {"lookups": 0, "hits": 0})
+
     def __init__(self):
         self.llm = ChatOpenAI(
             model = "gpt-4o-mini",
@@ -18,70 +24,98 @@ class TextProcessor:
             temperature = 0.1
         )
 
+        # batch 토큰 추정용 (없으면 글자 수로 근사)
+        try:
+            import tiktoken
+            self.encoding = tiktoken.encoding_for_model("gpt-4o-mini")
+        except Exception:
+            self.encoding = None
+
     # -----------------
     # 규칙기반 전처리
     # -----------------
-    @staticmethod
-    def rule_based_cleaning(text: str) -> str:
+
+    # 추임새 / 3회 이상 반복 문자를 한 번에 훑는 패턴 (왼쪽 대안 우선)
+    # - 추임새가 먼저 : "어어어" 는 "어" 로 줄지 않고 통째로 제거
+    # - 반복 문자     : "네네네네" → "네"
+    _FILLERS = ("음", "어", "그", "저", "아", "이", "으")
+    _CHAR_RULES = re.compile(
+        r"\b(?:" + "|".join(f"{c}+" for c in _FILLERS) + r")\b"
+        r"|(.)\1{2,}"
+    )
+    # "네 네 네" → "네"
+    _REPEATED_WORD = re.compile(r"\b(\w+)(\s+\1){2,}\b")
+    # ㅋㅋㅋ, ㅎㅎㅎ (반복 단어 뒤에 제거 : "질문 ㅋㅋ 질문 질문" 은 그대로 둔다)
+    _LAUGH = re.compile(r"[ㅋㅎㅠㅜㅡ]+")
+    # 숫자/공백/특수문자만
+    _NON_WORD_ONLY = re.compile(r"[\d\s\W]+")
+
+    @classmethod
+    def _clean(cls, text: str) -> str:
+        """추임새·반복 문자 → 반복 단어 → ㅋㅋ → 공백 정규화"""
+        text = cls._CHAR_RULES.sub(lambda m: m.group(1) or "", text)
+        text = cls._REPEATED_WORD.sub(r"\1", text)
+        text = cls._LAUGH.sub("", text)
+        return " ".join(text.split())
+
+    @classmethod
+    def rule_based_cleaning(cls, text: str) -> str:
         """규칙 기반 텍스트 정리"""
         
         if not text:
             return text
         
-        original_text = text
-        
-        # 1. 공백 정규화
-        text = re.sub(r'\s+', ' ', text)
-        text = text.strip()
-        
-        # 2. 반복 문자 제거 (3회 이상)
-        # "네네네네" → "네"
-        text = re.sub(r'(.)\1{2,}', r'\1', text)
-        
-        # 3. 불필요한 추임새 제거
-        fillers = [
-            r'\b음+\b', r'\b어+\b', r'\b그+\b', r'\b저+\b',
-            r'\b아+\b', r'\b이+\b', r'\b으+\b'
-        ]
-        for filler in fillers:
-            text = re.sub(filler, '', text, flags=re.IGNORECASE)
+        cleaned = cls._clean(text)
         
-        # 4. 반복 단어 제거
-        # "네 네 네" → "네"
-        text = re.sub(r'\b(\w+)(\s+\1){2,}\b', r'\1', text)
+        if cleaned != text:
+            logger.debug(f"규칙 정리: '{text}' → '{cleaned}'")
         
-        # 5. 특수문자 정리
-        text = re.sub(r'[ㅋㅎㅠㅜㅡ]+', '', text)  # ㅋㅋㅋ, ㅎㅎㅎ 제거
-        
-        # 6. 다시 공백 정규화
-        text = re.sub(r'\s+', ' ', text)
-        text = text.strip()
-        
-        if original_text != text:
-            logger.debug(f"규칙 정리: '{original_text}' → '{text}'")
-        
-        return text
+        return cleaned
     
-    @staticmethod
-    def is_meaningful_text(text: str, min_length: int = 3) -> bool:
+    @classmethod
+    def is_meaningful_text(cls, text: str, min_length: int = 3) -> bool:
         """의미있는 텍스트인지 확인"""
         
         if not text or len(text) < min_length:
             return False
         
         # 너무 짧은 단어들만 있으면 제외
-        words = text.split()
-        if all(len(w) <= 1 for w in words):
+        if all(len(w) <= 1 for w in text.split()):
             return False
         
         # 숫자/특수문자만 있으면 제외
-        if re.match(r'^[\d\s\W]+$', text):
+        if cls._NON_WORD_ONLY.fullmatch(text):
             return False
         
         return True
     
+    @classmethod
+    def clean_segments(cls, segments: List[Dict]) -> List[Dict]:
+        """
+        회의 segment 목록 일괄 규칙 정리 (의미없는 segment 제외, 순서 유지)
+
+        "네", "감사합니다" 처럼 같은 텍스트는 한 번만 정리
+        """
+        results: Dict[str, str] = {}
+        cleaned_segments = []
+
+        for seg in segments:
+            text = seg["text"]
+            if text not in results:
+                cleaned = cls._clean(text) if text else text
+                results[text] = cleaned if cls.is_meaningful_text(cleaned) else None
+
+            cleaned = results[text]
+            if cleaned is None:
+                logger.debug(f"의미없는 텍스트 제외: '{text}'")
+                continue
+
+            seg_copy = seg.copy()
+            seg_copy["text"] = cleaned
+            cleaned_segments.append(seg_copy)
+
+        return cleaned_segments
 
-    
     # -----------------
     # LLM 기반 보정
     # -----------------
@@ -90,32 +124,154 @@ class TextProcessor:
     async def llm_based_correction(
         self,
         segments: List[Dict],
-        batch_size: int = 10
+        batch_size: int = None,
+        meeting_id: str = None
     ) -> List[Dict]:
-        
+        """
+        토큰 예산 기준 batch로 나눠 동시에 보정 (순서 유지)
+
+        - 보정 캐시에 있는 텍스트는 LLM 없이 적용, 같은 텍스트는 한 번만 요청
+        - 동시 요청 수 : settings.LLM_CORRECTION_CONCURRENCY
+        - batch 크기   : LLM_CORRECTION_BATCH_TOKENS 토큰 / 최대 batch_size개
+        - 실패 시 backoff 재시도, 최종 실패 batch는 원본 유지
+        """
         logger.info(f"LLM 기반 텍스트 보정 시작 (총 {len(segments)}개)")
 
-        corrected_segments = []
+        # 1. 캐시 조회 + 중복 텍스트 제거 → batch에는 cache miss만
+        cached = {}
+        if settings.CORRECTION_CACHE_ENABLED:
+            try:
+                cached = await asyncio.to_thread(
+                    CorrectionCache.get_many, {seg["text"] for seg in segments}
+                )
+            except Exception as e:
+                logger.warning(f"[CorrectionCache] 조회 실패, 캐시 없이 진행: {e}")
 
-        # 배치로 처리
-        for i in range(0, len(segments), batch_size):
-            batch = segments[i : i+batch_size]
+        misses: Dict[str, Dict] = {}
+        for seg in segments:
+            if seg["text"] not in cached and seg["text"] not in misses:
+                misses[seg["text"]] = seg
 
-            try:
-                corrected_batch = await self._correct_batch(batch)
-                corrected_segments.extend(corrected_batch)
+        hits = sum(1 for seg in segments if seg["text"] in cached)
+        self._record_cache_stats(meeting_id, len(segments), hits)
+        logger.info(
+            f"보정 캐시 hit {hits}/{len(segments)}개, LLM 요청 {len(misses)}개"
+        )
 
-                logger.info(f"진행: {len(corrected_segments)} / {len(segments)}")
+        # 2. cache miss 동시 보정
+        batches = self._make_batches(
+            list(misses.values()),
+            max_tokens = settings.LLM_CORRECTION_BATCH_TOKENS,
+            max_size = batch_size or settings.LLM_CORRECTION_BATCH_SIZE
+        )
+        semaphore = asyncio.Semaphore(max(1, settings.LLM_CORRECTION_CONCURRENCY))
+        done = 0
 
+        async def run(batch: List[Dict]) -> List[Dict]:
+            nonlocal done
+            async with semaphore:
+                corrected = await self._correct_batch_with_retry(batch)
+            done += len(batch)
+            logger.info(f"진행: {done} / {len(misses)}")
+            return corrected
 
+        results = await asyncio.gather(*(run(batch) for batch in batches))
+
+        # 파싱에 성공한 보정만 캐시에 저장 (실패해서 원본 유지된 것은 제외)
+        corrections = {
+            seg["original_text"]: seg["text"]
+            for batch in results for seg in batch
+            if "original_text" in seg
+        }
+        if settings.CORRECTION_CACHE_ENABLED:
+            try:
+                await asyncio.to_thread(CorrectionCache.put_many, corrections)
             except Exception as e:
-                logger.error(f"배치 보정 실패 : {e}")
-                corrected_segments.extend(batch)
+                logger.warning(f"[CorrectionCache] 저장 실패: {e}")
+        corrections.update(cached)
+
+        # 3. 원래 순서로 재조립
+        corrected_segments = []
+        for seg in segments:
+            corrected_text = corrections.get(seg["text"])
+            if corrected_text is None:
+                corrected_segments.append(seg)
+                continue
+
+            seg_copy = seg.copy()
+            seg_copy["text"] = corrected_text
+            seg_copy["original_text"] = seg["text"]  # 원본 보관
+            corrected_segments.append(seg_copy)
 
-        logger.info("LLM 텍스트 보정 완료")
+        logger.info(
+            f"LLM 텍스트 보정 완료 ({len(batches)}개 batch, "
+            f"동시 {settings.LLM_CORRECTION_CONCURRENCY}개)"
+        )
         return corrected_segments
-    
 
+    @classmethod
+    def _record_cache_stats(cls, meeting_id: str, lookups: int, hits: int):
+        if meeting_id is None:
+            return
+        stats = cls._cache_stats[meeting_id]
+        stats["lookups"] += lookups
+        stats["hits"] += hits
+
+    @classmethod
+    def pop_cache_stats(cls, meeting_id: str) -> Dict[str, int]:
+        """회의 보정 캐시 통계 반환 및 정리"""
+        return cls._cache_stats.pop(meeting_id, {"lookups": 0, "hits": 0})
+
+    async def _correct_batch_with_retry(self, batch: List[Dict]) -> List[Dict]:
+        retries = settings.LLM_CORRECTION_MAX_RETRIES
+
+        for attempt in range(retries + 1):
+            try:
+                return await self._correct_batch(batch)
+            except Exception as e:
+                if attempt == retries:
+                    logger.error(f"배치 보정 실패 : {e}")
+                    return batch
+
+                delay = settings.LLM_CORRECTION_RETRY_BACKOFF_SECONDS * (2 ** attempt)
+                logger.warning(
+                    f"배치 보정 재시도 ({attempt + 1}/{retries}, {delay:.1f}초 후) : {e}"
+                )
+                await asyncio.sleep(delay)
+
+    def _make_batches(
+        self,
+        segments: List[Dict],
+        max_tokens: int,
+        max_size: int
+    ) -> List[List[Dict]]:
+        """토큰 예산 / 최대 개수 안에서 순서대로 batch 구성"""
+        batches = []
+        current, current_tokens = [], 0
+
+        for seg in segments:
+            tokens = self._count_tokens(f"{seg['speaker_name']} {seg['text']}")
+
+            if current and (
+                current_tokens + tokens > max_tokens or len(current) >= max_size
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+
+            current.append(seg)
+            current_tokens += tokens
+
+        if current:
+            batches.append(current)
+
+        return batches
+
+    def _count_tokens(self, text: str) -> int:
+        if self.encoding is None:
+            return len(text)     # 한국어는 대략 글자당 1토큰 이하
+        return len(self.encoding.encode(text)) + 8  # 번호/화자 표기 여유
+
+    
     # 배치단위 보정
     async def _correct_batch(self, segments: List[Dict]) -> List[Dict]:
         # 프롬프트 구성
@@ -153,28 +309,22 @@ class TextProcessor:
 
         response = await chain.ainvoke({"segments" : segments_str})
 
-        # 응답 파싱
-        corrected_lines = response.content.strip().split("\n")
+        # 응답 파싱 ("1. [화자명] 텍스트" → 번호별 텍스트)
+        corrected_texts = {}
+        for line in response.content.strip().split("\n"):
+            match = re.search(r'(\d+)\.\s*\[.+?\]\s*(.+)', line)
+            if match:
+                corrected_texts[int(match.group(1)) - 1] = match.group(2).strip()
 
-        # 각 segment에 보정된 텍스트 적용
+        # 각 segment에 보정된 텍스트 적용 (파싱 실패한 segment는 원본 사용)
         corrected_segments = []
         for idx, seg in enumerate(segments):
-            if idx < len(corrected_lines):
-                corrected_line = corrected_lines[idx]
-                
-                # "1. [화자명] 텍스트" 형식에서 텍스트 추출
-                match = re.search(r'\d+\.\s*\[.+?\]\s*(.+)', corrected_line)
-                if match:
-                    corrected_text = match.group(1).strip()
-                    
-                    # 보정된 텍스트 적용
-                    seg_copy = seg.copy()
-                    seg_copy["text"] = corrected_text
-                    seg_copy["original_text"] = seg["text"]  # 원본 보관
-                    corrected_segments.append(seg_copy)
-                else:
-                    # 파싱 실패 시 원본 사용
-                    corrected_segments.append(seg)
+            corrected_text = corrected_texts.get(idx)
+            if corrected_text:
+                seg_copy = seg.copy()
+                seg_copy["text"] = corrected_text
+                seg_copy["original_text"] = seg["text"]  # 원본 보관
+                corrected_segments.append(seg_copy)
             else:
                 corrected_segments.append(seg)
         
@@ -188,32 +338,25 @@ class TextProcessor:
     async def process_segments(
         self,
         segments: List[Dict],
-        use_llm: bool = True
+        use_llm: bool = True,
+        meeting_id: str = None
     ) -> List[Dict]:
 
         logger.info(f"텍스트 후처리 시작 (총 {len(segments)}개)")
         
-        processed_segments = []
-        
         # 1단계: 규칙 기반 정리
         logger.info("1단계: 규칙 기반 정리")
-        for seg in segments:
-            cleaned_text = self.rule_based_cleaning(seg["text"])
-            
-            # 의미있는 텍스트인지 확인
-            if self.is_meaningful_text(cleaned_text):
-                seg_copy = seg.copy()
-                seg_copy["text"] = cleaned_text
-                processed_segments.append(seg_copy)
-            else:
-                logger.debug(f"의미없는 텍스트 제외: '{seg['text']}'")
+        processed_segments = self.clean_segments(segments)
         
         logger.info(f"{len(processed_segments)}개 segment 유지 (원본 {len(segments)}개)")
         
         # 2단계: LLM 보정 (선택적)
         if use_llm and processed_segments:
             logger.info("2단계: LLM 기반 보정")
-            processed_segments = await self.llm_based_correction(processed_segments)
+            processed_segments = await self.llm_based_correction(
+                processed_segments,
+                meeting_id = meeting_id
+            )
         
         logger.info(f"텍스트 후처리 완료: {len(processed_segments)}개")
         
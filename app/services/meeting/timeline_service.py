@@ -32,15 +32,9 @@ class TimelineService:
         # -------------------------------
         # 1. 음성 segment 조회 (시간순 정렬)
         # -------------------------------
-        segments_raw = (
-            db.query(STTSegment, User.name)
-            .join(User, STTSegment.user_id == User.user_id)
-            .filter(STTSegment.meeting_id == meeting_id)
-            .order_by(STTSegment.start_time_ms)
-            .all()
-        )
+        voice_segments = TimelineService.load_voice_segments(db, meeting)
 
-        if not segments_raw:
+        if not voice_segments:
             logger.warning("segment가 없음")
             return {
                 "segments": [],
@@ -50,54 +44,12 @@ class TimelineService:
                 "overlaps": []
             }
         
-        logger.info(f"로드된 segment: {len(segments_raw)}개")
-
-        # 음성 segment 변환
-        voice_segments = []
-        for seg, speaker_name in segments_raw:
-            # 절대시간 = 회의시작 timestamp + segment의 상대시간
-            absolute_start_ms = meeting.start_server_timestamp + seg.start_time_ms
-            absolute_end_ms = meeting.start_server_timestamp + seg.end_time_ms
-
-            voice_segments.append({
-                "type": "voice",
-                "segment_id": seg.segment_id,
-                "user_id": seg.user_id,
-                "speaker_name": speaker_name,
-                "text": seg.text.strip(),
-                "confidence": seg.confidence,
-                "start_time_ms": seg.start_time_ms,
-                "end_time_ms": seg.end_time_ms,
-                "absolute_start_ms": absolute_start_ms,
-                "absolute_end_ms": absolute_end_ms,
-                "chunk_index": seg.chunk_index,
-                "is_overlapped": seg.is_overlapped
-            })
+        logger.info(f"로드된 segment: {len(voice_segments)}개")
 
         # -------------------------------
         # 2. 채팅 메시지 변환
         # -------------------------------
-        chat_segments = []
-        if chat_messages:
-            logger.info(f"채팅 메시지: {len(chat_messages)}개")
-
-            for i, msg in enumerate(chat_messages):
-                relative_ms = msg["timestamp_ms"] - meeting.start_server_timestamp
-
-                chat_segments.append({
-                    "type" : "chat",
-                    "segment_id" : f"chat_{meeting_id}_{i}",
-                    "user_id" : msg["user_id"],
-                    "speaker_name": msg["user_name"],
-                    "text": msg["message"],
-                    "confidence": 1.0,
-                    "start_time_ms": relative_ms,
-                    "end_time_ms": relative_ms,
-                    "absolute_start_ms": msg["timestamp_ms"],
-                    "absolute_end_ms": msg["timestamp_ms"],
-                    "chunk_index": None,
-                    "is_overlapped": False
-                })
+        chat_segments = TimelineService.build_chat_segments(meeting, chat_messages)
 
         # -------------------------------
         # 3. 음성 + 채팅 통합 및 시간순 정렬
@@ -146,15 +98,8 @@ class TimelineService:
             "overlaps": overlaps
         }
 
-        # 문서 저장 (storage/meetings/{meeting_id}/summaries/full_text.txt)
-        summary_dir = f"storage/meetings/{meeting_id}/summaries"
-        os.makedirs(summary_dir, exist_ok = True)
-
-        file_path = os.path.join(summary_dir, "full_text.txt")
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(full_text)
-
-        logger.info(f"Full text 저장 완료: {file_path}")
+        # 문서 저장
+        TimelineService.save_full_text(meeting_id, full_text)
 
         logger.info(
             f"타임라인 병합 완료\n"
@@ -166,6 +111,89 @@ class TimelineService:
         return result
 
 
+    # 음성 segment 조회 (start_from_ms 이후만, 시간순)
+    @staticmethod
+    def load_voice_segments(
+        db: Session,
+        meeting: Meeting,
+        start_from_ms: int = None
+    ) -> List[Dict]:
+        query = (
+            db.query(STTSegment, User.name)
+            .join(User, STTSegment.user_id == User.user_id)
+            .filter(STTSegment.meeting_id == meeting.meeting_id)
+        )
+        if start_from_ms is not None:
+            query = query.filter(STTSegment.start_time_ms >= start_from_ms)
+
+        voice_segments = []
+        for seg, speaker_name in query.order_by(STTSegment.start_time_ms).all():
+            # 절대시간 = 회의시작 timestamp + segment의 상대시간
+            absolute_start_ms = meeting.start_server_timestamp + seg.start_time_ms
+            absolute_end_ms = meeting.start_server_timestamp + seg.end_time_ms
+
+            voice_segments.append({
+                "type": "voice",
+                "segment_id": seg.segment_id,
+                "user_id": seg.user_id,
+                "speaker_name": speaker_name,
+                "text": seg.text.strip(),
+                "confidence": seg.confidence,
+                "start_time_ms": seg.start_time_ms,
+                "end_time_ms": seg.end_time_ms,
+                "absolute_start_ms": absolute_start_ms,
+                "absolute_end_ms": absolute_end_ms,
+                "chunk_index": seg.chunk_index,
+                "is_overlapped": seg.is_overlapped
+            })
+
+        return voice_segments
+
+
+    # 채팅 메시지 → segment 변환
+    @staticmethod
+    def build_chat_segments(
+        meeting: Meeting,
+        chat_messages: List[Dict] = None
+    ) -> List[Dict]:
+        chat_segments = []
+        if chat_messages:
+            logger.info(f"채팅 메시지: {len(chat_messages)}개")
+
+            for i, msg in enumerate(chat_messages):
+                relative_ms = msg["timestamp_ms"] - meeting.start_server_timestamp
+
+                chat_segments.append({
+                    "type" : "chat",
+                    "segment_id" : f"chat_{meeting.meeting_id}_{i}",
+                    "user_id" : msg["user_id"],
+                    "speaker_name": msg["user_name"],
+                    "text": msg["message"],
+                    "confidence": 1.0,
+                    "start_time_ms": relative_ms,
+                    "end_time_ms": relative_ms,
+                    "absolute_start_ms": msg["timestamp_ms"],
+                    "absolute_end_ms": msg["timestamp_ms"],
+                    "chunk_index": None,
+                    "is_overlapped": False
+                })
+
+        return chat_segments
+
+
+    # 전체 텍스트 파일 저장 (storage/meetings/{meeting_id}/summaries/full_text.txt)
+    @staticmethod
+    def save_full_text(meeting_id: str, full_text: str):
+        summary_dir = f"storage/meetings/{meeting_id}/summaries"
+        os.makedirs(summary_dir, exist_ok = True)
+
+        file_path = os.path.join(summary_dir, "full_text.txt")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(full_text)
+
+        logger.info(f"Full text 저장 완료: {file_path}")
+
+
     # 겹치는 구간 감지
     @staticmethod
     def _detect_overlaps(segments: List[Dict]) -> List[Dict]:
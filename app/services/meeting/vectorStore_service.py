@@ -1,9 +1,14 @@
+import re
+import threading
+from collections import OrderedDict
+import chromadb
 from langchain_chroma import Chroma
 from langchain_core.documents import Document
 from app.core.db import SessionLocal
 from app.config import settings
 from app.services.meeting.embedding_service import EmbeddingService
-from typing import List, Dict, Optional
+from app.services.meeting.keyword_index import KeywordIndex
+from typing import Iterable, List, Dict, Optional, Tuple
 from app.core.logger import setup_logger
 from app.core.timezone import format_datetime, timestamp_to_datetime
 from app.core.schemas import Meeting
@@ -13,79 +18,324 @@ logger = setup_logger(__name__)
 
 class VectorStoreService:
     """ChromaDB 벡터 저장소 서비스"""
+
+    # 프로세스 전체에서 공유하는 persistent client (경로별 1개)
+    # + collection 핸들 LRU (챗봇 질의/파이프라인마다 client·SQLite를 새로 열지 않음)
+    _clients: Dict[str, "chromadb.ClientAPI"] = {}
+    _collections: "OrderedDict[Tuple[str, str], Chroma]" = OrderedDict()
+    _lock = threading.Lock()
+
+    # 모든 회의 segment를 담는 단일 collection (meeting_id / chat_room_id 메타데이터로 필터)
+    SEGMENT_INDEX = "segments_index"
+    LEGACY_SEGMENT_PREFIX = "segments_"
+
+    # meeting_id → chat_room_id (회의 생성 시 정해지고 바뀌지 않음)
+    _chat_rooms: Dict[str, Optional[str]] = {}
+
+    # keyword index를 segment index와 맞춰 본 범위 ("meeting:{id}" / "group:{id}", 프로세스당 1회)
+    _keyword_synced: set = set()
     
     def __init__(self):
         """ChromaDB 초기화"""
+        self.embedding_backend, self.embedding_model = EmbeddingService.resolve()
         self.embedding_function = EmbeddingService.get_instance()
         self.persist_directory = str(settings.VECTORSTORE_DIR / "meetings")
-        logger.info(f"VectorStore 초기화: {self.persist_directory}")
+        logger.info(
+            f"VectorStore 초기화: {self.persist_directory} "
+            f"({self.embedding_backend}: {self.embedding_model})"
+        )
+
+    def _collection_name(self, base: str) -> str:
+        """
+        임베딩 모델별 collection 이름 (차원이 다른 벡터가 섞이지 않게)
+
+        openai backend는 기존 이름 그대로, local은 '{base}__{모델}'
+        """
+        if self.embedding_backend == "openai":
+            return base
+
+        slug = re.sub(r"[^a-zA-Z0-9]+", "-", self.embedding_model.split("/")[-1]).strip("-")
+        return f"{base}__{slug[:48]}"
+
+    def get_client(self) -> "chromadb.ClientAPI":
+        return self.client_for(self.persist_directory)
+
+    @classmethod
+    def client_for(cls, persist_directory: str) -> "chromadb.ClientAPI":
+        """경로별 공용 client (다른 서비스의 collection을 읽을 때도 사용)"""
+        with cls._lock:
+            return cls._client_for_locked(persist_directory)
+
+    @classmethod
+    def _client_for_locked(cls, persist_directory: str) -> "chromadb.ClientAPI":
+        client = cls._clients.get(persist_directory)
+        if client is None:
+            client = chromadb.PersistentClient(path=persist_directory)
+            cls._clients[persist_directory] = client
+            logger.info(f"Chroma client 생성: {persist_directory}")
+        return client
+
+    def _get_collection(self, collection_name: str, metadata: Dict) -> Chroma:
+        """
+        캐시된 collection 핸들 (없으면 생성, 최대 개수 초과 시 오래 안 쓴 것부터 제거)
+
+        collection_name은 모델별 이름으로 바꾸고, metadata에 만든 임베딩 모델을 기록한다
+        """
+        collection_name = self._collection_name(collection_name)
+        metadata = {**metadata, **EmbeddingService.collection_metadata()}
+        key = (self.persist_directory, collection_name)
+
+        with self._lock:
+            vectorstore = self._collections.get(key)
+            if vectorstore is not None:
+                self._collections.move_to_end(key)
+                return vectorstore
+
+            vectorstore = Chroma(
+                client=self._client_for_locked(self.persist_directory),
+                collection_name=collection_name,
+                embedding_function=self.embedding_function,
+                collection_metadata=metadata
+            )
+
+            recorded = (vectorstore._collection.metadata or {}).get("embedding_model")
+            if recorded and recorded != self.embedding_model:
+                raise ValueError(
+                    f"collection {collection_name}은 {recorded}로 만든 collection "
+                    f"(현재 임베딩 모델: {self.embedding_model})"
+                )
+
+            self._collections[key] = vectorstore
+
+            while len(self._collections) > max(1, settings.VECTORSTORE_COLLECTION_CACHE_SIZE):
+                evicted, _ = self._collections.popitem(last=False)
+                logger.debug(f"Chroma collection 핸들 제거 (LRU): {evicted[1]}")
+
+            return vectorstore
     
-    # ===== Segment 벡터 저장소 (회의별) =====
-    def get_segments_vectorstore(self, meeting_id: str) -> Chroma:
+    # ===== Segment 벡터 저장소 (전체 회의 단일 index) =====
+    def get_segments_vectorstore(self) -> Chroma:
         """
-        회의별 segment 벡터저장소 가져오기
+        segment 벡터저장소 가져오기
         
-        Collection: segments_{meeting_id}
+        Collection: segments_index (metadata: meeting_id, chat_room_id)
+                    local 임베딩이면 segments_index__{모델}
         경로: storage/vectorstore/
+        이전 회의별 collection(segments_{meeting_id})은 migrate_segment_index.py로 옮긴다
         """
-        collection_name = f"segments_{meeting_id}"
-        
-        logger.debug(f"Getting vectorstore: {collection_name}")
-
-        vectorstore = Chroma(
-            collection_name=collection_name,
-            embedding_function=self.embedding_function,
-            persist_directory=self.persist_directory,
-            collection_metadata={
-                "meeting_id": meeting_id,
-                "type": "segments"
-            }
+        return self._get_collection(
+            self.SEGMENT_INDEX,
+            {"type": "segments"}
         )
-        return vectorstore
+
+    @classmethod
+    def get_chat_room_id(cls, meeting_id: str) -> Optional[str]:
+        if meeting_id not in cls._chat_rooms:
+            db = SessionLocal()
+            try:
+                meeting = db.query(Meeting).filter(
+                    Meeting.meeting_id == meeting_id
+                ).first()
+            finally:
+                db.close()
+
+            if not meeting:
+                return None
+            cls._chat_rooms[meeting_id] = meeting.chat_room_id
+
+        return cls._chat_rooms[meeting_id]
     
     def add_segments_batch(
         self,
         meeting_id: str,
         segments: List[Dict]
     ):
-        """배치로 segment 추가"""
+        """
+        배치로 segment 추가 (회의 종료 후 최종 전사본)
+
+        회의 중 실시간 색인된 segment는 segment_id 기준으로 덮어쓰고,
+        최종 전사본에서 빠진 segment(겹침 제거/무의미 텍스트)는 삭제한다.
+        """
         try:
-            vectorstore = self.get_segments_vectorstore(meeting_id)
+            changed = self.upsert_segments(meeting_id, segments, prune=True)
+            logger.info(
+                f"ChromaDB segment 동기화: {len(segments)}개 중 {changed}개 임베딩 추가/갱신"
+            )
 
-            documents = []
-            ids = []
-            
-            for seg in segments:
-                doc = Document(
-                    page_content=seg["text"],
-                    metadata={
-                        "meeting_id": meeting_id,
-                        "segment_id": seg["segment_id"],
-                        "user_id": seg["user_id"],
-                        "speaker_name": seg["speaker_name"],
-                        "absolute_start_ms": seg["absolute_start_ms"],
-                        "absolute_end_ms": seg["absolute_end_ms"],
-                        "confidence": seg["confidence"],
-                        "timestamp": format_datetime(
-                            timestamp_to_datetime(seg["absolute_start_ms"]),
-                            "%Y-%m-%d %H:%M:%S"
-                        )
-                    }
-                )
-                documents.append(doc)
-                ids.append(seg["segment_id"])
+        except Exception as e:
+            logger.error(f"Segment 추가 실패: {e}", exc_info=True)
+            raise
+
+    def upsert_segments(
+        self,
+        meeting_id: str,
+        segments: List[Dict],
+        prune: bool = False
+    ) -> int:
+        """
+        segment_id 기준 upsert (저장된 텍스트와 같으면 임베딩 생략)
 
-            # 배치 추가
+        Args:
+            prune: True면 segments에 없는 기존 항목 삭제
+
+        Returns:
+            새로 임베딩한 segment 수
+        """
+        vectorstore = self.get_segments_vectorstore()
+        chat_room_id = self.get_chat_room_id(meeting_id)
+
+        # 같은 segment_id가 여러 번 오면 마지막(보정된) 텍스트 사용
+        latest = {seg["segment_id"]: seg for seg in segments}
+
+        unchanged = set()
+        if latest:
+            existing = vectorstore.get(ids=list(latest), include=["documents"])
+            unchanged = {
+                segment_id
+                for segment_id, text in zip(existing["ids"], existing["documents"])
+                if text == latest[segment_id]["text"]
+            }
+
+        changed = [seg for segment_id, seg in latest.items() if segment_id not in unchanged]
+        if changed:
             vectorstore.add_documents(
-                documents=documents,
-                ids=ids
+                documents=[
+                    self._segment_document(meeting_id, seg, chat_room_id)
+                    for seg in changed
+                ],
+                ids=[seg["segment_id"] for seg in changed]
+            )
+            self._update_keyword_index(KeywordIndex.upsert, meeting_id, chat_room_id, changed)
+
+        if prune:
+            stored = vectorstore.get(where={"meeting_id": meeting_id}, include=[])["ids"]
+            stale = set(stored) - set(latest)
+            if stale:
+                vectorstore.delete(ids=list(stale))
+                self._update_keyword_index(KeywordIndex.delete, stale)
+                logger.info(f"ChromaDB에서 최종 전사본에 없는 segment {len(stale)}개 삭제")
+
+        return len(changed)
+
+    def delete_segments(self, segment_ids: Iterable[str]):
+        """segment_id로 벡터 / keyword index에서 삭제"""
+        segment_ids = list(segment_ids)
+        if not segment_ids:
+            return
+
+        self.get_segments_vectorstore().delete(ids=segment_ids)
+        self._update_keyword_index(KeywordIndex.delete, segment_ids)
+
+    @staticmethod
+    def _segment_document(meeting_id: str, seg: Dict, chat_room_id: Optional[str] = None) -> Document:
+        metadata = {
+            "meeting_id": meeting_id,
+            "segment_id": seg["segment_id"],
+            "user_id": seg["user_id"],
+            "speaker_name": seg["speaker_name"],
+            "absolute_start_ms": seg["absolute_start_ms"],
+            "absolute_end_ms": seg["absolute_end_ms"],
+            "confidence": seg["confidence"],
+            "timestamp": format_datetime(
+                timestamp_to_datetime(seg["absolute_start_ms"]),
+                "%Y-%m-%d %H:%M:%S"
             )
+        }
+        if chat_room_id:
+            metadata["chat_room_id"] = chat_room_id
 
-            logger.info(f"ChromaDB에 {len(documents)}개 segment 임베딩 추가")
+        return Document(page_content=seg["text"], metadata=metadata)
 
+    # ===== Keyword index (BM25, hybrid 검색) =====
+    @classmethod
+    def _update_keyword_index(cls, update_fn, *args):
+        """keyword index 갱신 실패는 벡터 색인을 막지 않음 (다음 검색 때 다시 맞춤)"""
+        if not settings.HYBRID_SEARCH_ENABLED:
+            return
+        try:
+            update_fn(*args)
         except Exception as e:
-            logger.error(f"Segment 추가 실패: {e}", exc_info=True)
-            raise
+            logger.warning(f"[KeywordIndex] 갱신 실패: {e}")
+            cls._keyword_synced.clear()
+
+    def _ensure_keyword_index(self, vectorstore: Chroma, where: Dict, scope: str, **scope_filter):
+        """
+        segment index에는 있고 keyword index에는 없는 segment 색인
+
+        (hybrid 검색 이전에 색인된 회의, 갱신 실패분) 범위별로 프로세스당 1회
+        """
+        if scope in self._keyword_synced:
+            return
+
+        stored = set(vectorstore.get(where=where, include=[])["ids"])
+        missing = sorted(stored - KeywordIndex.segment_ids(**scope_filter))
+
+        for start in range(0, len(missing), 500):
+            page = vectorstore.get(
+                ids=missing[start:start + 500],
+                include=["documents", "metadatas"]
+            )
+
+            by_meeting: Dict[Tuple[str, Optional[str]], List[Dict]] = {}
+            for segment_id, text, metadata in zip(page["ids"], page["documents"], page["metadatas"]):
+                metadata = metadata or {}
+                key = (metadata.get("meeting_id"), metadata.get("chat_room_id"))
+                by_meeting.setdefault(key, []).append({"segment_id": segment_id, "text": text or ""})
+
+            for (meeting_id, chat_room_id), segments in by_meeting.items():
+                KeywordIndex.upsert(meeting_id, chat_room_id, segments)
+
+        if missing:
+            logger.info(f"[KeywordIndex] {scope}: segment {len(missing)}개 색인")
+        self._keyword_synced.add(scope)
+
+    def _hybrid_search(
+        self,
+        query: str,
+        k: int,
+        where: Dict,
+        scope: str,
+        **scope_filter
+    ) -> List[Document]:
+        """
+        벡터 검색 + BM25 검색 결과를 reciprocal rank fusion으로 합침
+
+        각각 HYBRID_CANDIDATES개 후보 → score = Σ 1 / (HYBRID_RRF_K + 순위)
+        이름, 날짜, "API 명세" 같은 정확한 용어는 BM25가, 바꿔 말한 표현은 벡터가 찾는다
+        """
+        vectorstore = self.get_segments_vectorstore()
+        candidates = max(k, settings.HYBRID_CANDIDATES)
+
+        vector_results = vectorstore.similarity_search(query=query, k=candidates, filter=where)
+
+        try:
+            self._ensure_keyword_index(vectorstore, where, scope, **scope_filter)
+            keyword_results = KeywordIndex.search(query, candidates, **scope_filter)
+        except Exception as e:
+            logger.warning(f"[KeywordIndex] 검색 실패, 벡터 검색 결과만 사용: {e}")
+            return vector_results[:k]
+
+        docs: Dict[str, Document] = {}
+        scores: Dict[str, float] = {}
+
+        for rank, doc in enumerate(vector_results, 1):
+            segment_id = doc.metadata.get("segment_id") or doc.id
+            docs[segment_id] = doc
+            scores[segment_id] = scores.get(segment_id, 0.0) + 1 / (settings.HYBRID_RRF_K + rank)
+
+        for rank, (segment_id, _) in enumerate(keyword_results, 1):
+            scores[segment_id] = scores.get(segment_id, 0.0) + 1 / (settings.HYBRID_RRF_K + rank)
+
+        top = sorted(scores, key=scores.get, reverse=True)[:k]
+
+        # BM25에서만 나온 segment는 본문/메타데이터를 segment index에서 가져옴
+        keyword_only = [segment_id for segment_id in top if segment_id not in docs]
+        if keyword_only:
+            page = vectorstore.get(ids=keyword_only, include=["documents", "metadatas"])
+            for segment_id, text, metadata in zip(page["ids"], page["documents"], page["metadatas"]):
+                docs[segment_id] = Document(page_content=text, metadata=metadata or {}, id=segment_id)
+
+        return [docs[segment_id] for segment_id in top if segment_id in docs]
 
     def search_segments(
         self,
@@ -94,18 +344,29 @@ class VectorStoreService:
         k: int = 5,
         filter_dict: Optional[Dict] = None
     ) -> List[Document]:
-        """회의 내 segment 검색"""
+        """
+        회의 내 segment 검색
+
+        HYBRID_SEARCH_ENABLED면 벡터 + BM25 hybrid (filter_dict가 있으면 벡터 검색만)
+        """
         try:
-            vectorstore = self.get_segments_vectorstore(meeting_id)
+            vectorstore = self.get_segments_vectorstore()
             
             if filter_dict:
-                results = vectorstore.similarity_search(
-                    query=query,
-                    k=k,
-                    filter=filter_dict
+                where = {"$and": [
+                    {"meeting_id": meeting_id},
+                    *({key: value} for key, value in filter_dict.items())
+                ]}
+                results = vectorstore.similarity_search(query=query, k=k, filter=where)
+            elif settings.HYBRID_SEARCH_ENABLED:
+                results = self._hybrid_search(
+                    query, k, {"meeting_id": meeting_id},
+                    f"meeting:{meeting_id}", meeting_id=meeting_id
                 )
             else:
-                results = vectorstore.similarity_search(query=query, k=k)
+                results = vectorstore.similarity_search(
+                    query=query, k=k, filter={"meeting_id": meeting_id}
+                )
             
             logger.info(f"Segment 검색 완료: {len(results)}개 결과")
             return results
@@ -123,60 +384,34 @@ class VectorStoreService:
     ) -> List[Document]:
         """
         chat_room_id(groupId)로 여러 회의 검색
-        
-        1. SQLite에서 해당 groupId의 모든 meeting_id 조회
-        2. 각 meeting_id의 vectorstore에서 검색
-        3. 결과 병합 및 relevance score 기준 정렬
+
+        segment index에서 chat_room_id 필터로 한 번에 검색 (회의 수와 무관하게 1회)
+        HYBRID_SEARCH_ENABLED면 그룹 범위 BM25와 합침
         """
         try:
             logger.info(f"[VectorStore] Group 검색 : {group_id}")
 
-            # 1. SQLite에서 해당 groupId의 모든 meeting_id 조회
-            db = SessionLocal()
-            meetings = db.query(Meeting).filter(
-                Meeting.chat_room_id == group_id
-            ).all()
-            db.close()
+            if settings.HYBRID_SEARCH_ENABLED:
+                results = self._hybrid_search(
+                    query, k, {"chat_room_id": group_id},
+                    f"group:{group_id}", chat_room_id=group_id
+                )
+            else:
+                vectorstore = self.get_segments_vectorstore()
+                results = vectorstore.similarity_search(
+                    query=query,
+                    k=k,
+                    filter={"chat_room_id": group_id}
+                )
 
-            if not meetings:
-                logger.warning(f"Group {group_id}에 해당하는 회의가 없습니다.")
-                return []
-            
-            meeting_ids = [m.meeting_id for m in meetings]
-            logger.info(f"발견된 회의 : {len(meeting_ids)}개 - {meeting_ids}")
-
-            # 2. 각 meeting의 vectorstore에서 검색
-            all_results = []
-            for meeting_id in meeting_ids:
-                try:
-                    vectorStore = self.get_segments_vectorstore(meeting_id)
-                    results = vectorStore.similarity_search_with_score(
-                        query=query,
-                        k=k
-                    )
-
-                    for doc, score in results:
-                        all_results.append((doc, score, meeting_id))
-                except Exception as e:
-                    logger.warning(f"회의 {meeting_id} 검색 실패 : {e}")
-                    continue
-
-            if not all_results:
-                logger.warning("모든 회의에서 검색 결과 없음")
+            if not results:
+                logger.warning(f"Group {group_id}에서 검색 결과 없음")
                 return []
-            
-            # 3. relevance score 기준 정렬 (낮을수록 유사)
-            all_results.sort(key=lambda x: x[1])
 
-            # 4. 상위 k개 반환
-            top_results = all_results[:k]
+            meeting_count = len({doc.metadata.get("meeting_id") for doc in results})
+            logger.info(f"검색 완료: {len(results)}개 반환 (회의 {meeting_count}개)")
 
-            logger.info(
-                f"검색 완료: {len(all_results)}개 중 상위 {len(top_results)}개 반환"
-            )
-
-            # Documents 반환
-            return [doc for doc, score, meeting_id in top_results]
+            return results
 
         except Exception as e:
             logger.error(f"Group 검색 실패 : {e}", exc_info=True)
@@ -189,16 +424,13 @@ class VectorStoreService:
         """
         전체 요약본 벡터 저장소
         
-        Collection: summaries_global
+        Collection: summaries_global (local 임베딩이면 summaries_global__{모델})
         경로: storage/vectorstore/
         """
-        vectorstore = Chroma(
-            collection_name="summaries_global",
-            embedding_function=self.embedding_function,
-            persist_directory=self.persist_directory,
-            collection_metadata={"type": "global_summaries"}
+        return self._get_collection(
+            "summaries_global",
+            {"type": "global_summaries"}
         )
-        return vectorstore
     
     def add_summary(
         self,
@@ -272,15 +504,12 @@ class VectorStoreService:
             # 2. Global summaries vectorstore에서 검색
             vectorstore = self.get_summaries_vectorstore()
             
-            # 3. meeting_id 필터 적용
-            results = vectorstore.similarity_search(
+            # 3. meeting_id 필터 적용 (필터 안에서 검색하므로 k개만)
+            return vectorstore.similarity_search(
                 query=query,
-                k=k * len(meeting_ids),
+                k=k,
                 filter={"meeting_id": {"$in": meeting_ids}}
             )
-            
-            # 상위 k개만 반환
-            return results[:k]
 
         except Exception as e:
             logger.error(f"Group 요약 검색 실패: {e}", exc_info=True)
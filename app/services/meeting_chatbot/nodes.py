@@ -1,4 +1,5 @@
 from langchain_core.prompts import ChatPromptTemplate
+from app.config import settings
 from app.core.logger import setup_logger
 from app.core.db import SessionLocal
 from app.core.schemas import Meeting
@@ -33,10 +34,10 @@ async def search_segments(state, vector_store):
         # 우선순위 : meeting_id > group_id > 전체 검색
         if meeting_id:
             logger.info(f"특정 회의 검색: {meeting_id}")
-            results = vector_store.search_segments(meeting_id, query, k=5)
+            results = vector_store.search_segments(meeting_id, query, k=settings.MEETING_CHATBOT_SEARCH_K)
         elif group_id:
             logger.info(f"그룹 회의 검색: {group_id}")
-            results = vector_store.search_by_group_id(group_id, query, k=5)
+            results = vector_store.search_by_group_id(group_id, query, k=settings.MEETING_CHATBOT_SEARCH_K)
         else:
             logger.info("전체 회의 검색")
             results = vector_store.search_summaries(query, k=3)
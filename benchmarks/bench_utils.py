@@ -0,0 +1,21 @@
+# benchmarks/bench_utils.py
+# 벤치마크 공용 : 프로젝트 루트 import 경로 + 시간 측정
+import sys
+import time
+from pathlib import Path
+
+CURRENT_FILE = Path(__file__).resolve()
+ROOT_DIR = CURRENT_FILE.parents[1]   # .../MumulMumul
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+
+def timed(fn, *args, repeat: int = 3):
+    """repeat번 실행 중 가장 빠른 시간(초)과 마지막 결과"""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
@@ -0,0 +1,139 @@
+# benchmarks/overlap_benchmark.py
+# 겹침 감지 벤치마크 : python benchmarks/overlap_benchmark.py
+import logging
+import random
+
+from bench_utils import timed
+from app.services.meeting.overlap_handler import OverlapHandler
+
+
+def make_meeting(
+    hours: float = 3.0,
+    speakers: int = 20,
+    chat_per_minute: float = 6.0,
+    seed: int = 0
+):
+    """
+    합성 회의 생성
+
+    - 화자마다 발화(2~15초) / 침묵(5~120초) 반복
+    - 채팅은 회의 전체에 균등 분포
+    """
+    rng = random.Random(seed)
+    duration_ms = int(hours * 3600 * 1000)
+    segments = []
+
+    for user_id in range(speakers):
+        t = rng.randint(0, 60_000)
+        idx = 0
+        while t < duration_ms:
+            length = rng.randint(2_000, 15_000)
+            segments.append({
+                "type": "voice",
+                "segment_id": f"seg_{user_id}_{idx}",
+                "user_id": user_id,
+                "speaker_name": f"user{user_id}",
+                "text": "...",
+                "confidence": rng.random(),
+                "start_time_ms": t,
+                "end_time_ms": t + length,
+                "absolute_start_ms": t,
+                "absolute_end_ms": t + length
+            })
+            t += length + rng.randint(5_000, 120_000)
+            idx += 1
+
+    for idx in range(int(hours * 60 * chat_per_minute)):
+        t = rng.randint(0, duration_ms)
+        segments.append({
+            "type": "chat",
+            "segment_id": f"chat_{idx}",
+            "user_id": rng.randrange(speakers),
+            "speaker_name": "chat",
+            "text": "...",
+            "confidence": 1.0,
+            "start_time_ms": t,
+            "end_time_ms": t,
+            "absolute_start_ms": t,
+            "absolute_end_ms": t
+        })
+
+    segments.sort(key=lambda s: s["start_time_ms"])
+    return segments
+
+
+def legacy_detect(segments):
+    """이전 구현 (인접 음성 쌍 + 음성×채팅 전체 비교)"""
+    voice = [s for s in segments if s["type"] == "voice"]
+    chat = [s for s in segments if s["type"] == "chat"]
+
+    voice_voice = []
+    for current, next_seg in zip(voice, voice[1:]):
+        if current["user_id"] != next_seg["user_id"]:
+            overlap = (
+                min(current["absolute_end_ms"], next_seg["absolute_end_ms"])
+                - max(current["absolute_start_ms"], next_seg["absolute_start_ms"])
+            )
+            if overlap > 0:
+                voice_voice.append((current["segment_id"], next_seg["segment_id"]))
+
+    voice_chat = []
+    for v in voice:
+        for c in chat:
+            if v["absolute_start_ms"] <= c["absolute_start_ms"] <= v["absolute_end_ms"]:
+                voice_chat.append((v["segment_id"], c["segment_id"]))
+
+    return voice_voice, voice_chat
+
+
+def brute_force_voice_pairs(segments):
+    """정답 : 모든 음성 쌍 비교"""
+    voice = [s for s in segments if s["type"] == "voice"]
+    pairs = set()
+    for i, a in enumerate(voice):
+        for b in voice[i + 1:]:
+            if a["user_id"] == b["user_id"]:
+                continue
+            overlap = (
+                min(a["absolute_end_ms"], b["absolute_end_ms"])
+                - max(a["absolute_start_ms"], b["absolute_start_ms"])
+            )
+            if overlap > 0:
+                pairs.add(frozenset((a["segment_id"], b["segment_id"])))
+    return pairs
+
+
+if __name__ == "__main__":
+    logging.disable(logging.INFO)
+
+    # 1. 정확성 : 짧은 회의에서 전체 비교와 일치하는지
+    sample = make_meeting(hours=0.5, speakers=20, seed=1)
+    found = OverlapHandler.detect_all_overlaps(sample)
+    sweep_pairs = {
+        frozenset((o["segment1_id"], o["segment2_id"])) for o in found["voice_voice"]
+    }
+    expected = brute_force_voice_pairs(sample)
+    legacy_vv, legacy_vc = legacy_detect(sample)
+
+    assert sweep_pairs == expected, "음성-음성 겹침 불일치"
+    assert len(found["voice_chat"]) == len(legacy_vc), "음성-채팅 겹침 불일치"
+    print(
+        f"[정확성] 음성-음성 {len(expected)}쌍 일치 "
+        f"(이전 구현은 인접 쌍만 {len(legacy_vv)}쌍)"
+    )
+
+    # 2. 성능 : 3시간, 20명 회의
+    for chat_per_minute in (6, 60):
+        meeting = make_meeting(hours=3.0, speakers=20, chat_per_minute=chat_per_minute)
+        voice_count = sum(1 for s in meeting if s["type"] == "voice")
+        chat_count = len(meeting) - voice_count
+
+        legacy_time, _ = timed(legacy_detect, meeting, repeat=1)
+        sweep_time, found = timed(OverlapHandler.detect_all_overlaps, meeting)
+
+        print(
+            f"[3시간 / 20명] 음성 {voice_count}개, 채팅 {chat_count}개\n"
+            f"  이전 구현 : {legacy_time * 1000:8.1f} ms\n"
+            f"  sweep line: {sweep_time * 1000:8.1f} ms "
+            f"(음성-음성 {len(found['voice_voice'])}쌍, 음성-채팅 {len(found['voice_chat'])}쌍)"
+        )
@@ -0,0 +1,118 @@
+# benchmarks/text_cleaning_benchmark.py
+# 규칙 기반 정리 벤치마크 : python benchmarks/text_cleaning_benchmark.py
+import logging
+import random
+import re
+
+from bench_utils import timed
+from app.services.meeting.text_processor import TextProcessor
+
+
+WORDS = [
+    "네", "아니요", "그럼", "다음", "안건으로", "넘어가죠", "이번", "스프린트",
+    "일정은", "금요일까지", "배포", "테스트", "확인했습니다", "감사합니다",
+    "데이터베이스", "API", "3시", "10분", "좋습니다", "질문", "있으신가요",
+]
+NOISE = [
+    "음", "음음", "어", "어어어", "그", "저", "아", "이", "으으",
+    "ㅋㅋㅋ", "ㅎㅎ", "ㅠㅠ", "네네네네", "맞아요요요", "!!!", "...",
+]
+
+
+def make_segments(count: int = 20_000, seed: int = 0):
+    """합성 STT segment (추임새 / 반복 / ㅋㅋ 섞인 발화)"""
+    rng = random.Random(seed)
+    segments = []
+
+    for idx in range(count):
+        tokens = []
+        for _ in range(rng.randint(1, 15)):
+            if rng.random() < 0.25:
+                tokens.append(rng.choice(NOISE))
+            else:
+                word = rng.choice(WORDS)
+                tokens.extend([word] * (3 if rng.random() < 0.05 else 1))
+        segments.append({
+            "segment_id": f"seg_{idx}",
+            "text": "  ".join(tokens) if rng.random() < 0.1 else " ".join(tokens),
+        })
+
+    return segments
+
+
+def legacy_cleaning(text: str) -> str:
+    """이전 구현 (단계별 re.sub, 추임새 패턴마다 따로)"""
+    if not text:
+        return text
+
+    text = re.sub(r'\s+', ' ', text)
+    text = text.strip()
+    text = re.sub(r'(.)\1{2,}', r'\1', text)
+
+    fillers = [
+        r'\b음+\b', r'\b어+\b', r'\b그+\b', r'\b저+\b',
+        r'\b아+\b', r'\b이+\b', r'\b으+\b'
+    ]
+    for filler in fillers:
+        text = re.sub(filler, '', text, flags=re.IGNORECASE)
+
+    text = re.sub(r'\b(\w+)(\s+\1){2,}\b', r'\1', text)
+    text = re.sub(r'[ㅋㅎㅠㅜㅡ]+', '', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+
+def legacy_is_meaningful(text: str, min_length: int = 3) -> bool:
+    if not text or len(text) < min_length:
+        return False
+    if all(len(w) <= 1 for w in text.split()):
+        return False
+    if re.match(r'^[\d\s\W]+$', text):
+        return False
+    return True
+
+
+def legacy_clean_segments(segments):
+    result = []
+    for seg in segments:
+        cleaned = legacy_cleaning(seg["text"])
+        if legacy_is_meaningful(cleaned):
+            seg_copy = seg.copy()
+            seg_copy["text"] = cleaned
+            result.append(seg_copy)
+    return result
+
+
+def per_segment_clean(segments):
+    """새 구현을 segment마다 호출"""
+    result = []
+    for seg in segments:
+        cleaned = TextProcessor.rule_based_cleaning(seg["text"])
+        if TextProcessor.is_meaningful_text(cleaned):
+            seg_copy = seg.copy()
+            seg_copy["text"] = cleaned
+            result.append(seg_copy)
+    return result
+
+
+if __name__ == "__main__":
+    logging.disable(logging.DEBUG)
+
+    segments = make_segments()
+
+    # 1. 정확성 : 이전 구현과 segment 단위로 비교
+    legacy_time, expected = timed(legacy_clean_segments, segments)
+    single_time, single = timed(per_segment_clean, segments)
+    batch_time, found = timed(TextProcessor.clean_segments, segments)
+
+    assert [s["text"] for s in found] == [s["text"] for s in expected], "정리 결과 불일치"
+    assert [s["text"] for s in single] == [s["text"] for s in expected], "정리 결과 불일치"
+    print(f"[정확성] {len(segments)}개 중 {len(found)}개 유지, 이전 구현과 일치")
+
+    # 2. 성능
+    print(
+        f"[{len(segments)}개 segment]\n"
+        f"  이전 구현      : {legacy_time * 1000:8.1f} ms\n"
+        f"  segment별 호출 : {single_time * 1000:8.1f} ms\n"
+        f"  clean_segments : {batch_time * 1000:8.1f} ms (일괄)"
+    )